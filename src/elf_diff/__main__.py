@@ -21,9 +21,18 @@
 
 from elf_diff.settings import Settings
 from elf_diff.pair_report_document import generateDocument, ValueTreeNode
-from elf_diff.plugin import Plugin, ExportPairReportPlugin, getActivePlugins
+from elf_diff.plugin import (
+    Plugin,
+    ExportPairReportPlugin,
+    getActivePlugins,
+    getRequiredDocumentParts,
+)
 from elf_diff.default_plugins import activatePlugins, listDefaultPlugins
+from elf_diff.diff_cache import closeDiffCaches
+from elf_diff.render_cache import sharedRenderCache
 from elf_diff.document_explorer import getDocumentStructureDocString
+from elf_diff.difference_check import checkDifferences
+from elf_diff.budget_check import checkBudgets
 from elf_diff.deprecated.mass_report import writeMassReport
 from elf_diff.formatted_output import SEPARATOR
 import elf_diff.error_handling as error_handling
@@ -31,10 +40,12 @@ import os
 import inspect
 import sys
 import traceback
-from typing import Optional, List
+from typing import Hashable, Optional, List
 
 RETURN_CODE_UNRECOVERABLE_ERROR = 1
 RETURN_CODE_WARNINGS_OCCURRED = 2
+RETURN_CODE_FILES_DIFFER = 3
+RETURN_CODE_BUDGET_EXCEEDED = 4
 
 # Unicode characters cause problems with encoding on Windows
 if os.name == "nt":
@@ -63,13 +74,27 @@ def exportDocument(settings: Settings) -> None:
     if len(plugins) == 0:
         return
 
-    document: ValueTreeNode = generateDocument(settings)
+    document: ValueTreeNode = generateDocument(
+        settings, document_parts=getRequiredDocumentParts(plugins)
+    )
     assert document
 
-    for plugin in plugins:
-        if isinstance(plugin, ExportPairReportPlugin):
+    export_plugins: List[ExportPairReportPlugin] = [
+        plugin for plugin in plugins if isinstance(plugin, ExportPairReportPlugin)
+    ]
+
+    # HTML fragments are only stored if several plugins render HTML
+    render_keys: List[Hashable] = []
+    for plugin in export_plugins:
+        render_key: Optional[Hashable] = plugin.getHTMLRenderKey()
+        if render_key is not None:
+            render_keys.append(render_key)
+    with sharedRenderCache(render_keys):
+        for plugin in export_plugins:
             plugin.export(document)
 
+    closeDiffCaches()
+
 
 def errorOutput(
     settings: Settings, exception: Exception, force_stacktrace: bool = False
@@ -102,8 +127,48 @@ def processChoices(settings: Settings) -> None:
         print("\n%s" % listDefaultPlugins())
 
 
+def processBinaryPair(settings: Settings) -> int:
+    """Check budgets and generate a report or check the binaries. Return the resulting return code."""
+    budget_exceeded = False
+    if len(settings.budgets) > 0:
+        budget_exceeded = checkBudgets(settings)
+
+    files_differ = False
+    if settings.check:
+        files_differ = checkDifferences(settings)
+    elif not settings.check_budgets:
+        exportDocument(settings)
+
+    if budget_exceeded:
+        return RETURN_CODE_BUDGET_EXCEEDED
+    if files_differ:
+        return RETURN_CODE_FILES_DIFFER
+    return 0
+
+
+def processBinaries(settings: Settings) -> int:
+    """Generate reports or check the binaries. Return the resulting return code."""
+    report_generated = False
+    return_code = 0
+
+    if settings.mass_report or len(settings.mass_report_members) > 0:
+        writeMassReport(settings)
+        report_generated = True
+    elif settings.isFirmwareBinaryDefined():
+        return_code = processBinaryPair(settings)
+        report_generated = True
+
+    if settings.driver_template_file:
+        settings.writeParameterTemplateFile(
+            settings.driver_template_file, output_actual_values=report_generated
+        )
+
+    return return_code
+
+
 def main():
     settings: Optional[Settings] = None
+    return_code = 0
     try:
         frame = inspect.currentframe()
         if frame is None:
@@ -114,22 +179,10 @@ def main():
 
         processChoices(settings)
 
-        report_generated = False
-
         if settings.dump_document_structure:
             print("\n%s" % getDocumentStructureDocString(settings))
 
-        if settings.mass_report or len(settings.mass_report_members) > 0:
-            writeMassReport(settings)
-            report_generated = True
-        elif settings.isFirmwareBinaryDefined():
-            exportDocument(settings)
-            report_generated = True
-
-        if settings.driver_template_file:
-            settings.writeParameterTemplateFile(
-                settings.driver_template_file, output_actual_values=report_generated
-            )
+        return_code = processBinaries(settings)
     except Exception as exception:
         if settings is not None:
             errorOutput(settings, exception, force_stacktrace=True)
@@ -141,6 +194,11 @@ def main():
 
     if error_handling.WARNINGS_OCCURRED:
         print(f"{WARNING} Watch out! Warnings occurred.")
+
+    if return_code != 0:
+        sys.exit(return_code)
+
+    if error_handling.WARNINGS_OCCURRED:
         sys.exit(RETURN_CODE_WARNINGS_OCCURRED)
 
 
@@ -21,7 +21,6 @@
 import inspect
 import os
 import re
-from distutils import dir_util
 from typing import List, Set
 
 
@@ -60,11 +59,6 @@ def getRelpath(html_output_file: str, target_dir: str) -> str:
     return os.path.relpath(target_dir, html_dirname)
 
 
-def recursiveCopy(source_dir: str, target_dir: str) -> None:
-    """Copy the content of a source directory recursively (including subdirectories) to a target directory"""
-    dir_util.copy_tree(source_dir, target_dir)
-
-
 def isNameToken(str_: str) -> bool:
     """Check it a token is a name token in a programming language sense"""
     return re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", str_) is not None
@@ -43,8 +43,12 @@ class Binary(object):
         symbol_exclusion_regex: Optional[str] = None,
         mangling: Optional[Mangling] = None,
         source_prefix: Optional[List[str]] = None,
+        gather_instructions: bool = True,
+        symbol_sizes: Optional[SymbolSizes] = None,
     ):
-        """Init binary object."""
+        """Init binary object. If gather_instructions is False, the expensive
+        disassembly of the binary is deferred until gatherInstructions() is called.
+        Symbol sizes that were already determined for the file can be passed in."""
         self._settings: Settings = settings
 
         self.filename: str = filename
@@ -58,7 +62,7 @@ class Binary(object):
 
         self._source_prefix: Optional[List[str]] = source_prefix
 
-        self.symbol_sizes = SymbolSizes(filename, settings.binutils)
+        self.symbol_sizes = symbol_sizes or SymbolSizes(filename, settings.binutils)
 
         if self.symbol_sizes is None:
             warning(
@@ -74,8 +78,10 @@ class Binary(object):
         self.source_files: Dict[int, SourceFile] = {}
         self.symbols: Dict[str, Symbol] = {}
         self.num_symbols_dropped: int = 0
+        self.instructions_gathered: bool = False
+        self.instructions_available: bool = False
 
-        self._initSymbols()
+        self._initSymbols(gather_instructions)
 
     def _verifyFilename(self):
         if not self.filename:
@@ -111,15 +117,25 @@ class Binary(object):
             binutils=self._settings.binutils,
         )
 
-        self.instructions_available: bool = len(instruction_collector.symbols) > 0
+        self.instructions_gathered = True
+        self.instructions_available = len(instruction_collector.symbols) > 0
 
         if instruction_collector.n_instruction_lines == 0:
             warning(f"Unable to read assembly from binary '{self.filename}'.")
 
-    def _initSymbols(self) -> None:
+    def gatherInstructions(self) -> None:
+        """Gather the instructions of all symbols if this has been deferred"""
+        if self.instructions_gathered:
+            return
+        self._gatherSymbolInstructions()
+        for symbol in self.symbols.values():
+            symbol.initInstructions()
+
+    def _initSymbols(self, gather_instructions: bool) -> None:
         """Parse symbols from the binary"""
         self._extractSymbols()
-        self._gatherSymbolInstructions()
+        if gather_instructions:
+            self._gatherSymbolInstructions()
 
         for symbol_name_mangled in sorted(self.symbols.keys()):
             symbol = self.symbols[symbol_name_mangled]
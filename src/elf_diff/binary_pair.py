@@ -24,13 +24,34 @@ from elf_diff.binary import Mangling
 from elf_diff.auxiliary import setIntersection
 from elf_diff.symbol import Symbol
 from elf_diff.settings import Settings
+from elf_diff.symbol_sizes import SymbolSizes
 from elf_diff.binary_pair_settings import BinaryPairSettings
+from elf_diff.instruction_collector import SOURCE_CODE_START_TAG
+from elf_diff.diff_cache import DiffCache, getDiffCache
+from elf_diff.document_parts import (
+    DOCUMENT_PARTS,
+    DOCUMENT_PART_INSTRUCTIONS,
+    DOCUMENT_PART_SIMILARITIES,
+)
 
 import progressbar  # type: ignore # Make mypy ignore this module
 import sys
+import re
+import hashlib
 from difflib import get_close_matches
 from difflib import SequenceMatcher
-from typing import List, Optional
+from typing import List, Optional, Dict, Tuple, Set
+
+# Matches address references as output by objdump, e.g. '4011a6 <_Z4funci+0x10>'
+ADDRESS_REFERENCE_RE = re.compile(
+    r"(?:0x)?[0-9a-fA-F]+ <([^>+]+)((?:[+-]0x[0-9a-fA-F]+)?)>"
+)
+
+# Replaces references of a symbol to itself in a normalized instruction fingerprint
+SELF_REFERENCE_PLACEHOLDER = "."
+
+# Must be increased whenever the similarity ratio computed by similar() changes
+SIMILARITY_VERSION = 1
 
 
 def similar(a: str, b: str) -> float:
@@ -38,6 +59,39 @@ def similar(a: str, b: str) -> float:
     return SequenceMatcher(None, a, b).ratio()
 
 
+def instructionFingerprint(symbol: Symbol) -> str:
+    """Return a fingerprint of the symbol's instructions that does not depend on the
+    symbol's name or location. Source code lines are ignored and absolute addresses are
+    removed from address references. References to the symbol itself are replaced by a placeholder.
+    """
+
+    def normalizeReference(match: re.Match) -> str:
+        target: str = match.group(1)
+        if target == symbol.name_mangled:
+            target = SELF_REFERENCE_PLACEHOLDER
+        return f"<{target}{match.group(2)}>"
+
+    fingerprint = hashlib.sha1()
+    for instruction_line in symbol.instruction_lines:
+        if (instruction_line == "") or instruction_line.startswith(
+            SOURCE_CODE_START_TAG
+        ):
+            continue
+        normalized_line: str = re.sub(
+            ADDRESS_REFERENCE_RE, normalizeReference, instruction_line
+        )
+        fingerprint.update(normalized_line.encode("utf-8"))
+        fingerprint.update(b"\n")
+    return fingerprint.hexdigest()
+
+
+class RenamedPair(object):
+    def __init__(self, old_symbol: Symbol, new_symbol: Symbol):
+        """Initialize renamed pair object."""
+        self.old_symbol = old_symbol
+        self.new_symbol = new_symbol
+
+
 class SimilarityPair(object):
     def __init__(
         self,
@@ -54,71 +108,142 @@ class SimilarityPair(object):
         self.instructions_equal = self.old_symbol.instructionsEqual(self.new_symbol)
 
 
+class PairAnalysis(object):
+    """The results of analysing the symbols of a binary pair"""
+
+    def __init__(self):
+        """Initialize pair analysis object."""
+        self.persisting_symbol_names: List[str] = []
+        self.persisting_symbols_with_instruction_differences: Set[str] = set()
+        self.num_symbol_size_changes: int = 0
+        self.num_symbols_with_instruction_differences: int = 0
+        self.persisting_symbols_overall_size_old: int = 0
+        self.persisting_symbols_overall_size_new: int = 0
+        self.persisting_symbols_overall_size_difference: int = 0
+        self.num_symbols_disappeared: int = 0
+        self.num_bytes_disappeared: int = 0
+        self.num_symbols_appeared: int = 0
+        self.num_bytes_appeared: int = 0
+
+    @property
+    def persisting_symbols_assembly_differs_count(self) -> int:
+        """The number of persisting symbols whose instructions differ"""
+        return len(self.persisting_symbols_with_instruction_differences)
+
+
+def createBinary(
+    settings: Settings,
+    filename: str,
+    age: str,
+    gather_instructions: bool = True,
+    symbol_sizes: Optional[SymbolSizes] = None,
+) -> Binary:
+    """Create the old or new binary (age is one of 'old' or 'new') as configured by the settings"""
+    return Binary(
+        settings,
+        filename,
+        symbolSelectionRegex(settings, age),
+        symbolExclusionRegex(settings, age),
+        mangling=Mangling(getattr(settings, f"{age}_mangling_file")),
+        source_prefix=getattr(settings, f"{age}_source_prefix")
+        or settings.source_prefix,
+        gather_instructions=gather_instructions,
+        symbol_sizes=symbol_sizes,
+    )
+
+
+def symbolSelectionRegex(settings: Settings, age: str) -> str:
+    """Return the symbol selection regex of the old or new binary"""
+    return (
+        getattr(settings, f"symbol_selection_regex_{age}")
+        or settings.symbol_selection_regex
+    )
+
+
+def symbolExclusionRegex(settings: Settings, age: str) -> str:
+    """Return the symbol exclusion regex of the old or new binary"""
+    return (
+        getattr(settings, f"symbol_exclusion_regex_{age}")
+        or settings.symbol_exclusion_regex
+    )
+
+
+def symbolMigrated(old_binary: Binary, new_binary: Binary, symbol_name: str) -> bool:
+    """Check whether a persisting symbol moved to another source file"""
+    old_symbol = old_binary.symbols[symbol_name]
+    new_symbol = new_binary.symbols[symbol_name]
+
+    if (old_symbol.source_id is None) or (new_symbol.source_id is None):
+        return False
+
+    old_source_file_wo_prefix = old_binary.source_files[
+        old_symbol.source_id
+    ].path_wo_prefix
+    new_source_file_wo_prefix = new_binary.source_files[
+        new_symbol.source_id
+    ].path_wo_prefix
+
+    return old_source_file_wo_prefix != new_source_file_wo_prefix
+
+
 class BinaryPair(object):
-    def __init__(self, settings: Settings, pair_settings: BinaryPairSettings):
-        """Initialize binary pair object."""
+    def __init__(
+        self,
+        settings: Settings,
+        pair_settings: BinaryPairSettings,
+        document_parts: Optional[Set[str]] = None,
+    ):
+        """Initialize binary pair object. Only the information required
+        by the given document parts (default: all) is computed."""
         self.settings: Settings = settings
 
         self.pair_settings: BinaryPairSettings = pair_settings
 
-        symbol_selection_regex_old: str = (
-            self.settings.symbol_selection_regex_old
-            or self.settings.symbol_selection_regex
-        )
-        symbol_selection_regex_new: str = (
-            self.settings.symbol_selection_regex_new
-            or self.settings.symbol_selection_regex
-        )
-
-        symbol_exclusion_regex_old: str = (
-            self.settings.symbol_exclusion_regex_old
-            or self.settings.symbol_exclusion_regex
-        )
-        symbol_exclusion_regex_new: str = (
-            self.settings.symbol_exclusion_regex_new
-            or self.settings.symbol_exclusion_regex
+        self.document_parts: Set[str] = (
+            set(DOCUMENT_PARTS) if document_parts is None else set(document_parts)
         )
+        gather_instructions = DOCUMENT_PART_INSTRUCTIONS in self.document_parts
 
         print("Symbol selection regex:")
-        print(f"   old binary: '{symbol_selection_regex_old}'")
-        print(f"   new binary: '{symbol_selection_regex_new}'")
+        print(f"   old binary: '{symbolSelectionRegex(settings, 'old')}'")
+        print(f"   new binary: '{symbolSelectionRegex(settings, 'new')}'")
         print("Symbol exclusion regex:")
-        print(f"   old binary: '{symbol_exclusion_regex_old}'")
-        print(f"   new binary: '{symbol_exclusion_regex_new}'")
+        print(f"   old binary: '{symbolExclusionRegex(settings, 'old')}'")
+        print(f"   new binary: '{symbolExclusionRegex(settings, 'new')}'")
 
         print(
             f"Parsing symbols of old binary ({self.pair_settings.old_binary_filename})"
         )
-        self.old_binary = Binary(
+        self.old_binary = createBinary(
             self.settings,
             self.pair_settings.old_binary_filename,
-            symbol_selection_regex_old,
-            symbol_exclusion_regex_old,
-            mangling=Mangling(settings.old_mangling_file),
-            source_prefix=settings.old_source_prefix or settings.source_prefix,
+            "old",
+            gather_instructions=gather_instructions,
         )
         print(
             f"Parsing symbols of new binary ({self.pair_settings.new_binary_filename})"
         )
-        self.new_binary = Binary(
+        self.new_binary = createBinary(
             self.settings,
             self.pair_settings.new_binary_filename,
-            symbol_selection_regex_new,
-            symbol_exclusion_regex_new,
-            mangling=Mangling(settings.new_mangling_file),
-            source_prefix=settings.new_source_prefix or settings.source_prefix,
+            "new",
+            gather_instructions=gather_instructions,
         )
 
         self._verifyBinaryCompatibility()
 
         self._prepareSymbols()
 
-        self._computeSizeChanges()
+        self._analyseSymbols()
 
-        self.persisting_symbol_names: List[str]
+        self.renamed_symbols: List[RenamedPair] = []
+        self._determineRenamedSymbols()
 
         self.similar_symbols: List[SimilarityPair] = []
-        if not settings.skip_symbol_similarities:
+        self.similarities_computed: bool = (not settings.skip_symbol_similarities) and (
+            DOCUMENT_PART_SIMILARITIES in self.document_parts
+        )
+        if self.similarities_computed:
             self._computeSimilarities()
 
         self.debug_info_available: bool = (
@@ -163,33 +288,14 @@ class BinaryPair(object):
             f"   {len(self.persisting_symbol_names)} persisting symbol(s){migrated_symbols_info}"
         )
         print(f"   {len(self.disappeared_symbol_names)} disappeared symbol(s)")
+        print(f"   {len(self.renamed_symbols)} renamed symbol(s)")
         print(f"   {len(self.new_symbol_names)} new symbol(s)")
 
-    def _preparePersistingSymbols(self) -> None:
-        persisting_candidates = setIntersection(
-            self.old_symbol_names, self.new_symbol_names
-        )
-        if not self.settings.skip_persisting_same_size:
-            self.persisting_symbol_names = persisting_candidates
-            return
-
-        self.persisting_symbol_names = []
-        for persisting_symbol_name in persisting_candidates:
-            old_symbol = self.old_binary.symbols[persisting_symbol_name]
-            new_symbol = self.new_binary.symbols[persisting_symbol_name]
-
-            if old_symbol.size == new_symbol.size:
-                continue
-
-            self.persisting_symbol_names.append(persisting_symbol_name)
-
     def _prepareSymbols(self) -> None:
         """Prepare symbols"""
         self.old_symbol_names = set(self.old_binary.symbols.keys())
         self.new_symbol_names = set(self.new_binary.symbols.keys())
 
-        self._preparePersistingSymbols()
-
         self.disappeared_symbol_names = sorted(
             self.old_symbol_names - self.new_symbol_names
         )
@@ -197,30 +303,126 @@ class BinaryPair(object):
             self.new_symbol_names - self.old_symbol_names
         )
 
-    def _computeSizeChanges(self) -> None:
-        """Compute the size changes of symbols from old and new binary"""
-        self.analyseSymbolSizeChanges()
-        self.computeNumSymbolsDisappeared()
-        self.computeNumSymbolsAppeared()
-        self.computeNumSymbolsWithInstructionDifferences()
+    def _analyseSymbols(self) -> None:
+        """Analyse the symbols of old and new binary in a single pass"""
+        self.analysis: PairAnalysis = PairAnalysis()
+        analysis = self.analysis
+
+        persisting_candidates = setIntersection(
+            self.old_symbol_names, self.new_symbol_names
+        )
+
+        if len(persisting_candidates) > 0:
+            print("Analyzing persisting symbols...")
+            sys.stdout.flush()
+            for symbol_name in progressbar.progressbar(persisting_candidates):
+                old_symbol: Symbol = self.old_binary.symbols[symbol_name]
+                new_symbol: Symbol = self.new_binary.symbols[symbol_name]
+
+                size_difference: int = new_symbol.size - old_symbol.size
+
+                if (size_difference == 0) and self.settings.skip_persisting_same_size:
+                    continue
+
+                analysis.persisting_symbol_names.append(symbol_name)
+
+                instructions_differ: bool = not old_symbol.instructionsEqual(new_symbol)
+                if instructions_differ:
+                    analysis.persisting_symbols_with_instruction_differences.add(
+                        symbol_name
+                    )
+
+                if size_difference != 0:
+                    analysis.num_symbol_size_changes += 1
+
+                # Symbol names are equal, so Symbol.__eq__ reduces to
+                # comparing size and instructions
+                if (size_difference != 0) or instructions_differ:
+                    analysis.num_symbols_with_instruction_differences += 1
+
+                if (
+                    size_difference == 0
+                ) and self.settings.consider_equal_sized_identical:
+                    continue
+
+                analysis.persisting_symbols_overall_size_old += old_symbol.size
+                analysis.persisting_symbols_overall_size_new += new_symbol.size
+                analysis.persisting_symbols_overall_size_difference += size_difference
+
+        analysis.num_symbols_disappeared = len(self.disappeared_symbol_names)
+        analysis.num_bytes_disappeared = sum(
+            self.old_binary.symbols[symbol_name].size
+            for symbol_name in self.disappeared_symbol_names
+        )
+        analysis.num_symbols_appeared = len(self.appeared_symbol_names)
+        analysis.num_bytes_appeared = sum(
+            self.new_binary.symbols[symbol_name].size
+            for symbol_name in self.appeared_symbol_names
+        )
+
+        self.persisting_symbol_names = analysis.persisting_symbol_names
+        self.num_symbol_size_changes: int = analysis.num_symbol_size_changes
+        self.num_symbols_with_instruction_differences: int = (
+            analysis.num_symbols_with_instruction_differences
+        )
+        self.num_symbols_disappeared: int = analysis.num_symbols_disappeared
+        self.num_bytes_disappeared: int = analysis.num_bytes_disappeared
+        self.num_symbols_appeared: int = analysis.num_symbols_appeared
+        self.num_bytes_appeared: int = analysis.num_bytes_appeared
 
     def _determineMigratedSymbols(self) -> None:
         for persisting_symbol_name in self.persisting_symbol_names:
-            old_symbol = self.old_binary.symbols[persisting_symbol_name]
-            new_symbol = self.new_binary.symbols[persisting_symbol_name]
+            if symbolMigrated(self.old_binary, self.new_binary, persisting_symbol_name):
+                self.migrated_symbol_names.append(persisting_symbol_name)
+
+    def _determineRenamedSymbols(self) -> None:
+        """Find pairs of disappeared and appeared symbols that share size, type and
+        instructions and thus are most likely the result of a rename or namespace move.
+        Only symbols with instructions are considered and only unique matches are
+        reported."""
+        if (len(self.disappeared_symbol_names) == 0) or (
+            len(self.appeared_symbol_names) == 0
+        ):
+            return
 
-            if (old_symbol.source_id is None) or (new_symbol.source_id is None):
+        print("Detecting renamed symbols...")
+        sys.stdout.flush()
+
+        FingerprintKey = Tuple[str, int, str]
+
+        def fingerprintKey(symbol: Symbol) -> FingerprintKey:
+            return (instructionFingerprint(symbol), symbol.size, symbol.type_)
+
+        # Map keys to the disappeared symbols. A value of None marks ambiguous keys.
+        old_symbols_by_key: Dict[FingerprintKey, Optional[Symbol]] = {}
+        for symbol_name in self.disappeared_symbol_names:
+            old_symbol: Symbol = self.old_binary.symbols[symbol_name]
+            if not old_symbol.hasInstructions():
                 continue
+            key = fingerprintKey(old_symbol)
+            old_symbols_by_key[key] = None if key in old_symbols_by_key else old_symbol
 
-            old_source_file_wo_prefix = self.old_binary.source_files[
-                old_symbol.source_id
-            ].path_wo_prefix
-            new_source_file_wo_prefix = self.new_binary.source_files[
-                new_symbol.source_id
-            ].path_wo_prefix
+        new_symbols_by_key: Dict[FingerprintKey, Optional[Symbol]] = {}
+        for symbol_name in self.appeared_symbol_names:
+            new_symbol: Symbol = self.new_binary.symbols[symbol_name]
+            if not new_symbol.hasInstructions():
+                continue
+            key = fingerprintKey(new_symbol)
+            if key not in old_symbols_by_key:
+                continue
+            new_symbols_by_key[key] = None if key in new_symbols_by_key else new_symbol
+
+        for key, matched_new_symbol in new_symbols_by_key.items():
+            matched_old_symbol: Optional[Symbol] = old_symbols_by_key[key]
+            if (matched_old_symbol is None) or (matched_new_symbol is None):
+                continue
+            self.renamed_symbols.append(
+                RenamedPair(
+                    old_symbol=matched_old_symbol, new_symbol=matched_new_symbol
+                )
+            )
 
-            if old_source_file_wo_prefix != new_source_file_wo_prefix:
-                self.migrated_symbol_names.append(old_symbol.name_mangled)
+        self.renamed_symbols.sort(key=lambda e: e.old_symbol.name_mangled)
 
     def _computeSimilarities(self) -> None:
         """Compute the similarity rations of symbols from old and new binary"""
@@ -228,38 +430,70 @@ class BinaryPair(object):
 
     def determineSimilarSymbols(self) -> List[SimilarityPair]:
         """Find pairs of symbols from old and new binary that are similar"""
-        n_disappeared_symbol_names: int = len(self.disappeared_symbol_names)
 
-        if (n_disappeared_symbol_names == 0) or (len(self.new_symbol_names) == 0):
+        # Renamed symbols are already paired exactly. Exclude them from the
+        # expensive fuzzy matching.
+        renamed_old_symbol_names: Set[str] = {
+            e.old_symbol.name_mangled for e in self.renamed_symbols
+        }
+        renamed_new_symbol_names: Set[str] = {
+            e.new_symbol.name_mangled for e in self.renamed_symbols
+        }
+        candidate_old_symbol_names: List[str] = [
+            symbol_name
+            for symbol_name in self.disappeared_symbol_names
+            if symbol_name not in renamed_old_symbol_names
+        ]
+        candidate_new_symbol_names: List[str] = [
+            symbol_name
+            for symbol_name in self.new_symbol_names
+            if symbol_name not in renamed_new_symbol_names
+        ]
+
+        n_disappeared_symbol_names: int = len(candidate_old_symbol_names)
+
+        if (n_disappeared_symbol_names == 0) or (len(candidate_new_symbol_names) == 0):
             return []
 
         symbol_pairs: List[SimilarityPair] = []
 
         similarity_threshold = float(self.settings.similarity_threshold)
+        diff_cache: DiffCache = getDiffCache(self.settings)
 
         print("Detecting symbol similarities...")
         sys.stdout.flush()
         for i in progressbar.progressbar(range(n_disappeared_symbol_names)):
-            old_symbol_name: str = self.disappeared_symbol_names[i]
+            old_symbol_name: str = candidate_old_symbol_names[i]
             sys.stdout.flush()
 
             old_symbol: Symbol = self.old_binary.symbols[old_symbol_name]
 
             matching_symbols: List[str] = get_close_matches(
-                old_symbol_name, self.new_symbol_names, n=5, cutoff=similarity_threshold
+                old_symbol_name,
+                candidate_new_symbol_names,
+                n=5,
+                cutoff=similarity_threshold,
             )
 
             for new_symbol_name in matching_symbols:
                 new_symbol: Symbol = self.new_binary.symbols[new_symbol_name]
 
-                signature_similarity: float = similar(old_symbol_name, new_symbol_name)
+                signature_similarity: float = diff_cache.getOrCompute(
+                    f"similarity/{SIMILARITY_VERSION}",
+                    old_symbol_name,
+                    new_symbol_name,
+                    similar,
+                )
 
                 instruction_similarity: Optional[float] = None
                 if (old_symbol.instructions is not None) and (
                     new_symbol.instructions is not None
                 ):
-                    instruction_similarity = similar(
-                        old_symbol.instructions, new_symbol.instructions
+                    instruction_similarity = diff_cache.getOrCompute(
+                        f"similarity/{SIMILARITY_VERSION}",
+                        old_symbol.instructions,
+                        new_symbol.instructions,
+                        similar,
                     )
 
                 symbol_pairs.append(
@@ -285,66 +519,3 @@ class BinaryPair(object):
         )
 
         return sorted_symbol_pairs
-
-    def analyseSymbolSizeChanges(self) -> None:
-        """Determine the number of symbol size changes"""
-        self.num_symbol_size_changes: int = 0
-
-        if len(self.persisting_symbol_names) == 0:
-            return
-
-        print("Analyzing symbol size changes...")
-        sys.stdout.flush()
-        for i in progressbar.progressbar(range(len(self.persisting_symbol_names))):
-            symbol_name: str = self.persisting_symbol_names[i]
-            old_symbol: Symbol = self.old_binary.symbols[symbol_name]
-            new_symbol: Symbol = self.new_binary.symbols[symbol_name]
-            if old_symbol.size != new_symbol.size:
-                self.num_symbol_size_changes += 1
-
-    def computeNumSymbolsDisappeared(self) -> None:
-        """Determine the number of disappeared symbols"""
-        self.num_bytes_disappeared: int = 0
-        self.num_symbols_disappeared: int = len(self.disappeared_symbol_names)
-
-        if self.num_symbols_disappeared == 0:
-            return
-
-        print("Analyzing disappeared symbols...")
-        sys.stdout.flush()
-        for i in progressbar.progressbar(range(len(self.disappeared_symbol_names))):
-            symbol_name: str = self.disappeared_symbol_names[i]
-            symbol: Symbol = self.old_binary.symbols[symbol_name]
-            self.num_bytes_disappeared += symbol.size
-
-    def computeNumSymbolsAppeared(self):
-        """Determine the number of appeared symbols"""
-        self.num_bytes_appeared: int = 0
-        self.num_symbols_appeared: int = len(self.appeared_symbol_names)
-
-        if self.num_symbols_appeared == 0:
-            return
-
-        print("Analyzing appeared symbols...")
-        sys.stdout.flush()
-        for i in progressbar.progressbar(range(len(self.appeared_symbol_names))):
-            symbol_name: str = self.appeared_symbol_names[i]
-            symbol: Symbol = self.new_binary.symbols[symbol_name]
-            self.num_bytes_appeared += symbol.size
-
-    def computeNumSymbolsWithInstructionDifferences(self):
-        """Determine the number of symbols with instruction differences between new and old version"""
-        self.num_symbols_with_instruction_differences: int = 0
-
-        if len(self.persisting_symbol_names) == 0:
-            return
-
-        print("Analyzing instruction differences...")
-        sys.stdout.flush()
-        for i in progressbar.progressbar(range(len(self.persisting_symbol_names))):
-            symbol_name: str = self.persisting_symbol_names[i]
-            old_symbol: Symbol = self.old_binary.symbols[symbol_name]
-            new_symbol: Symbol = self.new_binary.symbols[symbol_name]
-
-            if not old_symbol.__eq__(new_symbol):
-                self.num_symbols_with_instruction_differences += 1
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff.binary import Binary
+from elf_diff.binary_pair import createBinary
+from elf_diff.budget_settings import BudgetRule
+from elf_diff.size_rollups import splitNamespace
+from elf_diff.symbol import Symbol
+from elf_diff.symbol_sizes import (
+    SymbolSizes,
+    RESOURCE_CONSUMPTION_ATTRIBUTES,
+    getSectionSizes,
+)
+from elf_diff.settings import Settings
+
+import json
+import re
+import sys
+from typing import Optional, List, Dict, Tuple, Callable, Any
+
+BUDGET_PASSED = "passed"
+BUDGET_EXCEEDED = "exceeded"
+BUDGET_SKIPPED = "skipped"
+
+# The old and new size that a budget rule applies to
+SizePair = Tuple[int, int]
+
+
+class BudgetResult(object):
+    """The result of evaluating a budget rule"""
+
+    def __init__(self, rule: BudgetRule):
+        """Initialize budget result object."""
+        self.rule: BudgetRule = rule
+        self.old: Optional[int] = None
+        self.new: Optional[int] = None
+        self.status: str = BUDGET_SKIPPED
+
+    @property
+    def delta(self) -> Optional[int]:
+        if (self.old is None) or (self.new is None):
+            return None
+        return self.new - self.old
+
+    def evaluate(self, sizes: SizePair) -> None:
+        """Compare old and new size with the limits of the rule"""
+        (self.old, self.new) = sizes
+        exceeded: bool = (
+            (self.rule.max_ is not None) and (self.new > self.rule.max_)
+        ) or (
+            (self.rule.max_delta is not None)
+            and (self.new - self.old > self.rule.max_delta)
+        )
+        self.status = BUDGET_EXCEEDED if exceeded else BUDGET_PASSED
+
+    def toDict(self) -> Dict[str, Any]:
+        """Return a dict representation for the verdict file"""
+        return {
+            "name": self.rule.name,
+            "kind": self.rule.kind,
+            "target": self.rule.target,
+            "max": self.rule.max_,
+            "max_delta": self.rule.max_delta,
+            "old": self.old,
+            "new": self.new,
+            "delta": self.delta,
+            "status": self.status,
+        }
+
+
+class BudgetCheck(object):
+    """Evaluates the budgets defined in the driver file.
+
+    Rules are evaluated in stages of increasing cost: overall sizes, section sizes
+    and, finally, symbol groups which require parsing the symbols. Once a stage
+    yields an exceeded budget, all later stages are skipped.
+    """
+
+    def __init__(self, settings: Settings):
+        """Initialize budget check object."""
+        self.settings: Settings = settings
+        # Budgets are only checked if both binaries are defined
+        assert settings.old_binary_filename is not None
+        assert settings.new_binary_filename is not None
+        self.old_binary_filename: str = settings.old_binary_filename
+        self.new_binary_filename: str = settings.new_binary_filename
+        self.results: List[BudgetResult] = [
+            BudgetResult(rule) for rule in settings.budgets
+        ]
+
+    def run(self) -> bool:
+        """Evaluate the budgets and return whether any budget is exceeded"""
+        stages: List[Tuple[List[str], Callable[[List[BudgetRule]], List[SizePair]]]] = [
+            (["size"], self._determineOverallSizes),
+            (["section"], self._determineSectionSizes),
+            (["namespace", "symbol_regex"], self._determineSymbolGroupSizes),
+        ]
+        for kinds, determineSizes in stages:
+            stage_results: List[BudgetResult] = [
+                result for result in self.results if result.rule.kind in kinds
+            ]
+            if len(stage_results) == 0:
+                continue
+
+            stage_sizes: List[SizePair] = determineSizes(
+                [result.rule for result in stage_results]
+            )
+            for result, sizes in zip(stage_results, stage_sizes):
+                result.evaluate(sizes)
+
+            if self.exceeded:
+                break
+
+        return self.exceeded
+
+    @property
+    def exceeded(self) -> bool:
+        return any(result.status == BUDGET_EXCEEDED for result in self.results)
+
+    def _determineOverallSizes(self, rules: List[BudgetRule]) -> List[SizePair]:
+        print("Checking size budgets...")
+        sys.stdout.flush()
+        old_sizes = SymbolSizes(self.old_binary_filename, self.settings.binutils)
+        new_sizes = SymbolSizes(self.new_binary_filename, self.settings.binutils)
+        sizes: List[SizePair] = []
+        for rule in rules:
+            attribute: str = RESOURCE_CONSUMPTION_ATTRIBUTES[rule.target]
+            sizes.append((getattr(old_sizes, attribute), getattr(new_sizes, attribute)))
+        return sizes
+
+    def _determineSectionSizes(self, rules: List[BudgetRule]) -> List[SizePair]:
+        print("Checking section budgets...")
+        sys.stdout.flush()
+        old_sizes = getSectionSizes(self.old_binary_filename, self.settings.binutils)
+        new_sizes = getSectionSizes(self.new_binary_filename, self.settings.binutils)
+        return [
+            (old_sizes.get(rule.target, 0), new_sizes.get(rule.target, 0))
+            for rule in rules
+        ]
+
+    def _determineSymbolGroupSizes(self, rules: List[BudgetRule]) -> List[SizePair]:
+        print("Checking symbol group budgets...")
+        sys.stdout.flush()
+        old_binary: Binary = createBinary(
+            self.settings,
+            self.old_binary_filename,
+            "old",
+            gather_instructions=False,
+        )
+        new_binary: Binary = createBinary(
+            self.settings,
+            self.new_binary_filename,
+            "new",
+            gather_instructions=False,
+        )
+        matchers: List[Callable[[Symbol], bool]] = [
+            symbolGroupMatcher(rule) for rule in rules
+        ]
+        old_sizes: List[int] = symbolGroupSizes(old_binary, matchers)
+        new_sizes: List[int] = symbolGroupSizes(new_binary, matchers)
+        return list(zip(old_sizes, new_sizes))
+
+    def writeVerdictFile(self, filename: str) -> None:
+        """Write the results of the budget check as JSON file"""
+        verdict: Dict[str, Any] = {
+            "old_binary": self.settings.old_binary_filename,
+            "new_binary": self.settings.new_binary_filename,
+            "verdict": BUDGET_EXCEEDED if self.exceeded else BUDGET_PASSED,
+            "budgets": [result.toDict() for result in self.results],
+        }
+        with open(filename, "w") as f:
+            json.dump(verdict, f, indent=4)
+
+
+def symbolGroupMatcher(rule: BudgetRule) -> Callable[[Symbol], bool]:
+    """Return a predicate that tells whether a symbol belongs to the group of a budget rule"""
+    if rule.kind == "namespace":
+        group_components: List[str] = splitNamespace(rule.target)
+        num_components: int = len(group_components)
+
+        def matchNamespace(symbol: Symbol) -> bool:
+            components = splitNamespace(getattr(symbol, "namespace", None))
+            return components[:num_components] == group_components
+
+        return matchNamespace
+
+    symbol_re = re.compile(rule.target)
+
+    def matchRegex(symbol: Symbol) -> bool:
+        return symbol_re.match(symbol.name) is not None
+
+    return matchRegex
+
+
+def symbolGroupSizes(
+    binary: Binary, matchers: List[Callable[[Symbol], bool]]
+) -> List[int]:
+    """Accumulate the sizes of the symbols of a binary for every symbol group"""
+    sizes: List[int] = [0] * len(matchers)
+    for symbol in binary.symbols.values():
+        for i, matcher in enumerate(matchers):
+            if matcher(symbol):
+                sizes[i] += symbol.size
+    return sizes
+
+
+def checkBudgets(settings: Settings) -> bool:
+    """Check the budgets defined in the settings, report the results and return
+    whether any budget is exceeded"""
+    budget_check = BudgetCheck(settings)
+    exceeded: bool = budget_check.run()
+
+    print("Budgets:")
+    for result in budget_check.results:
+        if result.status == BUDGET_SKIPPED:
+            print(f"   {result.rule.name}: {result.status}")
+        else:
+            print(
+                f"   {result.rule.name}: {result.status} (new: {result.new} bytes, delta: {result.delta} bytes)"
+            )
+
+    if settings.budget_verdict_file:
+        budget_check.writeVerdictFile(settings.budget_verdict_file)
+
+    return exceeded
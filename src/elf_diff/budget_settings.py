@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff.symbol_sizes import RESOURCE_CONSUMPTION_ATTRIBUTES
+
+import re
+from typing import Optional, Dict, Any, List
+
+# Budget rule kinds in the order of increasing evaluation cost
+BUDGET_RULE_KINDS: List[str] = ["size", "section", "namespace", "symbol_regex"]
+
+
+class BudgetRule(object):
+    """A size budget as defined in the budgets section of a driver file"""
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        target: str,
+        max_: Optional[int] = None,
+        max_delta: Optional[int] = None,
+    ):
+        """Initialize budget rule object."""
+        self.name: str = name
+        self.kind: str = kind
+        self.target: str = target
+        self.max_: Optional[int] = max_
+        self.max_delta: Optional[int] = max_delta
+
+    @staticmethod
+    def fromDriverFileEntry(entry: Dict[str, Any], rule_id: int) -> "BudgetRule":
+        """Create a budget rule from an entry of the budgets section of a driver file"""
+        kinds: List[str] = [kind for kind in BUDGET_RULE_KINDS if kind in entry]
+        if len(kinds) != 1:
+            raise Exception(
+                f"Budget {rule_id} must define exactly one of {', '.join(BUDGET_RULE_KINDS)}"
+            )
+        kind: str = kinds[0]
+        target: str = str(entry[kind])
+
+        if (kind == "size") and (target not in RESOURCE_CONSUMPTION_ATTRIBUTES):
+            raise Exception(
+                f"Unknown size '{target}' in budget {rule_id}. Available: {', '.join(RESOURCE_CONSUMPTION_ATTRIBUTES)}"
+            )
+        if kind == "symbol_regex":
+            try:
+                re.compile(target)
+            except re.error as exc:
+                raise Exception(f"Invalid symbol_regex in budget {rule_id}: {exc}")
+
+        if ("max" not in entry) and ("max_delta" not in entry):
+            raise Exception(f"Budget {rule_id} defines neither max nor max_delta")
+
+        return BudgetRule(
+            name=entry.get("name") or f"{kind} {target}",
+            kind=kind,
+            target=target,
+            max_=BudgetRule._readLimit(entry, "max", rule_id),
+            max_delta=BudgetRule._readLimit(entry, "max_delta", rule_id),
+        )
+
+    @staticmethod
+    def _readLimit(entry: Dict[str, Any], key: str, rule_id: int) -> Optional[int]:
+        """Read an optional limit in bytes"""
+        if key not in entry:
+            return None
+        if not isinstance(entry[key], int):
+            raise Exception(f"{key} of budget {rule_id} must be an integer")
+        return entry[key]
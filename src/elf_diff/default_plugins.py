@@ -26,6 +26,9 @@ from elf_diff.plugin import (
 )
 from elf_diff.error_handling import warning
 from elf_diff.plugins.export.html.plugin import HTMLExportPairReportPlugin
+from elf_diff.plugins.export.compact_html.plugin import (
+    CompactHTMLExportPairReportPlugin,
+)
 from elf_diff.plugins.export.pdf.plugin import PDFExportPairReportPlugin
 from elf_diff.plugins.export.yaml.plugin import YAMLExportPairReportPlugin
 from elf_diff.plugins.export.json.plugin import JSONExportPairReportPlugin
@@ -39,6 +42,7 @@ from typing import Dict, Type, List
 
 DEFAULT_PLUGIN_TYPES: Dict[str, Type] = {
     "html_export": HTMLExportPairReportPlugin,
+    "compact_html_export": CompactHTMLExportPairReportPlugin,
     "pdf_export": PDFExportPairReportPlugin,
     "yaml_export": YAMLExportPairReportPlugin,
     "json_export": JSONExportPairReportPlugin,
@@ -61,7 +65,12 @@ def activateDefaultPlugin(
 def activateDefaultPlugins(settings: Settings) -> None:
 
     if settings.html_dir:
-        plugin_configuration = {"output_dir": settings.html_dir, "single_page": "False"}
+        plugin_configuration = {
+            "output_dir": settings.html_dir,
+            "single_page": "False",
+            "incremental": str(bool(settings.incremental)),
+            "virtual_overview_tables": str(bool(settings.virtual_overview_tables)),
+        }
         activateDefaultPlugin(
             settings, HTMLExportPairReportPlugin, plugin_configuration
         )
@@ -70,11 +79,18 @@ def activateDefaultPlugins(settings: Settings) -> None:
         plugin_configuration = {
             "output_file": settings.html_file,
             "single_page": "True",
+            "virtual_overview_tables": str(bool(settings.virtual_overview_tables)),
         }
         activateDefaultPlugin(
             settings, HTMLExportPairReportPlugin, plugin_configuration
         )
 
+    if settings.compact_html_file:
+        plugin_configuration = {"output_file": settings.compact_html_file}
+        activateDefaultPlugin(
+            settings, CompactHTMLExportPairReportPlugin, plugin_configuration
+        )
+
     if settings.pdf_file:
         plugin_configuration = {"output_file": settings.pdf_file}
         activateDefaultPlugin(settings, PDFExportPairReportPlugin, plugin_configuration)
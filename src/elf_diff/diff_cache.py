@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2024  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""A cache for the results of comparing two strings that persists across runs.
+
+Instruction difference tables, similarity ratios and highlighted symbol name
+differences only depend on the compared strings. Results are stored in an
+SQLite database in a cache directory, keyed by the kind of result (including
+the version of the algorithm) and the fingerprints of both strings. If the
+database exceeds its maximum size, the least recently used entries are removed.
+"""
+
+from elf_diff.settings import Settings
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# Must be increased whenever the database layout or the kinds of cached results change
+DIFF_CACHE_VERSION = 1
+
+DIFF_CACHE_FILENAME = f"elf_diff_diff_cache_v{DIFF_CACHE_VERSION}.sqlite"
+
+DEFAULT_MAX_SIZE_MB = 256
+
+# Pending entries are written to the database in batches
+FLUSH_THRESHOLD = 1000
+
+
+def fingerprint(text: str) -> str:
+    """Return a fingerprint that identifies the content of a string"""
+    # The fingerprint is not used for security purposes
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()  # nosec
+
+
+class DiffCache(object):
+    """Stores the results of comparing pairs of strings in a cache directory.
+
+    Without a cache directory, results are always computed. Databases opened
+    before a process is forked are not used by the child process, it opens its
+    own connection. Worker processes must call flush() before they finish.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_size: int = DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+    ):
+        self.cache_dir: Optional[str] = cache_dir
+        self.max_size: int = max_size
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: int = 0
+        self._pending: Dict[str, str] = {}
+        self._used_keys: Set[str] = set()
+        self.num_hits: int = 0
+        self.num_misses: int = 0
+
+    def isEnabled(self) -> bool:
+        """Return True if results are cached"""
+        return bool(self.cache_dir)
+
+    def getDatabasePath(self) -> str:
+        """Return the path of the cache database"""
+        assert self.cache_dir
+        return os.path.join(self.cache_dir, DIFF_CACHE_FILENAME)
+
+    def _openDatabase(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.getDatabasePath(), timeout=60)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        connection.commit()
+        return connection
+
+    def _getConnection(self) -> sqlite3.Connection:
+        if (self._connection is not None) and (self._connection_pid == os.getpid()):
+            return self._connection
+        if self._connection_pid != os.getpid():
+            # Entries pending or used in the parent process are stored by the parent
+            self._pending = {}
+            self._used_keys = set()
+        assert self.cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        try:
+            self._connection = self._openDatabase()
+        except sqlite3.DatabaseError:
+            # A corrupt database is replaced by an empty one
+            os.remove(self.getDatabasePath())
+            self._connection = self._openDatabase()
+        self._connection_pid = os.getpid()
+        return self._connection
+
+    def _lookup(self, key: str) -> Optional[str]:
+        value: Optional[str] = self._pending.get(key)
+        if value is not None:
+            return value
+        row = (
+            self._getConnection()
+            .execute("SELECT value FROM entries WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        self._used_keys.add(key)
+        return row[0]
+
+    def getOrCompute(
+        self, kind: str, old: str, new: str, compute: Callable[[str, str], Any]
+    ) -> Any:
+        """Return the cached result of compute(old, new) or compute and cache it.
+        The kind must identify the computation including the version of its algorithm.
+        Results must be JSON serializable, tuples are returned as lists.
+        """
+        if not self.isEnabled():
+            return compute(old, new)
+
+        key: str = f"{kind}/{fingerprint(old)}/{fingerprint(new)}"
+        cached_value: Optional[str] = self._lookup(key)
+        if cached_value is not None:
+            self.num_hits += 1
+            return json.loads(cached_value)
+
+        self.num_misses += 1
+        result = compute(old, new)
+        self._pending[key] = json.dumps(result)
+        if len(self._pending) >= FLUSH_THRESHOLD:
+            self.flush()
+        return result
+
+    def flush(self) -> None:
+        """Write pending entries and the times of use of cached entries to the database"""
+        if not self.isEnabled() or (not self._pending and not self._used_keys):
+            return
+        connection = self._getConnection()
+        now = time.time()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                [
+                    (key, value, len(key) + len(value), now)
+                    for key, value in self._pending.items()
+                ],
+            )
+            connection.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                [(now, key) for key in self._used_keys],
+            )
+        self._pending = {}
+        self._used_keys = set()
+
+    def evict(self) -> int:
+        """Remove the least recently used entries until the database does not
+        exceed its maximum size. Return the number of removed entries.
+        """
+        if not self.isEnabled():
+            return 0
+        connection = self._getConnection()
+        size: int = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if size <= self.max_size:
+            return 0
+        removed_keys: List[Tuple[str]] = []
+        for key, entry_size in connection.execute(
+            "SELECT key, size FROM entries ORDER BY last_used ASC"
+        ):
+            if size <= self.max_size:
+                break
+            removed_keys.append((key,))
+            size -= entry_size
+        with connection:
+            connection.executemany("DELETE FROM entries WHERE key = ?", removed_keys)
+        return len(removed_keys)
+
+    def close(self) -> None:
+        """Store pending entries, limit the size of the database and close it"""
+        if not self.isEnabled():
+            return
+        self.flush()
+        self.evict()
+        if (self._connection is not None) and (self._connection_pid == os.getpid()):
+            self._connection.close()
+        self._connection = None
+
+    def getSummary(self) -> str:
+        """Return a summary of the cache lookups"""
+        return f"{self.num_hits} cached diffs reused, {self.num_misses} computed"
+
+
+# Caches by directory and maximum size. They live as long as the process.
+_DIFF_CACHES: Dict[Tuple[Optional[str], int], DiffCache] = {}
+
+
+def getDiffCache(settings: Settings) -> DiffCache:
+    """Return the diff cache configured by the settings, it is created on first request"""
+    cache_dir: Optional[str] = (
+        os.path.abspath(settings.diff_cache_dir) if settings.diff_cache_dir else None
+    )
+    max_size: int = int(float(settings.diff_cache_max_mb) * 1024 * 1024)
+    key = (cache_dir, max_size)
+    diff_cache = _DIFF_CACHES.get(key)
+    if diff_cache is None:
+        diff_cache = DiffCache(cache_dir, max_size)
+        _DIFF_CACHES[key] = diff_cache
+    return diff_cache
+
+
+def closeDiffCaches() -> None:
+    """Store and close all diff caches of the process"""
+    for diff_cache in _DIFF_CACHES.values():
+        if diff_cache.isEnabled():
+            diff_cache.close()
+            print(f"Diff cache: {diff_cache.getSummary()}")
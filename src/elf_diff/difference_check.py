@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff.binary import Binary
+from elf_diff.binary_pair import createBinary, symbolMigrated
+from elf_diff.symbol_sizes import SymbolSizes, RESOURCE_CONSUMPTION_ATTRIBUTES
+from elf_diff.settings import Settings
+
+import os
+import sys
+from typing import Optional, List, Callable
+
+
+class DifferenceCheck(object):
+    """Checks whether two binaries differ significantly without generating a document.
+
+    The criteria are the same as those of the statistics text file. They are
+    evaluated in stages of increasing cost and the check stops at the first
+    significant difference.
+    """
+
+    def __init__(self, settings: Settings):
+        """Initialize difference check object."""
+        self.settings: Settings = settings
+        assert settings.old_binary_filename is not None
+        assert settings.new_binary_filename is not None
+        self.old_binary_filename: str = settings.old_binary_filename
+        self.new_binary_filename: str = settings.new_binary_filename
+        self.old_sizes: Optional[SymbolSizes] = None
+        self.new_sizes: Optional[SymbolSizes] = None
+        self.old_binary: Optional[Binary] = None
+        self.new_binary: Optional[Binary] = None
+        self.persisting_symbol_names: List[str] = []
+
+    def run(self) -> Optional[str]:
+        """Run the check and return a description of the first significant
+        difference found or None if the binaries do not differ significantly"""
+        for filename in [self.old_binary_filename, self.new_binary_filename]:
+            if not os.path.isfile(filename):
+                raise Exception(f"Unable to find filename {filename}")
+
+        stages: List[Callable[[], Optional[str]]] = [
+            self._checkResourceConsumption,
+            self._checkSymbols,
+            self._checkInstructions,
+        ]
+        for stage in stages:
+            difference: Optional[str] = stage()
+            if difference is not None:
+                return difference
+        return None
+
+    def _checkResourceConsumption(self) -> Optional[str]:
+        """Compare the overall resource consumption of both binaries"""
+        print("Checking resource consumption...")
+        sys.stdout.flush()
+        # The sizes are reused when the binaries are created in the next stage
+        self.old_sizes = SymbolSizes(self.old_binary_filename, self.settings.binutils)
+        self.new_sizes = SymbolSizes(self.new_binary_filename, self.settings.binutils)
+        for name, attribute in RESOURCE_CONSUMPTION_ATTRIBUTES.items():
+            delta: int = getattr(self.new_sizes, attribute) - getattr(
+                self.old_sizes, attribute
+            )
+            if delta != 0:
+                return f"{name.replace('_', ' ')} size changed by {delta} bytes"
+        return None
+
+    def _checkSymbols(self) -> Optional[str]:
+        """Compare the symbol sets of both binaries and check for migrated symbols.
+        Instructions are not yet gathered."""
+        print("Checking symbols...")
+        sys.stdout.flush()
+        self.old_binary = createBinary(
+            self.settings,
+            self.old_binary_filename,
+            "old",
+            gather_instructions=False,
+            symbol_sizes=self.old_sizes,
+        )
+        self.new_binary = createBinary(
+            self.settings,
+            self.new_binary_filename,
+            "new",
+            gather_instructions=False,
+            symbol_sizes=self.new_sizes,
+        )
+        if self.old_binary.file_format != self.new_binary.file_format:
+            raise Exception(
+                "Binary formats incompatible. Old: %s, new: %s"
+                % (self.old_binary.file_format, self.new_binary.file_format)
+            )
+
+        old_symbol_names = set(self.old_binary.symbols.keys())
+        new_symbol_names = set(self.new_binary.symbols.keys())
+
+        num_disappeared: int = len(old_symbol_names - new_symbol_names)
+        if num_disappeared > 0:
+            return f"{num_disappeared} symbol(s) disappeared"
+
+        num_appeared: int = len(new_symbol_names - old_symbol_names)
+        if num_appeared > 0:
+            return f"{num_appeared} symbol(s) appeared"
+
+        self.persisting_symbol_names = [
+            symbol_name
+            for symbol_name in sorted(old_symbol_names)
+            if not (
+                self.settings.skip_persisting_same_size
+                and (
+                    self.old_binary.symbols[symbol_name].size
+                    == self.new_binary.symbols[symbol_name].size
+                )
+            )
+        ]
+
+        if (
+            self.old_binary.debug_info_available
+            and self.new_binary.debug_info_available
+        ):
+            for symbol_name in self.persisting_symbol_names:
+                if symbolMigrated(self.old_binary, self.new_binary, symbol_name):
+                    return (
+                        f"symbol {self.old_binary.symbols[symbol_name].name} migrated"
+                    )
+        return None
+
+    def _checkInstructions(self) -> Optional[str]:
+        """Compare the instructions of persisting symbols"""
+        if len(self.persisting_symbol_names) == 0:
+            return None
+        assert self.old_binary and self.new_binary
+
+        print("Checking instructions...")
+        sys.stdout.flush()
+        self.old_binary.gatherInstructions()
+        self.new_binary.gatherInstructions()
+
+        for symbol_name in self.persisting_symbol_names:
+            old_symbol = self.old_binary.symbols[symbol_name]
+            if not old_symbol.instructionsEqual(self.new_binary.symbols[symbol_name]):
+                return f"instructions of symbol {old_symbol.name} differ"
+        return None
+
+
+def checkDifferences(settings: Settings) -> bool:
+    """Check whether the binaries differ significantly, report the verdict and return it"""
+    difference: Optional[str] = DifferenceCheck(settings).run()
+    if difference is None:
+        print("No significant differences.")
+        return False
+    print(f"Files differ: {difference}.")
+    return True
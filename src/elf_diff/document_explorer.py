@@ -29,7 +29,9 @@ from elf_diff.pair_report_document import (
 from elf_diff.auxiliary import isNameToken
 import anytree  # type: ignore # Make mypy ignore this module
 import os
-from typing import Optional, Dict, Union, Any, List, Tuple
+import weakref
+from collections.abc import Mapping
+from typing import Optional, Dict, Union, Any, List, Tuple, Iterator
 
 
 def prettyPrintNode(
@@ -49,7 +51,7 @@ def prettyPrintValue(
     """Return a pretty printed version of the leaf node"""
     formatted_doc_string: str = value_tree_value.getDocumentation()
 
-    if display_values and (not isinstance(value_tree_value._value, dict)):
+    if display_values and (not isinstance(value_tree_value._value, Mapping)):
         dynamic_value = value_tree_value.getValue()
         formatted_value: str = f" = '{dynamic_value}'"
         type_info: str = " <%s>" % value_tree_value.getType().__name__
@@ -73,9 +75,16 @@ def enforceNameStartsWithNameToken(name: Any) -> str:
 class TreeTraversalOptions(object):
     """Options that affect how document trees or subtrees are traversed"""
 
-    def __init__(self, visit_dict_nodes: bool = True, visit_values: bool = True):
+    def __init__(
+        self,
+        visit_dict_nodes: bool = True,
+        visit_values: bool = True,
+        visit_transient: bool = False,
+    ):
         self.visit_dict_nodes: bool = visit_dict_nodes
         self.visit_values: bool = visit_values
+        # Transient nodes and values (e.g. document indexes) are not exported
+        self.visit_transient: bool = visit_transient
 
 
 TREE_TRAVERSAL_ALL = TreeTraversalOptions(visit_dict_nodes=True, visit_values=True)
@@ -86,6 +95,41 @@ class GeneratorOptions(object):
         self.enforce_names_alpha = enforce_names_alpha
 
 
+# The ordered fields of a meta tree node that are visited during a traversal.
+# Every entry consists of the attribute name, a flag that is True for values
+# and False for child nodes, and the meta tree value (None for child nodes).
+FieldPlan = Tuple[Tuple[str, bool, Any], ...]
+
+# Field plans by meta tree node and (visit_values, visit_transient)
+_FIELD_PLANS: "weakref.WeakKeyDictionary[Any, Dict[Tuple[bool, bool], FieldPlan]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _compileFieldPlan(meta_tree_node: Any, options: TreeTraversalOptions) -> FieldPlan:
+    """Determine the sorted values and children of a meta tree node that a traversal visits"""
+    fields: Dict[str, Tuple[str, bool, Any]] = {}
+    if options.visit_values:
+        for name, meta_tree_value in meta_tree_node._values.items():
+            if (
+                options.visit_transient
+                or meta_tree_value._properties._transient is None
+            ):
+                fields[name] = (name, True, meta_tree_value)
+    for name, meta_tree_child in meta_tree_node._children.items():
+        if options.visit_transient or meta_tree_child._properties._transient is None:
+            fields[name] = (name, False, None)
+    return tuple(fields[name] for name in sorted(fields.keys()))
+
+
+def _isNodeDict(dict_: Mapping) -> bool:
+    """Return True if the entries of a dict are value tree nodes. Other dicts,
+    e.g. the lists of ids of document indexes, are visited as plain values."""
+    for entry in dict_.values():
+        return isinstance(entry, ValueTreeNode)
+    return True
+
+
 class ValueTreeVisitor(object):
     """A base class of visitors that traverse the value tree"""
 
@@ -108,40 +152,69 @@ class ValueTreeVisitor(object):
         #            as we want to replace the referencing node by the referenced
         #            node. Otherwise we would have both listed in the tree
         #            in an unwanted nested fashion.
-
+        #
+        # The traversal is iterative. Every node that is entered contributes
+        # a generator of traversal steps to an explicit stack. A generator
+        # yields the subnodes to descend into and resumes once the subnode's
+        # traversal is finished. This keeps the depth of the Python call stack
+        # constant, regardless of the depth of the document tree.
+        stack: List[Iterator[Tuple[ValueTreeNode, Dict[str, Any]]]] = [
+            self._traversalSteps(value_tree_node, kvargs)
+        ]
+        while stack:
+            try:
+                subnode, subnode_kvargs = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+            stack.append(self._traversalSteps(subnode, subnode_kvargs))
+
+    def _traversalSteps(
+        self, value_tree_node: ValueTreeNode, kvargs: Dict[str, Any]
+    ) -> Iterator[Tuple[ValueTreeNode, Dict[str, Any]]]:
+        """Visit a single node and yield the subnodes that are to be traversed"""
         self._onDown(value_tree_node, **kvargs)
 
-        attributes = value_tree_node.getValueAndChildAttributes()
-
-        for name in sorted(attributes.keys()):
-            attr_type = attributes[name]
-            if attr_type == ValueTreeNode.VALUE_ATTRIBUTE:
-                if not self.tree_traversal_options.visit_values:
-                    continue
-                value = value_tree_node.getValue(name)
-                raw_value = value.getValue()
-                if isinstance(raw_value, dict):
-                    if self.tree_traversal_options.visit_dict_nodes:
-                        dict_ = raw_value
-                        self._beforeDict(value.getName(), dict_)
-                        for id_ in sorted(dict_.keys()):
-                            subtree = dict_[id_]
-                            self._beforeDictEntry(id_, subtree)
-                            self.visit(subtree, **kvargs)
-                            self._afterDictEntry(id_, subtree)
-                        self._afterDict(value.getName(), dict_)
-                    else:
-                        self._processValue(name, value)
-                elif isinstance(raw_value, ValueTreeNode):
-                    self.visit(raw_value, **kvargs)
-                else:
-                    self._processValue(name, value)
-            elif attr_type == ValueTreeNode.NODE_ATTRIBUTE:
-                child_value_tree_node = value_tree_node.getChild(name)
-                self.visit(child_value_tree_node)
+        for name, is_value, meta_tree_value in self._fieldPlan(
+            value_tree_node.getMetaTreeNode()
+        ):
+            raw_value = getattr(value_tree_node, name)
+            if not is_value:
+                yield raw_value, {}
+            elif isinstance(raw_value, ValueTreeNode):
+                yield raw_value, kvargs
+            elif (
+                isinstance(raw_value, Mapping)
+                and self.tree_traversal_options.visit_dict_nodes
+                and _isNodeDict(raw_value)
+            ):
+                dict_name = meta_tree_value._name
+                self._beforeDict(dict_name, raw_value)
+                for id_ in sorted(raw_value.keys()):
+                    subtree = raw_value[id_]
+                    self._beforeDictEntry(id_, subtree)
+                    yield subtree, kvargs
+                    self._afterDictEntry(id_, subtree)
+                self._afterDict(dict_name, raw_value)
+            else:
+                self._processValue(name, ValueTreeValue(raw_value, meta_tree_value))
 
         self._onUp(value_tree_node, **kvargs)
 
+    def _fieldPlan(self, meta_tree_node: Any) -> FieldPlan:
+        """Return the cached field plan of a meta tree node for the traversal options"""
+        options = self.tree_traversal_options
+        key = (options.visit_values, options.visit_transient)
+        plans = _FIELD_PLANS.get(meta_tree_node)
+        if plans is None:
+            plans = {}
+            _FIELD_PLANS[meta_tree_node] = plans
+        plan = plans.get(key)
+        if plan is None:
+            plan = _compileFieldPlan(meta_tree_node, options)
+            plans[key] = plan
+        return plan
+
     def _processValue(self, name: str, value_tree_value: ValueTreeValue) -> None:
         """Meant to be overridden by derived visitor objects"""
         pass
@@ -154,11 +227,11 @@ class ValueTreeVisitor(object):
         """Meant to be overridden by derived visitor objects"""
         pass
 
-    def _beforeDict(self, name: str, dict_: dict) -> None:
+    def _beforeDict(self, name: str, dict_: Mapping) -> None:
         """Meant to be overridden by derived visitor objects"""
         pass
 
-    def _afterDict(self, name: str, dict_: dict) -> None:
+    def _afterDict(self, name: str, dict_: Mapping) -> None:
         """Meant to be overridden by derived visitor objects"""
         pass
 
@@ -223,11 +296,11 @@ class AnytreeGenerator(ValueTreeVisitor):
     def _afterDictEntry(self, id_: int, subtree: ValueTreeNode) -> None:
         self._stack.pop()
 
-    def _beforeDict(self, name: str, dict_: dict) -> None:
+    def _beforeDict(self, name: str, dict_: Mapping) -> None:
         any_tree_node = self._generateAnytreeNode(name)
         self._stack.append(any_tree_node)
 
-    def _afterDict(self, name: str, dict_: dict) -> None:
+    def _afterDict(self, name: str, dict_: Mapping) -> None:
         self._stack.pop()
 
 
@@ -284,11 +357,11 @@ class DictGenerator(ValueTreeVisitor):
     def _afterDictEntry(self, id_: int, subtree: ValueTreeNode) -> None:
         self._endChildDict()
 
-    def _beforeDict(self, name: str, dict_: dict) -> None:
+    def _beforeDict(self, name: str, dict_: Mapping) -> None:
         parent_dict, child_dict = self._startChildDict()
         self._addDictEntry(parent_dict, name, child_dict)
 
-    def _afterDict(self, name: str, dict_: dict) -> None:
+    def _afterDict(self, name: str, dict_: Mapping) -> None:
         self._endChildDict()
 
 
@@ -450,11 +523,14 @@ def generateDictionary(
 
 
 def dumpTreeTxt(
-    value_tree_node: ValueTreeNode, display_values=True, only_base_tree=True
+    value_tree_node: ValueTreeNode,
+    display_values=True,
+    only_base_tree=True,
+    visit_transient=False,
 ) -> str:
     """Dump a value tree as formatted text"""
     tree_traversal_options = TreeTraversalOptions(
-        visit_dict_nodes=(only_base_tree is False)
+        visit_dict_nodes=(only_base_tree is False), visit_transient=visit_transient
     )
 
     document_explorer = DocumentExplorer(StringSink, display_values=display_values)
@@ -468,7 +544,10 @@ def dumpDocumentStructureTxt(display_values=True, only_base_tree=True) -> str:
     """Dump the document structure of the main document as formatted text"""
     value_tree = generateDocumentTree()
     return dumpTreeTxt(
-        value_tree, display_values=display_values, only_base_tree=only_base_tree
+        value_tree,
+        display_values=display_values,
+        only_base_tree=only_base_tree,
+        visit_transient=True,
     )
 
 
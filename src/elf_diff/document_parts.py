@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from typing import Iterable, Set
+
+# Document parts that exporters may require. Parts that no active exporter
+# requires are not computed when the document is generated. General information,
+# configuration and the overall statistics are always part of the document.
+
+# Dictionaries of symbols by symbol class and the source files they refer to
+DOCUMENT_PART_SYMBOL_CLASSES = "symbol_classes"
+
+# Disassembled instructions of symbols. Renamed symbols and persisting
+# symbols with instruction differences are determined by instructions.
+DOCUMENT_PART_INSTRUCTIONS = "instructions"
+
+# Similar symbols
+DOCUMENT_PART_SIMILARITIES = "similarities"
+
+# Size statistics by symbol type and memory class, percentiles and histogram
+DOCUMENT_PART_SIZE_ANALYTICS = "size_analytics"
+
+# Sizes aggregated by namespace, class and source directory
+DOCUMENT_PART_ROLLUPS = "rollups"
+
+DOCUMENT_PARTS: Set[str] = {
+    DOCUMENT_PART_SYMBOL_CLASSES,
+    DOCUMENT_PART_INSTRUCTIONS,
+    DOCUMENT_PART_SIMILARITIES,
+    DOCUMENT_PART_SIZE_ANALYTICS,
+    DOCUMENT_PART_ROLLUPS,
+}
+
+
+def validateDocumentParts(document_parts: Iterable[str], origin: str) -> None:
+    """Raise an exception if any of the document parts is unknown"""
+    unknown_parts = set(document_parts) - DOCUMENT_PARTS
+    if len(unknown_parts) > 0:
+        raise Exception(
+            f"{origin} requires unknown document part(s) {', '.join(sorted(unknown_parts))}. "
+            f"Available: {', '.join(sorted(DOCUMENT_PARTS))}"
+        )
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2024  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Side by side HTML tables of the differences of the assembly instructions of two symbols.
+
+Lines are interned as integer ids before they are compared. Line differences
+are computed with Myers' algorithm (see sequence_diff). The tables use the CSS
+classes of difflib.HtmlDiff tables (diff, diff_header, diff_add, diff_sub, diff_chg).
+"""
+
+from elf_diff.sequence_diff import getOpcodes, Opcode
+from elf_diff.instruction_collector import SOURCE_CODE_START_TAG, SOURCE_CODE_END_TAG
+
+import html
+from typing import Dict, List, Tuple
+
+# Must be increased whenever the generated markup changes
+INSTRUCTION_DIFF_RENDERER_VERSION = 1
+
+# The default maximum number of lines that are compared and displayed
+DEFAULT_MAX_LINES = 5000
+
+# Unchanged lines that are further away from the next change are collapsed
+DEFAULT_CONTEXT_LINES = 1000
+
+TAB_SIZE = 3
+
+TAGS: Tuple[str, ...] = (SOURCE_CODE_START_TAG, SOURCE_CODE_END_TAG)
+
+
+def internLines(
+    old_lines: List[str], new_lines: List[str]
+) -> Tuple[List[int], List[int]]:
+    """Map the lines of both sides to integer ids, equal lines share the same id"""
+    line_ids: Dict[str, int] = {}
+    old_ids: List[int] = [
+        line_ids.setdefault(line, len(line_ids)) for line in old_lines
+    ]
+    new_ids: List[int] = [
+        line_ids.setdefault(line, len(line_ids)) for line in new_lines
+    ]
+    return old_ids, new_ids
+
+
+def getLineOpcodes(
+    old_ids: List[int], new_ids: List[int], max_lines: int = DEFAULT_MAX_LINES
+) -> List[Opcode]:
+    """Return the opcodes that turn the old lines into the new lines
+    (see difflib.SequenceMatcher.get_opcodes()). If the lines between common
+    prefix and suffix exceed max_lines in total, they are not compared
+    but reported as replaced.
+    """
+    n: int = len(old_ids)
+    m: int = len(new_ids)
+
+    prefix: int = 0
+    while (prefix < n) and (prefix < m) and (old_ids[prefix] == new_ids[prefix]):
+        prefix += 1
+    suffix: int = 0
+    while (
+        (suffix < n - prefix)
+        and (suffix < m - prefix)
+        and (old_ids[n - suffix - 1] == new_ids[m - suffix - 1])
+    ):
+        suffix += 1
+
+    opcodes: List[Opcode] = []
+    if prefix > 0:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+
+    old_middle: List[int] = old_ids[prefix : n - suffix]
+    new_middle: List[int] = new_ids[prefix : m - suffix]
+    if len(old_middle) + len(new_middle) > max_lines:
+        opcodes.append(("replace", prefix, n - suffix, prefix, m - suffix))
+    elif old_middle or new_middle:
+        for tag, i1, i2, j1, j2 in getOpcodes(old_middle, new_middle):
+            opcodes.append((tag, prefix + i1, prefix + i2, prefix + j1, prefix + j2))
+
+    if suffix > 0:
+        opcodes.append(("equal", n - suffix, n, m - suffix, m))
+    return opcodes
+
+
+def _avoidSplittingTags(line: str, position: int) -> int:
+    """Move a position that lies within a source code tag to the start of the tag"""
+    for tag in TAGS:
+        start = line.find(tag, max(0, position - len(tag) + 1))
+        if 0 <= start < position:
+            return start
+    return position
+
+
+def _escape(text: str) -> str:
+    return html.escape(text.expandtabs(TAB_SIZE), quote=False)
+
+
+def _highlightChange(old_line: str, new_line: str) -> Tuple[str, str]:
+    """Highlight the differing middle part of two lines that replace each other"""
+    limit: int = min(len(old_line), len(new_line))
+    prefix: int = 0
+    while (prefix < limit) and (old_line[prefix] == new_line[prefix]):
+        prefix += 1
+    prefix = min(
+        _avoidSplittingTags(old_line, prefix), _avoidSplittingTags(new_line, prefix)
+    )
+    suffix: int = 0
+    while (suffix < limit - prefix) and (
+        old_line[-suffix - 1] == new_line[-suffix - 1]
+    ):
+        suffix += 1
+    old_end: int = _avoidSplittingTags(old_line, len(old_line) - suffix)
+    new_end: int = _avoidSplittingTags(new_line, len(new_line) - suffix)
+    suffix = min(len(old_line) - old_end, len(new_line) - new_end)
+
+    def highlight(line: str) -> str:
+        end: int = len(line) - suffix
+        return (
+            _escape(line[:prefix])
+            + '<span class="diff_chg">'
+            + _escape(line[prefix:end])
+            + "</span>"
+            + _escape(line[end:])
+        )
+
+    return highlight(old_line), highlight(new_line)
+
+
+def _side(line_number: int, content: str) -> str:
+    return f'<td class="diff_header">{line_number}</td><td>{content}</td>'
+
+
+EMPTY_SIDE = '<td class="diff_header"></td><td></td>'
+
+
+def _note(text: str) -> str:
+    return f'<tr><td class="diff_next" colspan="4">{text}</td></tr>'
+
+
+class _TableRows(object):
+    """Collects the rows of a difference table up to a maximum number of rows"""
+
+    def __init__(self, max_rows: int):
+        self.rows: List[str] = []
+        self.max_rows: int = max_rows
+        self.omitted: int = 0
+
+    def add(self, row: str) -> None:
+        if self.isFull():
+            self.omitted += 1
+        else:
+            self.rows.append(row)
+
+    def isFull(self) -> bool:
+        return len(self.rows) >= self.max_rows
+
+
+def _addEqualRows(
+    rows: _TableRows,
+    old_lines: List[str],
+    new_lines: List[str],
+    i1: int,
+    i2: int,
+    j1: int,
+) -> None:
+    for i in range(i1, i2):
+        if rows.isFull():
+            rows.omitted += i2 - i
+            return
+        j = j1 + i - i1
+        rows.add(
+            "<tr>"
+            + _side(i + 1, _escape(old_lines[i]))
+            + _side(j + 1, _escape(new_lines[j]))
+            + "</tr>"
+        )
+
+
+def renderInstructionDiffTable(
+    old_instructions: str,
+    new_instructions: str,
+    max_lines: int = DEFAULT_MAX_LINES,
+    context_lines: int = DEFAULT_CONTEXT_LINES,
+) -> str:
+    """Return a side by side HTML table of the differences of two instruction listings.
+    At most max_lines rows are displayed. Source code tags are preserved.
+    """
+    old_lines: List[str] = old_instructions.split("\n")
+    new_lines: List[str] = new_instructions.split("\n")
+    old_ids, new_ids = internLines(old_lines, new_lines)
+    opcodes: List[Opcode] = getLineOpcodes(old_ids, new_ids, max_lines)
+
+    rows = _TableRows(max_lines)
+    for index, (tag, i1, i2, j1, j2) in enumerate(opcodes):
+        if rows.isFull():
+            rows.omitted += max(i2 - i1, j2 - j1)
+            continue
+        if tag == "equal":
+            # Unchanged lines that are far away from any change are collapsed
+            head: int = 0 if index == 0 else context_lines
+            tail: int = 0 if index == len(opcodes) - 1 else context_lines
+            if i2 - i1 > head + tail:
+                _addEqualRows(rows, old_lines, new_lines, i1, i1 + head, j1)
+                rows.add(_note(f"{i2 - i1 - head - tail} unchanged lines"))
+                _addEqualRows(rows, old_lines, new_lines, i2 - tail, i2, j2 - tail)
+            else:
+                _addEqualRows(rows, old_lines, new_lines, i1, i2, j1)
+            continue
+
+        num_old: int = i2 - i1
+        num_new: int = j2 - j1
+        for k in range(max(num_old, num_new)):
+            if rows.isFull():
+                rows.omitted += max(num_old, num_new) - k
+                break
+            if (k < num_old) and (k < num_new):
+                old_html, new_html = _highlightChange(
+                    old_lines[i1 + k], new_lines[j1 + k]
+                )
+                rows.add(
+                    "<tr>"
+                    + _side(i1 + k + 1, old_html)
+                    + _side(j1 + k + 1, new_html)
+                    + "</tr>"
+                )
+            elif k < num_old:
+                content = f'<span class="diff_sub">{_escape(old_lines[i1 + k])}</span>'
+                rows.add("<tr>" + _side(i1 + k + 1, content) + EMPTY_SIDE + "</tr>")
+            else:
+                content = f'<span class="diff_add">{_escape(new_lines[j1 + k])}</span>'
+                rows.add("<tr>" + EMPTY_SIDE + _side(j1 + k + 1, content) + "</tr>")
+
+    if rows.omitted > 0:
+        rows.rows.append(
+            _note(f"{rows.omitted} more lines not displayed (limit {max_lines} lines)")
+        )
+
+    return (
+        '<table class="diff">\n'
+        '<thead><tr><th colspan="2" class="diff_header">Old</th>'
+        '<th colspan="2" class="diff_header">New</th></tr></thead>\n<tbody>\n'
+        + "\n".join(rows.rows)
+        + "\n</tbody>\n</table>"
+    )
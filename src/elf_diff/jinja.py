@@ -28,68 +28,118 @@ from elf_diff.settings import Settings
 from elf_diff.pair_report_document import getDocumentTreesOfDynamicTreeNodes
 from elf_diff.string_diff import tagStringDiffSource
 import jinja2
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+)
+import os
 import sys
 import codecs
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+# Environments by template directory, string diff backend and bytecode cache directory.
+# They live as long as the process, compiled templates are cached by the environments.
+_ENVIRONMENTS: Dict[Tuple[str, str, Optional[str]], Environment] = {}
+
+
+def _createEnvironment(
+    template_dir: str, string_diff_backend: str, bytecode_cache_dir: Optional[str]
+) -> Environment:
+    """Create a Jinja2 environment that provides elf_diff's custom template functions"""
+    bytecode_cache: Optional[FileSystemBytecodeCache] = None
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+    loader = FileSystemLoader(template_dir)
+    env = Environment(  # nosec # silence bandid warning (we are generating static code, there's no security risk without autoescaping)
+        loader=loader,
+        undefined=StrictUndefined,
+        autoescape=False,
+        # Templates do not change while elf_diff runs
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
+
+    # Define custom functions that are available in Jinja templates
+    env.globals[
+        "include_raw"
+    ] = lambda file_path, loader=loader, env=env: loader.get_source(env, file_path)[0]
+
+    iso_8859_1_loader = FileSystemLoader(template_dir, encoding="ISO-8859-1")
+    env.globals[
+        "include_raw_iso_8859_1"
+    ] = lambda file_path, loader=iso_8859_1_loader, env=env: loader.get_source(
+        env, file_path
+    )[
+        0
+    ]
+
+    env.globals["dump_tree"] = dumpTreeTxt
+    env.globals["dump_tree_full"] = lambda value_tree_node, display_values: dumpTreeTxt(
+        value_tree_node, display_values, only_base_tree=False
+    )
+    env.globals["dump_leaf_paths"] = lambda node: DocumentExplorer(
+        StringSink
+    ).dumpDocumentLeafPaths(node)
+    env.globals["get_dynamic_node_document_trees"] = getDocumentTreesOfDynamicTreeNodes
+
+    env.globals[
+        "tag_string_diff"
+    ] = lambda str1, str2, backend=string_diff_backend: tagStringDiffSource(
+        str1, str2, backend
+    )
+
+    return env
+
+
+def getEnvironment(
+    template_dir: str,
+    string_diff_backend: str,
+    bytecode_cache_dir: Optional[str] = None,
+) -> Environment:
+    """Return the Jinja2 environment of a template directory, it is created on first request"""
+    key = (
+        os.path.abspath(template_dir),
+        string_diff_backend,
+        os.path.abspath(bytecode_cache_dir) if bytecode_cache_dir else None,
+    )
+    env = _ENVIRONMENTS.get(key)
+    if env is None:
+        env = _createEnvironment(template_dir, string_diff_backend, bytecode_cache_dir)
+        _ENVIRONMENTS[key] = env
+    return env
 
 
 class Configurator(object):
     def __init__(self, settings: Settings, template_dir: str):
         self.settings: Settings = settings
         self.template_dir: str = template_dir
-
-    def configureTemplate(
-        self, template_file: str, template_keywords: Dict[str, Any]
-    ) -> str:
-        """Configure a Jinja2 template file from a set of keyword definitions. The configured content is returned as a string."""
-
-        loader = FileSystemLoader(self.template_dir)
-        env = Environment(  # nosec # silence bandid warning (we are generating static code, there's no security risk without autoescaping)
-            loader=loader,
-            undefined=StrictUndefined,
-            autoescape=False,
-        )
-
-        # Define custom functions that are available in Jinja templates
-        env.globals[
-            "include_raw"
-        ] = lambda file_path, loader=loader, env=env: loader.get_source(env, file_path)[
-            0
-        ]
-
-        iso_8859_1_loader = FileSystemLoader(self.template_dir, encoding="ISO-8859-1")
-        env.globals[
-            "include_raw_iso_8859_1"
-        ] = lambda file_path, loader=iso_8859_1_loader, env=env: loader.get_source(
-            env, file_path
-        )[
-            0
-        ]
-
-        env.globals["dump_tree"] = dumpTreeTxt
-        env.globals[
-            "dump_tree_full"
-        ] = lambda value_tree_node, display_values: dumpTreeTxt(
-            value_tree_node, display_values, only_base_tree=False
+        self.env: Environment = getEnvironment(
+            template_dir,
+            settings.string_diff_backend,
+            settings.template_cache_dir,
         )
-        env.globals["dump_leaf_paths"] = lambda node: DocumentExplorer(
-            StringSink
-        ).dumpDocumentLeafPaths(node)
-        env.globals[
-            "get_dynamic_node_document_trees"
-        ] = getDocumentTreesOfDynamicTreeNodes
-
-        env.globals["tag_string_diff"] = tagStringDiffSource
 
+    def getTemplate(self, template_file: str) -> Template:
+        """Return a compiled template, templates are compiled only once per environment"""
         try:
-            creator = env.get_template(template_file)
-
+            return self.env.get_template(template_file)
         except jinja2.exceptions.TemplateError as e:
             raise Exception(
                 f"Failed creating jinja creator for file '{template_file}'\n" + str(e)
             )
 
+    def configureTemplate(
+        self, template_file: str, template_keywords: Dict[str, Any]
+    ) -> str:
+        """Configure a Jinja2 template file from a set of keyword definitions. The configured content is returned as a string."""
+
+        creator = self.getTemplate(template_file)
+
         try:
             sys.stdout.flush()
             replacedContent = creator.render(template_keywords)
@@ -109,3 +159,21 @@ class Configurator(object):
                 template_file, template_keywords
             )
             f.write(configured_content)
+
+    def configureTemplateStream(
+        self, template_file: str, output_file: str, template_keywords: Dict[str, Any]
+    ) -> None:
+        """Configure a Jinja2 template file and write the configured output chunk by chunk
+        to an output file while the template is rendered. Template keywords may be
+        iterables that generate content lazily.
+        """
+        creator = self.getTemplate(template_file)
+
+        try:
+            sys.stdout.flush()
+            with open(output_file, "wb") as f:
+                creator.stream(template_keywords).dump(f, encoding="utf-8")
+        except (jinja2.exceptions.TemplateError) as e:
+            raise Exception(
+                "Failed rendering jinja template '" + template_file + "'\n" + str(e)
+            )
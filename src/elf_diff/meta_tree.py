@@ -47,6 +47,10 @@ class Node_(TreeAddressable):
         self._children = {}  # type: Dict[str, Node_]
         self._parent = None  # type: Optional[Node_]
 
+        # A factory for value tree nodes, compiled and cached on first use by
+        # value_tree.getNodeFactory(...)
+        self._value_node_factory = None  # type: Optional[Callable[[], Any]]
+
         self.parseOptionalArgs(*args)
 
     def parseOptionalArgs(self, *args: Any) -> None:
@@ -76,17 +76,26 @@ class AliasType(Property):
         self._alias = alias
 
 
+class Transient(Property):
+    """Marks nodes and values that are available to templates and plugins
+    but are not exported when the document tree is traversed"""
+
+    pass
+
+
 class Properties(object):
     TYPE_MAPPINGS: Dict[Type_[Property], str] = {
         Doc: "_doc",
         Type: "_type",
         AliasType: "_alias_type",
+        Transient: "_transient",
     }
 
     def __init__(self, *args):
         self._doc: Optional[Doc] = None
         self._type: Optional[Type_] = None
         self._alias_type: Optional[AliasType] = None
+        self._transient: Optional[Transient] = None
 
         self._args = args
 
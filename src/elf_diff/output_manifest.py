@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+import hashlib
+import json
+import os
+from shutil import copyfile
+from typing import Dict, Optional
+
+# The manifest is stored in the output directory
+MANIFEST_FILENAME = "elf_diff_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def contentHash(content: bytes) -> str:
+    """Return the hash that identifies the content of an output file"""
+    return hashlib.sha256(content).hexdigest()
+
+
+class OutputManifest(object):
+    """Keeps track of the files written to an output directory.
+
+    In incremental mode, the content hashes of all files of a previous run
+    are read from the manifest. Files whose content did not change are not
+    written again and files that are no longer generated are removed.
+    Without incremental mode, all files are written.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        incremental: bool,
+        previous_file_hashes: Optional[Dict[str, str]] = None,
+    ):
+        self.output_dir: str = output_dir
+        self.incremental: bool = incremental
+        self._previous_file_hashes: Dict[str, str]
+        if previous_file_hashes is not None:
+            self._previous_file_hashes = previous_file_hashes
+        elif incremental:
+            self._previous_file_hashes = self._readManifest()
+        else:
+            self._previous_file_hashes = {}
+        # Hashes of the files of the current run by path relative to the output directory
+        self.file_hashes: Dict[str, str] = {}
+        self.num_written: int = 0
+        self.num_unchanged: int = 0
+        self.num_removed: int = 0
+
+    def getManifestPath(self) -> str:
+        """Return the path of the manifest file"""
+        return os.path.join(self.output_dir, MANIFEST_FILENAME)
+
+    def _readManifest(self) -> Dict[str, str]:
+        """Return the file hashes stored by a previous run"""
+        manifest_path = self.getManifestPath()
+        if not os.path.isfile(manifest_path):
+            return {}
+        try:
+            with open(manifest_path, "r") as f:
+                manifest = json.load(f)
+        except ValueError:
+            # A corrupt manifest causes all files to be written
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest["files"]
+
+    def _relPath(self, path: str) -> str:
+        return os.path.relpath(path, self.output_dir).replace(os.sep, "/")
+
+    def _isUnchanged(self, rel_path: str, file_hash: str, path: str) -> bool:
+        return (
+            self.incremental
+            and (self._previous_file_hashes.get(rel_path) == file_hash)
+            and os.path.isfile(path)
+        )
+
+    def writeFile(self, path: str, content: str) -> None:
+        """Write text content to a file below the output directory (UTF-8 encoded)"""
+        content_bytes = content.encode("utf-8")
+        rel_path = self._relPath(path)
+        file_hash = contentHash(content_bytes)
+        self.file_hashes[rel_path] = file_hash
+        if self._isUnchanged(rel_path, file_hash, path):
+            self.num_unchanged += 1
+            return
+        with open(path, "wb") as f:
+            f.write(content_bytes)
+        self.num_written += 1
+
+    def copyFile(self, source_path: str, path: str) -> None:
+        """Copy a file to a location below the output directory"""
+        with open(source_path, "rb") as f:
+            file_hash = contentHash(f.read())
+        rel_path = self._relPath(path)
+        self.file_hashes[rel_path] = file_hash
+        if self._isUnchanged(rel_path, file_hash, path):
+            self.num_unchanged += 1
+            return
+        copyfile(source_path, path)
+        self.num_written += 1
+
+    def copyTree(self, source_dir: str, target_dir: str) -> None:
+        """Copy the content of a directory recursively to a directory below the output directory"""
+        for dir_path, _, filenames in os.walk(source_dir):
+            target_dir_path = os.path.join(
+                target_dir, os.path.relpath(dir_path, source_dir)
+            )
+            os.makedirs(target_dir_path, exist_ok=True)
+            for filename in filenames:
+                self.copyFile(
+                    os.path.join(dir_path, filename),
+                    os.path.join(target_dir_path, filename),
+                )
+
+    def spawn(self) -> "OutputManifest":
+        """Return an empty manifest for the same output directory that shares the
+        state of the previous run (used to record files written by worker processes)
+        """
+        return OutputManifest(
+            self.output_dir, self.incremental, self._previous_file_hashes
+        )
+
+    def merge(self, other: "OutputManifest") -> None:
+        """Merge the files recorded by a spawned manifest"""
+        self.file_hashes.update(other.file_hashes)
+        self.num_written += other.num_written
+        self.num_unchanged += other.num_unchanged
+
+    def finish(self) -> None:
+        """Remove stale files and store the manifest (incremental mode only)"""
+        manifest_path = self.getManifestPath()
+        if not self.incremental:
+            # A manifest would not match the files written
+            if os.path.isfile(manifest_path):
+                os.remove(manifest_path)
+            return
+
+        for rel_path in sorted(self._previous_file_hashes.keys()):
+            if rel_path in self.file_hashes:
+                continue
+            # Never remove anything outside the output directory
+            if os.path.isabs(rel_path) or (".." in rel_path.split("/")):
+                continue
+            path = os.path.join(self.output_dir, rel_path)
+            if os.path.isfile(path):
+                os.remove(path)
+                self.num_removed += 1
+
+        with open(manifest_path, "w") as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "files": self.file_hashes},
+                f,
+                indent=1,
+                sort_keys=True,
+            )
+        self._previous_file_hashes = self.file_hashes
+
+    def getSummary(self) -> str:
+        """Return a summary of the file operations"""
+        return f"{self.num_written} files written, {self.num_unchanged} unchanged, {self.num_removed} stale files removed"
@@ -36,19 +36,66 @@ from elf_diff.binary import Binary
 from elf_diff.binary_pair import BinaryPair, BinaryPairSettings
 from elf_diff.git import gitRepoInfo
 import elf_diff.string_diff as string_diff
+from elf_diff.diff_cache import getDiffCache
+import elf_diff.size_analytics as size_analytics
+import elf_diff.size_rollups as size_rollups
 from elf_diff.symbol import Symbol as ElfSymbol
-from elf_diff.binary_pair import SimilarityPair
+from elf_diff.binary_pair import SimilarityPair, RenamedPair, PairAnalysis
 from elf_diff.settings import Settings
+from elf_diff.document_parts import (
+    DOCUMENT_PARTS,
+    DOCUMENT_PART_SYMBOL_CLASSES,
+    DOCUMENT_PART_SIZE_ANALYTICS,
+    DOCUMENT_PART_ROLLUPS,
+)
 from elf_diff.meta_tree import Node_, Node, Value, Multiple
-from elf_diff.value_tree import Node as ValueTreeNode
-from elf_diff.meta_tree_properties import Properties, Doc, Type, AliasType
+from elf_diff.value_tree import (
+    Node as ValueTreeNode,
+    getNodeFactory,
+    trustedAssignments,
+    validateTree,
+    LazyNodeDict,
+)
+from elf_diff.meta_tree_properties import (
+    Properties,
+    Doc,
+    Type,
+    AliasType,
+    Transient,
+)
 import datetime
 import sys
 import progressbar  # type: ignore # Make mypy ignore this module
-from typing import Dict, Union, Tuple, Any, Optional, Collection
+import typing
+from typing import Dict, Union, Tuple, Any, Collection, Optional, Set, List
 
 ELF_DIFF_DOCUMENT_VERSION = 1
 
+# The symbol classes of the document's symbol dictionaries (document.symbols.*)
+SYMBOL_CLASSES = [
+    "old",
+    "new",
+    "appeared",
+    "disappeared",
+    "persisting",
+    "similar",
+    "migrated",
+    "renamed",
+]
+
+# Symbol classes whose entries have a size delta
+SYMBOL_CLASSES_WITH_SIZE_DELTA = [
+    "appeared",
+    "disappeared",
+    "persisting",
+    "similar",
+    "migrated",
+    "renamed",
+]
+
+# An entry of a symbol dictionary: id, old symbol and new symbol (None if not applicable)
+SymbolClassEntry = Tuple[int, Optional[ElfSymbol], Optional[ElfSymbol]]
+
 
 def _typeName(obj: Any) -> str:
     """Returns the (shortest possible) type name of an object"""
@@ -79,26 +126,9 @@ def _configureChildValueTreeNode(
     )
 
 
-def _generateValueTree(
-    node: Node_, parent_value_tree_node: Optional[ValueTreeNode] = None
-) -> ValueTreeNode:
-    """Recursively attach a value tree to the meta tree"""
-    value_tree_node = ValueTreeNode()
-    value_tree_node.attachMetaTreeNode(node)
-
-    for value in node._values.values():
-        setattr(value_tree_node, value._name, None)
-
-    if parent_value_tree_node is not None:
-        parent_value_tree_node.addChild(node._name, value_tree_node)
-
-    node.forEachChild(
-        lambda parent, child, value_tree_node=value_tree_node: _generateValueTree(
-            child, value_tree_node
-        )
-    )
-
-    return value_tree_node
+def _generateValueTree(node: Node_) -> ValueTreeNode:
+    """Create a value tree for a meta tree node"""
+    return getNodeFactory(node)()
 
 
 class Symbol(Node_):
@@ -181,7 +211,7 @@ class DisplayInfo(Node_):
             Value(
                 "symbol_class",
                 Doc(
-                    "The class of symbol old/new/appeared/disappeared/persisting/similar"
+                    "The class of symbol old/new/appeared/disappeared/persisting/similar/migrated/renamed"
                 ),
                 Type(str),
             ),
@@ -348,6 +378,65 @@ class MigratedSymbol(Node_):
         )
 
 
+class RenamedSymbol(Node_):
+    """A renamed symbol, i.e. a pair of disappeared and appeared symbols with identical instructions"""
+
+    def __init__(self):
+        super().__init__(
+            "renamed_symbol",
+            DisplayInfo(),
+            RelatedSymbols(),
+            Multiple(
+                ["old", "new"],
+                Node(
+                    "",
+                    Value(
+                        "signature_tagged",
+                        Doc(
+                            "A tagged version of the symbol signature. Taggs '%s' and '%s' must be replaced accordingly, e.g. for highlighting."
+                            % (
+                                string_diff.HIGHLIGHT_START_TAG,
+                                string_diff.HIGHLIGHT_END_TAG,
+                            )
+                        ),
+                        Type(str),
+                    ),
+                ),
+            ),
+        )
+        self.connectNodes()
+
+    def configureValueTree(self, value_tree_node: ValueTreeNode, **kwargs: Any) -> None:
+        """Configure the renamed symbol's associated value tree node from a renamed pair"""
+        settings: Settings = kwargs["settings"]
+        renamed_pair: RenamedPair = kwargs["renamed_pair"]
+        _configureChildValueTreeNode(
+            "display_info",
+            value_tree_node,
+            settings=settings,
+            symbol_class="renamed",
+            symbol1=renamed_pair.old_symbol,
+            symbol2=renamed_pair.new_symbol,
+        )
+        _configureChildValueTreeNode(
+            "related_symbols",
+            value_tree_node,
+            old_symbol=renamed_pair.old_symbol,
+            new_symbol=renamed_pair.new_symbol,
+        )
+        (
+            value_tree_node.old.signature_tagged,
+            value_tree_node.new.signature_tagged,
+        ) = getDiffCache(settings).getOrCompute(
+            f"tag_string_diff/{string_diff.STRING_DIFF_VERSION}/{settings.string_diff_backend}",
+            renamed_pair.old_symbol.name,
+            renamed_pair.new_symbol.name,
+            lambda str1, str2: string_diff.tagStringDiff(
+                str1, str2, settings.string_diff_backend
+            ),
+        )
+
+
 class SimilarSymbols(Node_):
     """A similar symbols pair"""
 
@@ -413,13 +502,16 @@ class SimilarSymbols(Node_):
         )
 
         value_tree_node.id = id_
-        value_tree_node.old.signature_tagged = string_diff.tagStringDiffSource(
-            similarity_pair.old_symbol.name,
-            similarity_pair.new_symbol.name,
-        )
-        value_tree_node.new.signature_tagged = string_diff.tagStringDiffTarget(
+        (
+            value_tree_node.old.signature_tagged,
+            value_tree_node.new.signature_tagged,
+        ) = getDiffCache(settings).getOrCompute(
+            f"tag_string_diff/{string_diff.STRING_DIFF_VERSION}/{settings.string_diff_backend}",
             similarity_pair.old_symbol.name,
             similarity_pair.new_symbol.name,
+            lambda str1, str2: string_diff.tagStringDiff(
+                str1, str2, settings.string_diff_backend
+            ),
         )
         value_tree_node.similarities.signature = (
             similarity_pair.signature_similarity * 100.0
@@ -454,6 +546,66 @@ class SourceFile(Node_):
         value_tree_node.id = source_file.id_
 
 
+class SizeTotals(Node_):
+    def __init__(self):
+        super().__init__(
+            "size_totals",
+            Properties(Doc("Size totals of a group of symbols"), Type(int)),
+            Value("old", Doc("Overall number of bytes in the old version")),
+            Value("new", Doc("Overall number of bytes in the new version")),
+            Value("delta", Doc("Change to the number of bytes")),
+        )
+        self.connectNodes()
+
+    def configureValueTree(self, value_tree_node: ValueTreeNode, **kwargs: Any) -> None:
+        """Configure the size totals"""
+        size_totals: size_analytics.SizeTotals = kwargs["size_totals"]
+
+        value_tree_node.old = size_totals.old
+        value_tree_node.new = size_totals.new
+        value_tree_node.delta = size_totals.delta
+
+
+class RollupEntry(Node_):
+    def __init__(self):
+        super().__init__(
+            "rollup_entry",
+            Properties(
+                Doc("Aggregated sizes of all symbols within a scope"), Type(int)
+            ),
+            Value("name", Doc("The name of the scope"), Type(str)),
+            Value("old", Doc("Overall number of bytes in the old version")),
+            Value("new", Doc("Overall number of bytes in the new version")),
+            Value("delta", Doc("Change to the number of bytes")),
+            Value("appeared", Doc("Overall number of bytes of appeared symbols")),
+            Value("disappeared", Doc("Overall number of bytes of disappeared symbols")),
+            Value(
+                "children",
+                Doc("Nested scopes by name (dict values of type RollupEntry)"),
+                Type(dict),
+            ),
+        )
+        self.connectNodes()
+
+    def configureValueTree(self, value_tree_node: ValueTreeNode, **kwargs: Any) -> None:
+        """Configure the rollup entry and recursively its children"""
+        rollup_entry: size_rollups.RollupEntry = kwargs["rollup_entry"]
+
+        value_tree_node.name = rollup_entry.name
+        value_tree_node.old = rollup_entry.old
+        value_tree_node.new = rollup_entry.new
+        value_tree_node.delta = rollup_entry.delta
+        value_tree_node.appeared = rollup_entry.appeared
+        value_tree_node.disappeared = rollup_entry.disappeared
+
+        children: Dict[str, ValueTreeNode] = {}
+        for name, child in rollup_entry.children.items():
+            node = _generateValueTree(self)
+            self.configureValueTree(node, rollup_entry=child)
+            children[name] = node
+        value_tree_node.children = children
+
+
 SYMBOL_TYPES: Tuple = (
     Symbol,
     PersistingSymbol,
@@ -461,6 +613,7 @@ SYMBOL_TYPES: Tuple = (
     DisappearedSymbol,
     SimilarSymbols,
     MigratedSymbol,
+    RenamedSymbol,
 )
 
 SymbolType = Union[
@@ -471,8 +624,12 @@ SymbolType = Union[
     DisappearedSymbol,
     SimilarSymbols,
     MigratedSymbol,
+    RenamedSymbol,
 ]
 
+# Meta tree nodes whose value trees are created per dict entry of the document
+DynamicNodeType = Union[SymbolType, SizeTotals, RollupEntry]
+
 
 class MetaDocument(Node_):
     """A meta document"""
@@ -577,6 +734,16 @@ class MetaDocument(Node_):
                     "display_migrated_symbols",
                     Doc("True if migrated symbols are supposed to be displayed"),
                 ),
+                Value(
+                    "display_renamed_symbols_overview",
+                    Doc(
+                        "True if an overview about renamed symbols is supposed to be displayed"
+                    ),
+                ),
+                Value(
+                    "display_renamed_symbols",
+                    Doc("True if renamed symbols are supposed to be displayed"),
+                ),
                 Value(
                     "debug_info_available",
                     Doc(
@@ -733,6 +900,110 @@ class MetaDocument(Node_):
                         Properties(Doc(None)),
                         Value("count", Doc("Number of symbols"), Type(int)),
                     ),
+                    Node(
+                        "renamed",
+                        Properties(Doc(None)),
+                        Value("count", Doc("Number of symbols"), Type(int)),
+                    ),
+                ),
+                Node(
+                    "size_analytics",
+                    Properties(Doc("Statistics about symbol sizes and size changes")),
+                    Value(
+                        "largest_growth",
+                        Doc(
+                            "Ids of the old versions of the persisting symbols with the largest size increase, largest first"
+                        ),
+                        Type(list),
+                    ),
+                    Value(
+                        "largest_shrinkage",
+                        Doc(
+                            "Ids of the old versions of the persisting symbols with the largest size decrease, largest first"
+                        ),
+                        Type(list),
+                    ),
+                    Node(
+                        "delta_percentiles",
+                        Properties(
+                            Doc("Percentiles of the size deltas of persisting symbols"),
+                            Type(float),
+                        ),
+                        *[
+                            Value(f"p{percentile}", Doc(f"{percentile}th percentile"))
+                            for percentile in size_analytics.DELTA_PERCENTILES
+                        ],
+                    ),
+                    Node(
+                        "delta_histogram",
+                        Properties(
+                            Doc(
+                                "Histogram of the size deltas of persisting symbols whose size changed"
+                            ),
+                            Type(list),
+                        ),
+                        Value("counts", Doc("Number of symbols per bin")),
+                        Value(
+                            "bin_edges",
+                            Doc("Bin edges in bytes (one more than there are bins)"),
+                        ),
+                    ),
+                    Value(
+                        "by_type",
+                        Doc(
+                            "Size totals of all selected symbols by nm symbol type (dict values of type SizeTotals)"
+                        ),
+                        Type(dict),
+                    ),
+                    Node(
+                        "by_memory_class",
+                        Properties(Doc("Size totals of all selected symbols")),
+                        Multiple(
+                            ["program_memory", "ram"],
+                            Node(
+                                "",
+                                Properties(Doc(None), Type(int)),
+                                Value(
+                                    "old",
+                                    Doc("Overall number of bytes in the old version"),
+                                ),
+                                Value(
+                                    "new",
+                                    Doc("Overall number of bytes in the new version"),
+                                ),
+                                Value("delta", Doc("Change to the number of bytes")),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            Node(
+                "rollups",
+                Properties(
+                    Doc(
+                        "Sizes of old and new symbols aggregated by namespace, class and source directory"
+                    )
+                ),
+                Value(
+                    "by_namespace",
+                    Doc("Root of the namespace hierarchy"),
+                    Type(ValueTreeNode),
+                    AliasType(RollupEntry),
+                ),
+                Value(
+                    "by_class",
+                    Doc(
+                        "Symbols directly contained in a class or namespace by its full name (dict values of type RollupEntry)"
+                    ),
+                    Type(dict),
+                ),
+                Value(
+                    "by_source_directory",
+                    Doc(
+                        "Root of the source directory hierarchy (source file paths with prefix stripped)"
+                    ),
+                    Type(ValueTreeNode),
+                    AliasType(RollupEntry),
                 ),
             ),
             Node(
@@ -781,6 +1052,63 @@ class MetaDocument(Node_):
                         "Migrated symbols by symbol id (dict values of type MigratedSymbol)"
                     ),
                 ),
+                Value(
+                    "renamed",
+                    Doc(
+                        "Renamed symbols by old symbol id (dict values of type RenamedSymbol)"
+                    ),
+                ),
+            ),
+            Node(
+                "indexes",
+                Properties(
+                    Doc(
+                        "Secondary indexes of the symbol dicts by symbol class (not exported)"
+                    ),
+                    Transient(),
+                ),
+                Multiple(
+                    SYMBOL_CLASSES,
+                    Node(
+                        "symbol_class",
+                        Properties(Doc("Indexes of the symbol dict of the same name")),
+                        Value(
+                            "by_name",
+                            Doc(
+                                "Lists of ids of dict entries by the names of the symbols they refer to"
+                            ),
+                            Type(dict),
+                        ),
+                        Value(
+                            "by_source_file",
+                            Doc(
+                                "Lists of ids of dict entries by source file path (with prefix stripped)"
+                            ),
+                            Type(dict),
+                        ),
+                        Value(
+                            "by_size",
+                            Doc(
+                                "Ids of dict entries sorted by size (of the new symbol for symbol pairs), largest first"
+                            ),
+                            Type(list),
+                        ),
+                        Value(
+                            "by_size_delta",
+                            Doc(
+                                "Ids of dict entries sorted by size delta, largest growth first (not available for old and new symbols)"
+                            ),
+                            Type(list),
+                        ),
+                        Value(
+                            "by_similarity",
+                            Doc(
+                                "Ids of dict entries sorted by signature similarity, most similar first (only available for similar symbols)"
+                            ),
+                            Type(list),
+                        ),
+                    ),
+                ),
             ),
         )
         self.connectNodes()
@@ -793,17 +1121,21 @@ class MetaDocument(Node_):
         symbol_class: str,
     ) -> None:
         """Setup (new/old) elf symbols from a symbol list"""
-        value_tree_nodes: Dict[int, ValueTreeNode] = {}
         node = Symbol()
         node._name = "%s_symbol" % symbol_class
-        print(f"Adding {symbol_class} symbols to document")
-        sys.stdout.flush()
-        for symbol in progressbar.progressbar(symbols):
-            value_tree = _generateValueTree(node)
-            node.configureValueTree(value_tree, symbol=symbol)
-            value_tree_nodes[symbol.id_] = value_tree
-
-        setattr(document.symbols, symbol_class, value_tree_nodes)
+        create_node = getNodeFactory(node)
+        symbols_by_id: Dict[int, ElfSymbol] = {symbol.id_: symbol for symbol in symbols}
+
+        def createSymbolNode(id_: int) -> ValueTreeNode:
+            value_tree = create_node()
+            node.configureValueTree(value_tree, symbol=symbols_by_id[id_])
+            return value_tree
+
+        setattr(
+            document.symbols,
+            symbol_class,
+            LazyNodeDict(symbols_by_id.keys(), createSymbolNode),
+        )
 
     def setupOldSymbolsDict(self, document: ValueTreeNode, settings: Settings) -> None:
         """Setup a dictionary of old symbols"""
@@ -821,126 +1153,169 @@ class MetaDocument(Node_):
         self, document: ValueTreeNode, settings: Settings
     ) -> None:
         """Setup a dictionary of persisting symbols"""
-        value_tree_nodes: Dict[int, ValueTreeNode] = {}
         meta_node = PersistingSymbol()
         meta_node._name = "persisting_symbol"
-        print("Adding persisting symbols to document")
-        sys.stdout.flush()
-        for symbol_name in progressbar.progressbar(
-            self.binary_pair.persisting_symbol_names
-        ):
-            old_symbol: ElfSymbol = self.binary_pair.old_binary.symbols[symbol_name]
-            new_symbol: ElfSymbol = self.binary_pair.new_binary.symbols[symbol_name]
+        create_node = getNodeFactory(meta_node)
+        symbol_names: Dict[int, str] = {
+            self.binary_pair.old_binary.symbols[symbol_name].id_: symbol_name
+            for symbol_name in self.binary_pair.analysis.persisting_symbol_names
+        }
+
+        def createPersistingSymbolNode(id_: int) -> ValueTreeNode:
+            old_symbol: ElfSymbol = self.binary_pair.old_binary.symbols[
+                symbol_names[id_]
+            ]
+            new_symbol: ElfSymbol = self.binary_pair.new_binary.symbols[
+                symbol_names[id_]
+            ]
 
-            node = _generateValueTree(meta_node)
+            node = create_node()
             meta_node.configureValueTree(
                 node, settings=settings, old_symbol=old_symbol, new_symbol=new_symbol
             )
             node.related_symbols.old = document.symbols.old[old_symbol.id_]
             node.related_symbols.new = document.symbols.new[new_symbol.id_]
-            value_tree_nodes[old_symbol.id_] = node
+            return node
 
-        setattr(document.symbols, "persisting", value_tree_nodes)
+        document.symbols.persisting = LazyNodeDict(
+            symbol_names.keys(), createPersistingSymbolNode
+        )
 
     def setupAppearedSymbolsDict(
         self, document: ValueTreeNode, settings: Settings
     ) -> None:
         """Setup a dictionary of appeared symbols"""
-        value_tree_nodes: Dict[int, ValueTreeNode] = {}
         meta_node = AppearedSymbol()
         meta_node._name = "appeared_symbol"
-        print("Adding appeared symbols to document")
-        sys.stdout.flush()
-        for symbol_name in progressbar.progressbar(
-            self.binary_pair.appeared_symbol_names
-        ):
+        create_node = getNodeFactory(meta_node)
+        appeared_symbols: Dict[int, ElfSymbol] = {}
+        for symbol_name in self.binary_pair.appeared_symbol_names:
             appeared_symbol: ElfSymbol = self.binary_pair.new_binary.symbols[
                 symbol_name
             ]
+            appeared_symbols[appeared_symbol.id_] = appeared_symbol
 
-            node = _generateValueTree(meta_node)
+        def createAppearedSymbolNode(id_: int) -> ValueTreeNode:
+            node = create_node()
             meta_node.configureValueTree(
-                node, settings=settings, symbol=appeared_symbol
+                node, settings=settings, symbol=appeared_symbols[id_]
             )
-            node.actual = document.symbols.new[appeared_symbol.id_]
-            value_tree_nodes[appeared_symbol.id_] = node
+            node.actual = document.symbols.new[id_]
+            return node
 
-        setattr(document.symbols, "appeared", value_tree_nodes)
+        document.symbols.appeared = LazyNodeDict(
+            appeared_symbols.keys(), createAppearedSymbolNode
+        )
 
     def setupDisappearedSymbolsDict(
         self, document: ValueTreeNode, settings: Settings
     ) -> None:
         """Setup a dictionary of disappeared symbols"""
-        value_tree_nodes: Dict[int, ValueTreeNode] = {}
         meta_node = DisappearedSymbol()
         meta_node._name = "disappeared_symbol"
-        print("Adding disappeared symbols to document")
-        sys.stdout.flush()
-        for symbol_name in progressbar.progressbar(
-            self.binary_pair.disappeared_symbol_names
-        ):
+        create_node = getNodeFactory(meta_node)
+        disappeared_symbols: Dict[int, ElfSymbol] = {}
+        for symbol_name in self.binary_pair.disappeared_symbol_names:
             disappeared_symbol: ElfSymbol = self.binary_pair.old_binary.symbols[
                 symbol_name
             ]
+            disappeared_symbols[disappeared_symbol.id_] = disappeared_symbol
 
-            node = _generateValueTree(meta_node)
+        def createDisappearedSymbolNode(id_: int) -> ValueTreeNode:
+            node = create_node()
             meta_node.configureValueTree(
-                node, settings=settings, symbol=disappeared_symbol
+                node, settings=settings, symbol=disappeared_symbols[id_]
             )
-            node.actual = document.symbols.old[disappeared_symbol.id_]
-            value_tree_nodes[disappeared_symbol.id_] = node
+            node.actual = document.symbols.old[id_]
+            return node
 
-        setattr(document.symbols, "disappeared", value_tree_nodes)
+        document.symbols.disappeared = LazyNodeDict(
+            disappeared_symbols.keys(), createDisappearedSymbolNode
+        )
 
     def setupSimilarSymbolsDict(
         self, document: ValueTreeNode, settings: Settings
     ) -> None:
         """Setup a dictionary of similar symbol pairs"""
-        value_tree_nodes: Dict[int, ValueTreeNode] = {}
         meta_node = SimilarSymbols()
         meta_node._name = "similar_symbols"
-        id_ = 0
-        print("Adding similar symbols to document")
-        sys.stdout.flush()
-        for i in progressbar.progressbar(range(len(self.binary_pair.similar_symbols))):
-            similarity_pair: SimilarityPair = self.binary_pair.similar_symbols[i]
-            old_symbol = similarity_pair.old_symbol
-            new_symbol = similarity_pair.new_symbol
-            node = _generateValueTree(meta_node)
+        create_node = getNodeFactory(meta_node)
+
+        def createSimilarSymbolsNode(id_: int) -> ValueTreeNode:
+            similarity_pair: SimilarityPair = self.binary_pair.similar_symbols[id_]
+            node = create_node()
             meta_node.configureValueTree(
                 node, settings=settings, similarity_pair=similarity_pair, id_=id_
             )
-            node.related_symbols.old = document.symbols.old[old_symbol.id_]
-            node.related_symbols.new = document.symbols.new[new_symbol.id_]
-            value_tree_nodes[id_] = node
-            id_ += 1
+            node.related_symbols.old = document.symbols.old[
+                similarity_pair.old_symbol.id_
+            ]
+            node.related_symbols.new = document.symbols.new[
+                similarity_pair.new_symbol.id_
+            ]
+            return node
 
-        setattr(document.symbols, "similar", value_tree_nodes)
+        document.symbols.similar = LazyNodeDict(
+            range(len(self.binary_pair.similar_symbols)), createSimilarSymbolsNode
+        )
 
     def setupMigratedSymbolsDict(
         self, document: ValueTreeNode, settings: Settings
     ) -> None:
         """Setup a dictionary of migrated symbols"""
-        value_tree_nodes: Dict[int, ValueTreeNode] = {}
         meta_node = MigratedSymbol()
         meta_node._name = "migrated_symbol"
-        print("Adding migrated symbols to document")
-        sys.stdout.flush()
-        for symbol_name in progressbar.progressbar(
-            self.binary_pair.migrated_symbol_names
-        ):
-            old_symbol: ElfSymbol = self.binary_pair.old_binary.symbols[symbol_name]
-            new_symbol: ElfSymbol = self.binary_pair.new_binary.symbols[symbol_name]
+        create_node = getNodeFactory(meta_node)
+        symbol_names: Dict[int, str] = {
+            self.binary_pair.old_binary.symbols[symbol_name].id_: symbol_name
+            for symbol_name in self.binary_pair.migrated_symbol_names
+        }
+
+        def createMigratedSymbolNode(id_: int) -> ValueTreeNode:
+            old_symbol: ElfSymbol = self.binary_pair.old_binary.symbols[
+                symbol_names[id_]
+            ]
+            new_symbol: ElfSymbol = self.binary_pair.new_binary.symbols[
+                symbol_names[id_]
+            ]
 
-            node = _generateValueTree(meta_node)
+            node = create_node()
             meta_node.configureValueTree(
                 node, settings=settings, old_symbol=old_symbol, new_symbol=new_symbol
             )
             node.related_symbols.old = document.symbols.old[old_symbol.id_]
             node.related_symbols.new = document.symbols.new[new_symbol.id_]
-            value_tree_nodes[old_symbol.id_] = node
+            return node
 
-        setattr(document.symbols, "migrated", value_tree_nodes)
+        document.symbols.migrated = LazyNodeDict(
+            symbol_names.keys(), createMigratedSymbolNode
+        )
+
+    def setupRenamedSymbolsDict(
+        self, document: ValueTreeNode, settings: Settings
+    ) -> None:
+        """Setup a dictionary of renamed symbols"""
+        meta_node = RenamedSymbol()
+        meta_node._name = "renamed_symbol"
+        create_node = getNodeFactory(meta_node)
+        renamed_pairs: Dict[int, RenamedPair] = {
+            renamed_pair.old_symbol.id_: renamed_pair
+            for renamed_pair in self.binary_pair.renamed_symbols
+        }
+
+        def createRenamedSymbolNode(id_: int) -> ValueTreeNode:
+            renamed_pair: RenamedPair = renamed_pairs[id_]
+            node = create_node()
+            meta_node.configureValueTree(
+                node, settings=settings, renamed_pair=renamed_pair
+            )
+            node.related_symbols.old = document.symbols.old[renamed_pair.old_symbol.id_]
+            node.related_symbols.new = document.symbols.new[renamed_pair.new_symbol.id_]
+            return node
+
+        document.symbols.renamed = LazyNodeDict(
+            renamed_pairs.keys(), createRenamedSymbolNode
+        )
 
     @staticmethod
     def _setupSourceFilesDict(
@@ -968,22 +1343,223 @@ class MetaDocument(Node_):
         )
         document.files.input.new.source_files = new_value_tree_nodes
 
+    @staticmethod
+    def _createRollupEntryMetaNode(name: str) -> RollupEntry:
+        """Create the meta tree node of a rollup. It is shared by all its entries."""
+        meta_node = RollupEntry()
+        meta_node._name = name
+        return meta_node
+
+    @staticmethod
+    def _setupRollupEntry(
+        meta_node: RollupEntry, rollup_entry: size_rollups.RollupEntry
+    ) -> ValueTreeNode:
+        """Setup the value tree of a rollup entry and its children"""
+        node = _generateValueTree(meta_node)
+        meta_node.configureValueTree(node, rollup_entry=rollup_entry)
+        return node
+
+    def setupRollups(self, document: ValueTreeNode) -> None:
+        """Setup the size rollups"""
+        print("Computing size rollups")
+        sys.stdout.flush()
+        rollups = size_rollups.SizeRollups(self.binary_pair)
+
+        document.rollups.by_namespace = MetaDocument._setupRollupEntry(
+            MetaDocument._createRollupEntryMetaNode("namespace_rollup"),
+            rollups.by_namespace,
+        )
+        document.rollups.by_source_directory = MetaDocument._setupRollupEntry(
+            MetaDocument._createRollupEntryMetaNode("source_directory_rollup"),
+            rollups.by_source_directory,
+        )
+        class_meta_node = MetaDocument._createRollupEntryMetaNode("class_rollup")
+        document.rollups.by_class = {
+            name: MetaDocument._setupRollupEntry(class_meta_node, rollup_entry)
+            for name, rollup_entry in rollups.by_class.items()
+        }
+
+    def setupSizeAnalytics(self, document: ValueTreeNode) -> None:
+        """Setup the size analytics statistics"""
+        print("Computing size analytics")
+        sys.stdout.flush()
+        analytics = size_analytics.SizeAnalytics(
+            self.binary_pair.old_binary.symbols, self.binary_pair.new_binary.symbols
+        )
+        statistics: ValueTreeNode = document.statistics.size_analytics
+
+        statistics.largest_growth = analytics.largestGrowth()
+        statistics.largest_shrinkage = analytics.largestShrinkage()
+
+        for percentile, value in analytics.deltaPercentiles().items():
+            setattr(statistics.delta_percentiles, f"p{percentile}", value)
+
+        (
+            statistics.delta_histogram.counts,
+            statistics.delta_histogram.bin_edges,
+        ) = analytics.deltaHistogram()
+
+        value_tree_nodes: Dict[str, ValueTreeNode] = {}
+        meta_node = SizeTotals()
+        for type_, size_totals in analytics.totalsByType().items():
+            node = _generateValueTree(meta_node)
+            meta_node.configureValueTree(node, size_totals=size_totals)
+            value_tree_nodes[type_] = node
+        statistics.by_type = value_tree_nodes
+
+        program_memory, ram = analytics.totalsByMemoryClass()
+        for name, size_totals in (("program_memory", program_memory), ("ram", ram)):
+            node = statistics.by_memory_class.getChild(name)
+            node.old = size_totals.old
+            node.new = size_totals.new
+            node.delta = size_totals.delta
+
+    def setupSymbolClasses(self, document: ValueTreeNode, settings: Settings) -> None:
+        """Setup the dictionaries of symbols and source files"""
+        self.setupOldSymbolsDict(document, settings)
+        self.setupNewSymbolsDict(document, settings)
+
+        self.setupAppearedSymbolsDict(document, settings)
+        self.setupDisappearedSymbolsDict(document, settings)
+        self.setupPersistingSymbolsDict(document, settings)
+        self.setupSimilarSymbolsDict(document, settings)
+        self.setupMigratedSymbolsDict(document, settings)
+        self.setupRenamedSymbolsDict(document, settings)
+
+        self.setupSourceFiles(document)
+
+        MetaDocument.setupIndexes(
+            document,
+            self.symbolClassEntries(),
+            self.sourceFilePaths(),
+            {
+                id_: pair.signature_similarity
+                for id_, pair in enumerate(self.binary_pair.similar_symbols)
+            },
+        )
+
+    @staticmethod
+    def setupEmptySymbolClasses(document: ValueTreeNode) -> None:
+        """Setup empty dictionaries of symbols and source files"""
+        for symbol_class in SYMBOL_CLASSES:
+            setattr(document.symbols, symbol_class, {})
+        document.files.input.old.source_files = {}
+        document.files.input.new.source_files = {}
+        MetaDocument.setupIndexes(
+            document, {symbol_class: [] for symbol_class in SYMBOL_CLASSES}, {}, {}
+        )
+
+    def symbolClassEntries(self) -> Dict[str, List[SymbolClassEntry]]:
+        """Return the entries of the symbol dicts by symbol class in the order of the dicts"""
+        old_symbols = self.binary_pair.old_binary.symbols
+        new_symbols = self.binary_pair.new_binary.symbols
+
+        def persistingEntries(symbol_names: List[str]) -> List[SymbolClassEntry]:
+            return [
+                (old_symbols[name].id_, old_symbols[name], new_symbols[name])
+                for name in symbol_names
+            ]
+
+        return {
+            "old": [(symbol.id_, symbol, None) for symbol in old_symbols.values()],
+            "new": [(symbol.id_, None, symbol) for symbol in new_symbols.values()],
+            "appeared": [
+                (new_symbols[name].id_, None, new_symbols[name])
+                for name in self.binary_pair.appeared_symbol_names
+            ],
+            "disappeared": [
+                (old_symbols[name].id_, old_symbols[name], None)
+                for name in self.binary_pair.disappeared_symbol_names
+            ],
+            "persisting": persistingEntries(
+                self.binary_pair.analysis.persisting_symbol_names
+            ),
+            "similar": [
+                (id_, pair.old_symbol, pair.new_symbol)
+                for id_, pair in enumerate(self.binary_pair.similar_symbols)
+            ],
+            "migrated": persistingEntries(self.binary_pair.migrated_symbol_names),
+            "renamed": [
+                (pair.old_symbol.id_, pair.old_symbol, pair.new_symbol)
+                for pair in self.binary_pair.renamed_symbols
+            ],
+        }
+
+    def sourceFilePaths(self) -> Dict[int, str]:
+        """Return the paths (with prefix stripped) of the source files of both binaries by source file id"""
+        paths: Dict[int, str] = {}
+        for binary_ in (self.binary_pair.old_binary, self.binary_pair.new_binary):
+            for source_file in binary_.source_files.values():
+                paths[source_file.id_] = source_file.path_wo_prefix
+        return paths
+
+    @staticmethod
+    def setupIndexes(
+        document: ValueTreeNode,
+        entries_by_symbol_class: Dict[str, List[SymbolClassEntry]],
+        source_file_paths: Dict[int, str],
+        signature_similarities: Dict[int, float],
+    ) -> None:
+        """Setup the secondary indexes of the symbol dicts"""
+        for symbol_class, entries in entries_by_symbol_class.items():
+            index: ValueTreeNode = document.indexes.getChild(symbol_class)
+            by_name: Dict[str, List[int]] = {}
+            by_source_file: Dict[str, List[int]] = {}
+            sizes: Dict[int, int] = {}
+            size_deltas: Dict[int, int] = {}
+            for id_, old_symbol, new_symbol in entries:
+                symbols = [
+                    symbol for symbol in (old_symbol, new_symbol) if symbol is not None
+                ]
+                for name in dict.fromkeys(symbol.name for symbol in symbols):
+                    by_name.setdefault(name, []).append(id_)
+                for path in dict.fromkeys(
+                    source_file_paths[symbol.source_id]
+                    for symbol in symbols
+                    if symbol.source_id is not None
+                ):
+                    by_source_file.setdefault(path, []).append(id_)
+                sizes[id_] = symbols[-1].size
+                size_deltas[id_] = (new_symbol.size if new_symbol else 0) - (
+                    old_symbol.size if old_symbol else 0
+                )
+
+            index.by_name = by_name
+            index.by_source_file = by_source_file
+            # Sorting is stable, entries of equal size remain in the order of the dict
+            index.by_size = sorted(sizes, key=sizes.__getitem__, reverse=True)
+            if symbol_class in SYMBOL_CLASSES_WITH_SIZE_DELTA:
+                index.by_size_delta = sorted(
+                    size_deltas, key=size_deltas.__getitem__, reverse=True
+                )
+
+        document.indexes.similar.by_similarity = sorted(
+            signature_similarities, key=signature_similarities.__getitem__, reverse=True
+        )
+
     def configureValueTree(self, value_tree_node: ValueTreeNode, **kwargs: Any) -> None:
         """Configure the values of the document based on the information available
-        from the settings
+        from the settings. Only the document parts passed as document_parts
+        (default: all) are computed.
         """
         settings: Settings = kwargs["settings"]
         document = value_tree_node
+        document_parts: Set[str] = kwargs.get("document_parts", DOCUMENT_PARTS)
 
         _validateSettings(settings)
-        binary_pair_settings = BinaryPairSettings(
-            short_name="",
-            old_binary_filename=settings.old_binary_filename or "",
-            new_binary_filename=settings.new_binary_filename or "",
-        )
-        self.binary_pair = BinaryPair(
-            settings=settings, pair_settings=binary_pair_settings
-        )
+        if "binary_pair" in kwargs:
+            self.binary_pair = kwargs["binary_pair"]
+        else:
+            binary_pair_settings = BinaryPairSettings(
+                short_name="",
+                old_binary_filename=settings.old_binary_filename or "",
+                new_binary_filename=settings.new_binary_filename or "",
+            )
+            self.binary_pair = BinaryPair(
+                settings=settings,
+                pair_settings=binary_pair_settings,
+                document_parts=document_parts,
+            )
 
         old_binary: Binary = self.binary_pair.old_binary
         new_binary: Binary = self.binary_pair.new_binary
@@ -993,26 +1569,7 @@ class MetaDocument(Node_):
         else:
             doc_title = "ELF Binary Comparison"
 
-        persisting_symbols_overall_size_difference = 0
-        persisting_symbols_overall_size_old = 0
-        persisting_symbols_overall_size_new = 0
-        persisting_symbols_assembly_differs_count = 0
-
-        for symbol_name in self.binary_pair.persisting_symbol_names:
-            old_symbol: ElfSymbol = old_binary.symbols[symbol_name]
-            new_symbol: ElfSymbol = new_binary.symbols[symbol_name]
-
-            size_difference: int = new_symbol.size - old_symbol.size
-
-            if old_symbol.instructions != new_symbol.instructions:
-                persisting_symbols_assembly_differs_count += 1
-
-            if (size_difference == 0) and settings.consider_equal_sized_identical:
-                continue
-
-            persisting_symbols_overall_size_old += old_symbol.size
-            persisting_symbols_overall_size_new += new_symbol.size
-            persisting_symbols_overall_size_difference += size_difference
+        analysis: PairAnalysis = self.binary_pair.analysis
 
         symbol_selection_regex_old: str = settings.symbol_selection_regex_old or ".*"
         symbol_selection_regex_new: str = settings.symbol_selection_regex_new or ".*"
@@ -1040,10 +1597,10 @@ class MetaDocument(Node_):
         document.configuration.display_old_binary_info = settings.old_binary_info != ""
         document.configuration.display_persisting_symbols_overview = True
         document.configuration.display_similar_symbols = (
-            not settings.skip_symbol_similarities
+            self.binary_pair.similarities_computed
         )
         document.configuration.display_similar_symbols_overview = (
-            not settings.skip_symbol_similarities
+            self.binary_pair.similarities_computed
         )
         document.configuration.display_migrated_symbols = (
             self.binary_pair.debug_info_available
@@ -1051,6 +1608,8 @@ class MetaDocument(Node_):
         document.configuration.display_migrated_symbols_overview = (
             self.binary_pair.debug_info_available
         )
+        document.configuration.display_renamed_symbols = True
+        document.configuration.display_renamed_symbols_overview = True
         document.files.input.old.binary_path = settings.old_alias
         document.files.input.new.binary_path = settings.new_alias
         document.files.input.old.debug_info_available = (
@@ -1115,12 +1674,8 @@ class MetaDocument(Node_):
         document.statistics.overall.old.resource_consumption.text = (
             old_binary.symbol_sizes.text_size
         )
-        document.statistics.symbols.appeared.count = (
-            self.binary_pair.num_symbols_appeared
-        )
-        document.statistics.symbols.disappeared.count = (
-            self.binary_pair.num_symbols_disappeared
-        )
+        document.statistics.symbols.appeared.count = analysis.num_symbols_appeared
+        document.statistics.symbols.disappeared.count = analysis.num_symbols_disappeared
         document.statistics.symbols.new.count.dropped = new_binary.num_symbols_dropped
         document.statistics.symbols.new.count.selected = len(new_binary.symbols.keys())
         document.statistics.symbols.new.count.total = (
@@ -1138,34 +1693,37 @@ class MetaDocument(Node_):
         document.statistics.symbols.old.regex.exclusion = symbol_exclusion_regex_old
         document.statistics.symbols.old.regex.selection = symbol_selection_regex_old
         document.statistics.symbols.persisting.count = len(
-            self.binary_pair.persisting_symbol_names
+            analysis.persisting_symbol_names
         )
         document.statistics.symbols.persisting.assembly_differs_count = (
-            persisting_symbols_assembly_differs_count
+            analysis.persisting_symbols_assembly_differs_count
         )
         document.statistics.symbols.persisting.resource_consumption.delta = (
-            persisting_symbols_overall_size_difference
+            analysis.persisting_symbols_overall_size_difference
         )
         document.statistics.symbols.persisting.resource_consumption.old = (
-            persisting_symbols_overall_size_old
+            analysis.persisting_symbols_overall_size_old
         )
         document.statistics.symbols.persisting.resource_consumption.new = (
-            persisting_symbols_overall_size_new
+            analysis.persisting_symbols_overall_size_new
         )
         document.statistics.symbols.similar.count = len(
             self.binary_pair.similar_symbols
         )
+        document.statistics.symbols.renamed.count = len(
+            self.binary_pair.renamed_symbols
+        )
 
-        self.setupOldSymbolsDict(document, settings)
-        self.setupNewSymbolsDict(document, settings)
+        if DOCUMENT_PART_SYMBOL_CLASSES in document_parts:
+            self.setupSymbolClasses(document, settings)
+        else:
+            MetaDocument.setupEmptySymbolClasses(document)
 
-        self.setupAppearedSymbolsDict(document, settings)
-        self.setupDisappearedSymbolsDict(document, settings)
-        self.setupPersistingSymbolsDict(document, settings)
-        self.setupSimilarSymbolsDict(document, settings)
-        self.setupMigratedSymbolsDict(document, settings)
+        if DOCUMENT_PART_SIZE_ANALYTICS in document_parts:
+            self.setupSizeAnalytics(document)
 
-        self.setupSourceFiles(document)
+        if DOCUMENT_PART_ROLLUPS in document_parts:
+            self.setupRollups(document)
 
 
 def generateDocumentTree() -> ValueTreeNode:
@@ -1175,21 +1733,44 @@ def generateDocumentTree() -> ValueTreeNode:
     return value_tree
 
 
-def generateDocument(settings: Settings) -> ValueTreeNode:
-    """Generate a document and return its value tree"""
+def generateDocument(
+    settings: Settings, document_parts: Optional[Set[str]] = None
+) -> ValueTreeNode:
+    """Generate a document and return its value tree. Only the given document parts
+    (default: all) are computed. Values are assigned without validation.
+    In debug mode the finished document is validated in a single pass."""
+    if document_parts is None:
+        document_parts = set(DOCUMENT_PARTS)
+    print("Generating document parts: %s" % ", ".join(sorted(document_parts)))
+    sys.stdout.flush()
+
     meta_document = MetaDocument()
     value_tree = _generateValueTree(meta_document)
-    meta_document.configureValueTree(value_tree, settings=settings)
+    with trustedAssignments():
+        meta_document.configureValueTree(
+            value_tree, settings=settings, document_parts=document_parts
+        )
+
+    if settings.debug:
+        print("Validating document")
+        sys.stdout.flush()
+        validateTree(value_tree)
+
     return value_tree
 
 
 def getDocumentTreesOfDynamicTreeNodes():
-    """Returns a list that contains the meta tree nodes of all available symbol types (old/new/appeared/disappeared/persisting/similar)"""
+    """Returns a list that contains the meta tree nodes of all available symbol types (old/new/appeared/disappeared/persisting/similar/migrated/renamed)"""
     tree_dumps: Dict[str, ValueTreeNode] = {}
-    node_types = [SourceFile]
+    node_types: List[typing.Type[DynamicNodeType]] = [
+        SourceFile,
+        SizeTotals,
+        RollupEntry,
+    ]
     node_types += SYMBOL_TYPES
+    node_type: typing.Type[DynamicNodeType]
     for node_type in node_types:
-        symbol_entity_meta: SymbolType = node_type()
+        symbol_entity_meta: DynamicNodeType = node_type()
         symbol_entity_value = _generateValueTree(symbol_entity_meta)
         tree_dumps[node_type.__name__] = symbol_entity_value
     return tree_dumps
@@ -21,9 +21,10 @@
 from elf_diff.error_handling import warning
 from elf_diff.auxiliary import getDirectoryThatStoresModuleOfObj
 from elf_diff.settings import Settings
+from elf_diff.document_parts import DOCUMENT_PARTS, validateDocumentParts
 import importlib
 import importlib.util
-from typing import List, Type, Dict, Optional
+from typing import List, Type, Dict, Hashable, Optional, Set
 import abc
 
 
@@ -146,6 +147,31 @@ class ExportPairReportPlugin(Plugin):
     def export(self, document):
         pass
 
+    def getRequiredDocumentParts(self) -> Set[str]:
+        """Return the document parts (see elf_diff.document_parts) the plugin consumes.
+        Plugins that do not override this method require all parts."""
+        return set(DOCUMENT_PARTS)
+
+    def getHTMLRenderKey(self) -> Optional[Hashable]:
+        """Return a key that identifies the options that affect the HTML the plugin
+        renders from the document or None if it does not render HTML. Plugins with
+        equal keys share rendered fragments (see elf_diff.render_cache)."""
+        return None
+
+
+def getRequiredDocumentParts(plugins: List[Plugin]) -> Set[str]:
+    """Return the union of the document parts required by a list of plugins"""
+    document_parts: Set[str] = set()
+    for plugin in plugins:
+        if not isinstance(plugin, ExportPairReportPlugin):
+            continue
+        plugin_document_parts = plugin.getRequiredDocumentParts()
+        validateDocumentParts(
+            plugin_document_parts, "Plugin %s" % type(plugin).__name__
+        )
+        document_parts |= plugin_document_parts
+    return document_parts
+
 
 PLUGIN_TYPES: List[Type[Plugin]] = [ExportPairReportPlugin]
 
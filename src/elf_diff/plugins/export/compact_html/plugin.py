@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff.plugin import (
+    ExportPairReportPlugin,
+    PluginConfigurationKey,
+    PluginConfigurationInformation,
+)
+from elf_diff.jinja import Configurator
+from elf_diff.auxiliary import getDirectoryThatStoresModule
+from elf_diff.pair_report_document import ValueTreeNode
+from elf_diff.settings import Settings
+from elf_diff.document_parts import (
+    DOCUMENT_PART_SYMBOL_CLASSES,
+    DOCUMENT_PART_INSTRUCTIONS,
+    DOCUMENT_PART_SIMILARITIES,
+)
+import base64
+import gzip
+import json
+import os
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+DEFAULT_COMPACT_REPORT_OUTPUT_FILE = "elf_diff_compact_report.html"
+DEFAULT_TEMPLATE_DIRECTORY: str = os.path.join(
+    getDirectoryThatStoresModule(sys.modules[__name__]), "j2"
+)
+# Instructions are embedded in chunks of roughly this many characters (uncompressed)
+DEFAULT_CHUNK_SIZE = 262144
+
+# Symbol classes in the order they are displayed, with the symbol dict index
+# that defines the order of their overview tables
+COMPACT_REPORT_SYMBOL_CLASSES: List[Tuple[str, str]] = [
+    ("persisting", "by_size_delta"),
+    ("disappeared", "by_size"),
+    ("appeared", "by_size"),
+    ("similar", "by_similarity"),
+    ("migrated", "by_size_delta"),
+    ("renamed", "by_size"),
+]
+
+# Key of the instructions of a symbol in an instruction chunk
+InstructionKey = Tuple[str, int]
+
+
+def encodeChunk(data: Any) -> str:
+    """Encode JSON serializable data as base64 encoded gzip compressed JSON"""
+    json_bytes = json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    # A constant mtime makes the output reproducible
+    return base64.b64encode(gzip.compress(json_bytes, mtime=0)).decode("ascii")
+
+
+def decodeChunk(chunk: str) -> Any:
+    """Decode data encoded by encodeChunk"""
+    return json.loads(gzip.decompress(base64.b64decode(chunk)).decode("utf-8"))
+
+
+class InstructionChunks(object):
+    """Assigns the instructions of symbols to chunks of limited size"""
+
+    def __init__(self, chunk_size: int):
+        self._chunk_size: int = chunk_size
+        self._chunk_by_key: Dict[InstructionKey, int] = {}
+        self._chunks: List[List[Tuple[InstructionKey, str]]] = [[]]
+        self._current_size: int = 0
+
+    def add(self, side: str, symbol: ValueTreeNode) -> Optional[int]:
+        """Assign the instructions of a symbol to a chunk and return the chunk index"""
+        if not symbol.instructions:
+            return None
+        key: InstructionKey = (side, symbol.id)
+        chunk_index = self._chunk_by_key.get(key)
+        if chunk_index is not None:
+            return chunk_index
+        if self._chunks[-1] and (
+            self._current_size + len(symbol.instructions) > self._chunk_size
+        ):
+            self._chunks.append([])
+            self._current_size = 0
+        self._chunks[-1].append((key, symbol.instructions))
+        self._current_size += len(symbol.instructions)
+        chunk_index = len(self._chunks) - 1
+        self._chunk_by_key[key] = chunk_index
+        return chunk_index
+
+    def generateEncodedChunks(self) -> Iterator[str]:
+        """Encode the chunks one after the other"""
+        for chunk in self._chunks:
+            yield encodeChunk(
+                {f"{side}:{id_}": instructions for (side, id_), instructions in chunk}
+            )
+
+
+class CompactHTMLExportPairReportPlugin(ExportPairReportPlugin):
+    """A plugin class that exports the elf_diff document as a compact single HTML page.
+    Symbol data and instructions are embedded as compressed JSON and rendered
+    on demand by the browser.
+    """
+
+    def __init__(self, settings: Settings, plugin_configuration: Dict[str, str]):
+        super().__init__(settings, plugin_configuration)
+
+    def getRequiredDocumentParts(self) -> Set[str]:
+        """Return the document parts the plugin consumes (plugin interface method)"""
+        return {
+            DOCUMENT_PART_SYMBOL_CLASSES,
+            DOCUMENT_PART_INSTRUCTIONS,
+            DOCUMENT_PART_SIMILARITIES,
+        }
+
+    @staticmethod
+    def _symbolData(
+        side: str,
+        symbol: ValueTreeNode,
+        instruction_chunks: Optional[InstructionChunks],
+    ) -> Dict[str, Any]:
+        """Return the data of a symbol that is displayed in the report"""
+        chunk_index: Optional[int] = None
+        if instruction_chunks is not None:
+            chunk_index = instruction_chunks.add(side, symbol)
+        return {
+            "id": symbol.id,
+            "name": symbol.name,
+            "size": symbol.size,
+            "type": symbol.type,
+            "file_id": symbol.source.file_id,
+            "line": symbol.source.line,
+            "chunk": chunk_index,
+        }
+
+    def _symbolEntryData(
+        self,
+        symbol_class: str,
+        entry: ValueTreeNode,
+        instruction_chunks: InstructionChunks,
+    ) -> Dict[str, Any]:
+        """Return the data of a dict entry of one of the symbol classes"""
+        if not entry.display_info.display_symbol_details:
+            chunks: Optional[InstructionChunks] = None
+        else:
+            chunks = instruction_chunks
+
+        if symbol_class in ["appeared", "disappeared"]:
+            side = "new" if symbol_class == "appeared" else "old"
+            return {"symbol": self._symbolData(side, entry.actual, chunks)}
+
+        related_symbols = entry.related_symbols
+        data: Dict[str, Any] = {
+            "old": self._symbolData("old", related_symbols.old, chunks),
+            "new": self._symbolData("new", related_symbols.new, chunks),
+            "size_delta": related_symbols.size_delta,
+        }
+        if symbol_class == "similar":
+            data["similarities"] = {
+                "instruction": entry.similarities.instruction,
+                "signature": entry.similarities.signature,
+            }
+        return data
+
+    @staticmethod
+    def _sourceFiles(input_files: ValueTreeNode) -> Dict[int, str]:
+        return {
+            id_: source_file.path_wo_prefix
+            for id_, source_file in input_files.source_files.items()
+        }
+
+    def generateMetaData(
+        self, document: ValueTreeNode, instruction_chunks: InstructionChunks
+    ) -> Dict[str, Any]:
+        """Generate the data that describes the report and all symbols"""
+        resource_consumption = {}
+        for version in ["old", "new", "delta"]:
+            resource = getattr(
+                document.statistics.overall, version
+            ).resource_consumption
+            resource_consumption[version] = {
+                name: getattr(resource, name)
+                for name in ["code", "static_ram", "text", "data", "bss"]
+            }
+
+        symbol_classes = []
+        for symbol_class, overview_order in COMPACT_REPORT_SYMBOL_CLASSES:
+            if (symbol_class == "similar") and (
+                not document.configuration.display_similar_symbols
+            ):
+                continue
+            symbols_of_class = getattr(document.symbols, symbol_class)
+            sorted_ids = getattr(
+                document.indexes.getChild(symbol_class), overview_order
+            )
+            symbol_classes.append(
+                {
+                    "name": symbol_class,
+                    "entries": [
+                        self._symbolEntryData(
+                            symbol_class, symbols_of_class[id_], instruction_chunks
+                        )
+                        for id_ in sorted_ids
+                    ],
+                }
+            )
+
+        return {
+            "title": document.general.page_title,
+            "generation_date": document.general.generation_date,
+            "elf_diff_version": document.general.elf_diff_version,
+            "old_binary": document.files.input.old.binary_path,
+            "new_binary": document.files.input.new.binary_path,
+            "source_files": {
+                "old": self._sourceFiles(document.files.input.old),
+                "new": self._sourceFiles(document.files.input.new),
+            },
+            "resource_consumption": resource_consumption,
+            "symbol_classes": symbol_classes,
+        }
+
+    def export(self, document: ValueTreeNode) -> None:
+        """Export the compact HTML report (plugin interface method)"""
+        output_file: str = self.getConfigurationParameter("output_file")
+
+        instruction_chunks = InstructionChunks(
+            int(self.getConfigurationParameter("chunk_size"))
+        )
+        # Chunks are assigned while the meta data is generated. They are
+        # compressed one after the other while the report is written.
+        meta_data = encodeChunk(self.generateMetaData(document, instruction_chunks))
+
+        configurator = Configurator(
+            self._settings, self.getConfigurationParameter("template_dir")
+        )
+        configurator.configureTemplateStream(
+            template_file="compact_report.html",
+            output_file=output_file,
+            template_keywords={
+                "document": document,
+                "meta_data": meta_data,
+                "instruction_chunks": instruction_chunks.generateEncodedChunks(),
+            },
+        )
+
+        self.log(f"Compact html pair report written to '{output_file}'")
+
+    @staticmethod
+    def getConfigurationInformation() -> PluginConfigurationInformation:
+        """Return plugin configuration information"""
+        return [
+            PluginConfigurationKey(
+                "output_file",
+                "The output file of the compact report",
+                is_optional=True,
+                default=DEFAULT_COMPACT_REPORT_OUTPUT_FILE,
+            ),
+            PluginConfigurationKey(
+                "chunk_size",
+                "The approximate number of characters of instructions that are compressed together",
+                is_optional=True,
+                default=str(DEFAULT_CHUNK_SIZE),
+            ),
+            PluginConfigurationKey(
+                "template_dir",
+                "The directory where Jinja2 templates are read from",
+                is_optional=True,
+                default=DEFAULT_TEMPLATE_DIRECTORY,
+            ),
+        ] + super(
+            CompactHTMLExportPairReportPlugin, CompactHTMLExportPairReportPlugin
+        ).getConfigurationInformation()
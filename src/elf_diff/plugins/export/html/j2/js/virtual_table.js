@@ -0,0 +1,297 @@
+/*
+-*- coding: utf-8 -*-
+
+-*- mode: js -*-
+
+elf_diff
+
+Copyright (C) 2024  Noseglasses (shinynoseglasses@gmail.com)
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+details.
+
+You should have received a copy of the GNU General Public License along with along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+
+*/
+"use strict";
+
+// Symbol overview tables whose rows are embedded as JSON. Only the rows that
+// are visible in the scrolled container are rendered. Sorting and filtering
+// operate on the data array, not on the DOM.
+//
+// A row is an array [details_id, cell_1, cell_2, ...]. details_id is null
+// if the symbol has no details. Cells of two-line columns are arrays of two values.
+
+const VIRTUAL_TABLE_OVERSCAN_ROWS = 20;
+
+const HIGHLIGHT_START_TAG = "...HIGHLIGHT_START...";
+const HIGHLIGHT_END_TAG = "...HIGHLIGHT_END...";
+
+function virtualTableCellLines(value) {
+  return Array.isArray(value) ? value : [value];
+}
+
+function virtualTableSearchText(row) {
+  const texts = [];
+  for (let i = 1; i < row.length; i++) {
+    for (const value of virtualTableCellLines(row[i])) {
+      texts.push(String(value));
+    }
+  }
+  return removeHighlightingTags(texts.join(" ")).toLowerCase();
+}
+
+function removeHighlightingTags(text) {
+  return String(text).split(HIGHLIGHT_START_TAG).join("").split(HIGHLIGHT_END_TAG).join("");
+}
+
+function isNumberColumn(columnType) {
+  return columnType === "number" || columnType === "delta";
+}
+
+function virtualTableSortKey(columnType, value) {
+  const first = virtualTableCellLines(value)[0];
+  return isNumberColumn(columnType) ? Number(first) : removeHighlightingTags(first);
+}
+
+// Append a text with highlighting tags to a node, all text is inserted as text nodes
+function appendTaggedText(node, text) {
+  const parts = String(text).split(HIGHLIGHT_START_TAG);
+  node.appendChild(document.createTextNode(parts[0]));
+  for (let i = 1; i < parts.length; i++) {
+    const [highlighted, rest] = parts[i].split(HIGHLIGHT_END_TAG);
+    const span = document.createElement("span");
+    span.className = "diff_highlight";
+    span.textContent = highlighted;
+    node.appendChild(span);
+    node.appendChild(document.createTextNode(rest || ""));
+  }
+}
+
+function appendCellValue(node, columnType, value) {
+  if (columnType === "tagged") {
+    appendTaggedText(node, value);
+    return;
+  }
+  if (isNumberColumn(columnType)) {
+    const span = document.createElement("span");
+    span.className = "number";
+    if (columnType === "delta") {
+      span.className += value > 0 ? " deterioration" : value < 0 ? " improvement" : " unchanged";
+    }
+    span.textContent = String(value);
+    node.appendChild(span);
+    return;
+  }
+  node.appendChild(document.createTextNode(String(value)));
+}
+
+class VirtualTable {
+  constructor(container, data) {
+    this.container = container;
+    this.data = data;
+    this.rows = data.rows;
+    this.view = this.rows.map((_, index) => index);
+    this.sortColumn = null;
+    this.sortAscending = true;
+    this.rowHeight = 0;
+    this.searchTexts = null;
+    this.highlightedId = null;
+
+    this.viewport = container.querySelector(".virtual_overview_viewport");
+    this.table = container.querySelector("table");
+    this.tbody = this.table.tBodies[0];
+    this.count = container.querySelector(".virtual_overview_count");
+
+    this.headers = Array.from(this.table.tHead.rows[0].cells);
+    this.headers.forEach((header, columnIndex) => {
+      header.addEventListener("click", () => this.sortBy(columnIndex));
+    });
+    container.querySelector(".virtual_overview_search").addEventListener("input", (event) => {
+      this.filter(event.target.value);
+    });
+    this.viewport.addEventListener("scroll", () => this.render());
+    window.addEventListener("resize", () => this.render());
+
+    this.render();
+  }
+
+  filter(query) {
+    const needle = query.trim().toLowerCase();
+    if (needle === "") {
+      this.view = this.rows.map((_, index) => index);
+    } else {
+      if (this.searchTexts === null) {
+        this.searchTexts = this.rows.map(virtualTableSearchText);
+      }
+      this.view = [];
+      for (let i = 0; i < this.rows.length; i++) {
+        if (this.searchTexts[i].includes(needle)) {
+          this.view.push(i);
+        }
+      }
+    }
+    this.applySorting();
+    this.viewport.scrollTop = 0;
+    this.render();
+  }
+
+  sortBy(columnIndex) {
+    if (this.sortColumn === columnIndex) {
+      this.sortAscending = !this.sortAscending;
+    } else {
+      this.sortColumn = columnIndex;
+      this.sortAscending = true;
+    }
+    this.headers.forEach((header, index) => {
+      header.classList.toggle("virtual_overview_sorted", index === columnIndex && this.sortAscending);
+      header.classList.toggle("virtual_overview_sorted_reverse", index === columnIndex && !this.sortAscending);
+    });
+    this.applySorting();
+    this.render();
+  }
+
+  applySorting() {
+    if (this.sortColumn === null) {
+      return;
+    }
+    const columnType = this.data.column_types[this.sortColumn];
+    const cellIndex = this.sortColumn + 1;
+    const keys = new Map();
+    for (const index of this.view) {
+      keys.set(index, virtualTableSortKey(columnType, this.rows[index][cellIndex]));
+    }
+    const direction = this.sortAscending ? 1 : -1;
+    // Ties keep the order of the document, the sort is stable
+    this.view.sort((a, b) => {
+      const keyA = keys.get(a);
+      const keyB = keys.get(b);
+      return keyA < keyB ? -direction : keyA > keyB ? direction : a - b;
+    });
+  }
+
+  createRow(row) {
+    const tr = document.createElement("tr");
+    const detailsId = row[0];
+    if (detailsId === this.highlightedId && detailsId !== null) {
+      tr.className = "virtual_overview_highlighted";
+    }
+    this.data.column_types.forEach((columnType, columnIndex) => {
+      const td = document.createElement("td");
+      const lines = virtualTableCellLines(row[columnIndex + 1]);
+      if (!isNumberColumn(columnType)) {
+        td.title = lines.map(removeHighlightingTags).join("\n");
+      }
+      let target = td;
+      if (columnIndex === 0 && detailsId !== null) {
+        const anchor = document.createElement("a");
+        anchor.id = this.data.overview_anchor.replace("{id}", detailsId);
+        td.appendChild(anchor);
+        const link = document.createElement("a");
+        link.href = this.data.details_href.split("{id}").join(detailsId);
+        if (this.data.link_target) {
+          link.target = this.data.link_target;
+        }
+        td.appendChild(link);
+        target = link;
+      }
+      lines.forEach((value, line) => {
+        if (line > 0) {
+          target.appendChild(document.createElement("br"));
+        }
+        appendCellValue(target, columnType, value);
+      });
+      if (target !== td) {
+        target.appendChild(document.createTextNode(" \u24D8"));
+      }
+      tr.appendChild(td);
+    });
+    return tr;
+  }
+
+  createSpacer(height) {
+    const tr = document.createElement("tr");
+    tr.className = "virtual_overview_spacer";
+    const td = document.createElement("td");
+    td.colSpan = this.data.column_types.length;
+    td.style.height = height + "px";
+    tr.appendChild(td);
+    return tr;
+  }
+
+  render() {
+    this.count.textContent = this.view.length + " of " + this.rows.length + " symbols";
+    if (this.view.length === 0) {
+      this.tbody.replaceChildren();
+      return;
+    }
+    if (this.rowHeight === 0) {
+      // Rows of a table have the same number of lines, the first row defines the height of all rows
+      const probe = this.createRow(this.rows[this.view[0]]);
+      this.tbody.replaceChildren(probe);
+      this.rowHeight = probe.getBoundingClientRect().height || 20;
+    }
+    const visibleRows = Math.ceil(this.viewport.clientHeight / this.rowHeight) + 1;
+    const first = Math.max(0, Math.floor(this.viewport.scrollTop / this.rowHeight) - VIRTUAL_TABLE_OVERSCAN_ROWS);
+    const last = Math.min(this.view.length, first + visibleRows + 2 * VIRTUAL_TABLE_OVERSCAN_ROWS);
+
+    const fragment = document.createDocumentFragment();
+    fragment.appendChild(this.createSpacer(first * this.rowHeight));
+    for (let i = first; i < last; i++) {
+      fragment.appendChild(this.createRow(this.rows[this.view[i]]));
+    }
+    fragment.appendChild(this.createSpacer((this.view.length - last) * this.rowHeight));
+    this.tbody.replaceChildren(fragment);
+  }
+
+  // Scroll to the row of a symbol whose overview anchor is referenced by the URL fragment
+  revealAnchor(anchorName) {
+    const [prefix, suffix] = this.data.overview_anchor.split("{id}");
+    if (!anchorName.startsWith(prefix) || !anchorName.endsWith(suffix)) {
+      return;
+    }
+    const idText = anchorName.substring(prefix.length, anchorName.length - suffix.length);
+    let position = this.view.findIndex((index) => String(this.rows[index][0]) === idText);
+    if (position < 0) {
+      this.container.querySelector(".virtual_overview_search").value = "";
+      this.filter("");
+      position = this.view.findIndex((index) => String(this.rows[index][0]) === idText);
+      if (position < 0) {
+        return;
+      }
+    }
+    this.highlightedId = this.rows[this.view[position]][0];
+    this.container.scrollIntoView();
+    this.viewport.scrollTop = position * this.rowHeight;
+    this.render();
+  }
+}
+
+function initVirtualTables() {
+  const tables = [];
+  for (const container of document.querySelectorAll("div.virtual_overview")) {
+    const source = document.getElementById(container.dataset.source);
+    tables.push(new VirtualTable(container, JSON.parse(source.textContent)));
+  }
+  const revealFragment = () => {
+    const anchorName = decodeURIComponent(window.location.hash.substring(1));
+    if (anchorName) {
+      tables.forEach((table) => table.revealAnchor(anchorName));
+    }
+  };
+  window.addEventListener("hashchange", revealFragment);
+  revealFragment();
+}
+
+if (document.readyState === "loading") {
+  document.addEventListener("DOMContentLoaded", initVirtualTables);
+} else {
+  initVirtualTables();
+}
@@ -25,16 +25,42 @@ from elf_diff.plugin import (
 )
 from elf_diff.jinja import Configurator
 from elf_diff.symbol import Symbol
-from elf_diff.auxiliary import recursiveCopy, getDirectoryThatStoresModule
+from elf_diff.auxiliary import getDirectoryThatStoresModule
+from elf_diff.output_manifest import OutputManifest
+from elf_diff.instruction_diff import (
+    renderInstructionDiffTable,
+    DEFAULT_MAX_LINES,
+    INSTRUCTION_DIFF_RENDERER_VERSION,
+)
+from elf_diff.diff_cache import DiffCache, getDiffCache
+from elf_diff.render_cache import RenderCache, getRenderCache
 from elf_diff.instruction_collector import SOURCE_CODE_START_TAG, SOURCE_CODE_END_TAG
 from elf_diff.pair_report_document import ValueTreeNode
 from elf_diff.settings import Settings
+from elf_diff.string_diff import tagStringDiff
+from elf_diff.document_parts import (
+    DOCUMENT_PART_SYMBOL_CLASSES,
+    DOCUMENT_PART_INSTRUCTIONS,
+    DOCUMENT_PART_SIMILARITIES,
+)
 import os
 import pathlib
-from shutil import copyfile
-import difflib
+from collections.abc import Mapping
+import concurrent.futures
+import multiprocessing
 import sys
-from typing import Callable, Optional, Dict, List, Type
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Dict,
+    List,
+    Type,
+    Set,
+    Tuple,
+    Hashable,
+    Iterator,
+)
 
 DEFAULT_SINGLE_PAGE_REPORT_OUTPUT_FILE = "elf_diff_report.html"
 DEFAULT_MULTI_PAGE_REPORT_DIR = "elf_diff_report"
@@ -42,6 +68,22 @@ DEFAULT_TEMPLATE_DIRECTORY: str = os.path.join(
     getDirectoryThatStoresModule(sys.modules[__name__]), "j2"
 )
 
+# Size analytics and rollups are not displayed in single page HTML reports.
+# Multi page reports dump the entire document and thus require all parts.
+# Instructions are required even without detail pages, as renamed symbols
+# are detected by instructions.
+SINGLE_PAGE_HTML_REPORT_DOCUMENT_PARTS: Set[str] = {
+    DOCUMENT_PART_SYMBOL_CLASSES,
+    DOCUMENT_PART_INSTRUCTIONS,
+    DOCUMENT_PART_SIMILARITIES,
+}
+
+# The number of symbol detail pages that a worker process renders and writes per task
+DETAIL_PAGES_PER_BATCH = 64
+
+# A batch of detail pages, given by symbol class and symbol keys
+DetailPagesBatch = Tuple[str, List[Hashable]]
+
 
 def postHighlightSourceCode(src: str) -> str:
     """Replace start and end tags in tagged source code with HTML spans
@@ -51,30 +93,287 @@ def postHighlightSourceCode(src: str) -> str:
     )
 
 
-def getDifferencesAsHTML(old_symbol: ValueTreeNode, new_symbol: ValueTreeNode) -> str:
+def hasDifferencesTable(old_symbol: ValueTreeNode, new_symbol: ValueTreeNode) -> bool:
+    """Return True if the differences of two symbols are displayed as a table"""
+    return (old_symbol.type != Symbol.TYPE_DATA) and (
+        old_symbol.instructions != new_symbol.instructions
+    )
+
+
+def getDifferencesAsHTML(
+    old_symbol: ValueTreeNode,
+    new_symbol: ValueTreeNode,
+    max_lines: int = DEFAULT_MAX_LINES,
+    diff_cache: Optional[DiffCache] = None,
+) -> str:
     """Generate a tabular formatted version of the differences of the
-    assembly instructions of two symbols
+    assembly instructions of two symbols. Tables are limited to max_lines rows.
+    Tables are looked up in the diff cache, if one is provided.
     """
     if old_symbol.type == Symbol.TYPE_DATA:
         return "Data symbol -> no assembly"
-    elif old_symbol.instructions == new_symbol.instructions:
+    elif not hasDifferencesTable(old_symbol, new_symbol):
         return "Instructions unchanged"
 
-    old_instruction_lines: str = old_symbol.instructions.split("\n")
-    new_instruction_lines: str = new_symbol.instructions.split("\n")
+    if diff_cache is None:
+        diff_cache = DiffCache()
+    diff_table: str = diff_cache.getOrCompute(
+        f"instruction_diff_table/{INSTRUCTION_DIFF_RENDERER_VERSION}/{max_lines}",
+        old_symbol.instructions,
+        new_symbol.instructions,
+        lambda old, new: renderInstructionDiffTable(old, new, max_lines),
+    )
+
+    return postHighlightSourceCode(diff_table)
+
+
+NM_DOCUMENTATION_LINK = '<a href="https://sourceware.org/binutils/docs/binutils/nm.html">documentation of binutils tool nm</a>'
 
-    diff_class = difflib.HtmlDiff(tabsize=3, wrapcolumn=200)
 
-    diff_table: str = diff_class.make_table(
-        old_instruction_lines,
-        new_instruction_lines,
-        fromdesc="Old",
-        todesc="New",
-        context=True,
-        numlines=1000,
+class OverviewColumn(object):
+    """A column of a virtual overview table. The column type defines how
+    cells are displayed and sorted in the browser (text, tagged, number, delta).
+    Tagged cells contain highlighting tags.
+    """
+
+    def __init__(self, title: str, tooltip: str, type_: str, description: str):
+        self.title: str = title
+        self.tooltip: str = tooltip
+        self.type_: str = type_
+        # HTML description displayed in the columns legend
+        self.description: str = description
+
+    def getTemplateData(self) -> Dict[str, str]:
+        """Return the column as data that is passed to the virtual overview template"""
+        return {
+            "title": self.title,
+            "tooltip": self.tooltip,
+            "type": self.type_,
+            "description": self.description,
+        }
+
+
+SYMBOL_TYPE_COLUMN = OverviewColumn(
+    "Type",
+    "Symbol type (see nm tool documentation for a list of symbol types)",
+    "text",
+    f"The symbol type (see the {NM_DOCUMENTATION_LINK} for more information)",
+)
+
+PERSISTING_OVERVIEW_COLUMNS: List[OverviewColumn] = [
+    OverviewColumn(
+        "Symbol",
+        "Symbol name (possibly mangled)",
+        "text",
+        "The symbol name (possibly mangled)",
+    ),
+    SYMBOL_TYPE_COLUMN,
+    OverviewColumn(
+        "Old Size/bytes",
+        "The old symbol size either in RAM or program memory",
+        "number",
+        "The old symbol size either in RAM or program memory",
+    ),
+    OverviewColumn(
+        "New Size/bytes",
+        "The new symbol size either in RAM or program memory",
+        "number",
+        "The new symbol size either in RAM or program memory",
+    ),
+    OverviewColumn(
+        "Delta/bytes", "The change to symbol size", "delta", "The change to symbol size"
+    ),
+]
+
+ISOLATED_OVERVIEW_COLUMNS: List[OverviewColumn] = [
+    OverviewColumn(
+        "Symbol",
+        "Symbol name (possibly mangled)",
+        "text",
+        "The symbol name (possibly demangled)",
+    ),
+    SYMBOL_TYPE_COLUMN,
+    OverviewColumn(
+        "Size/bytes",
+        "Symbol size either in RAM or program memory",
+        "number",
+        "The symbol size either in RAM or program memory",
+    ),
+]
+
+SIMILAR_OVERVIEW_COLUMNS: List[OverviewColumn] = [
+    OverviewColumn(
+        "Id",
+        "Integer id assigned to each symbol pair",
+        "number",
+        "Integer id assigned to each symbol pair",
+    ),
+    OverviewColumn(
+        "Symbols",
+        "The two similar symbol names (possibly mangled)",
+        "tagged",
+        "The two similar symbol names (possibly mangled)",
+    ),
+    OverviewColumn(
+        "Types",
+        "Symbol types (see nm tool documentation for a list of symbol types)",
+        "text",
+        f"The symbol types (see the {NM_DOCUMENTATION_LINK} for more information)",
+    ),
+    OverviewColumn(
+        "Sizes/bytes",
+        "Symbol sizes either in RAM or program memory",
+        "number",
+        "The sizes of the symbols either in RAM or program memory",
+    ),
+    OverviewColumn(
+        "Deltas/bytes",
+        "The changes to symbol sizes",
+        "delta",
+        "The difference in symbol size",
+    ),
+    OverviewColumn(
+        "Sig. Sim./%",
+        "Lexicographic symbol signature similarity",
+        "number",
+        "Lexicographic symbol signature similarity",
+    ),
+    OverviewColumn(
+        "Instr. Sim./%",
+        "Instruction similarity of the symbols' assembly code",
+        "number",
+        "Instruction similarity of the symbols' assembly code",
+    ),
+]
+
+MIGRATED_OVERVIEW_COLUMNS: List[OverviewColumn] = [
+    OverviewColumn(
+        "Symbol",
+        "Symbol name (possibly mangled)",
+        "text",
+        "The symbol name (possibly mangled)",
+    ),
+    OverviewColumn(
+        "Old Source Location",
+        "Old Source Location [file:line]",
+        "tagged",
+        "The old source file location [file:line]",
+    ),
+    OverviewColumn(
+        "New Source Location",
+        "New Source Location [file:line]",
+        "tagged",
+        "The new source file location [file:line]",
+    ),
+]
+
+RENAMED_OVERVIEW_COLUMNS: List[OverviewColumn] = [
+    OverviewColumn(
+        "Symbols",
+        "The old and new symbol names (possibly mangled)",
+        "tagged",
+        "The old and new symbol names (possibly mangled)",
+    ),
+    SYMBOL_TYPE_COLUMN,
+    OverviewColumn(
+        "Size/bytes",
+        "Symbol size either in RAM or program memory",
+        "number",
+        "The size of the symbol either in RAM or program memory",
+    ),
+]
+
+
+def getSymbolLocationOfDefinition(
+    input_file: ValueTreeNode, symbol: ValueTreeNode
+) -> str:
+    """Return the source location [file:line] of a symbol's definition
+    (see macro symbol_old_location_of_definition)
+    """
+    if (input_file.debug_info_available is not True) or (symbol.source.file_id is None):
+        return "?"
+    source_file = input_file.source_files[symbol.source.file_id]
+    location = f"{source_file.path_wo_prefix}:{symbol.source.line}"
+    if source_file.path_wo_prefix != source_file.path:
+        location += f" ({source_file.path})"
+    return location
+
+
+def getDetailsId(symbol_of_class: ValueTreeNode, symbol_id: Any) -> Any:
+    """Return the id that links a row of a virtual overview table to the symbol's details"""
+    if symbol_of_class.display_info.display_symbol_details is True:
+        return symbol_id
+    return None
+
+
+def getPersistingOverviewRow(
+    symbol: ValueTreeNode, plugin_scope: "PluginScope"
+) -> List:
+    """Return a row of the virtual persisting symbols overview table"""
+    old_symbol = symbol.related_symbols.old
+    return [
+        getDetailsId(symbol, old_symbol.id),
+        old_symbol.name,
+        old_symbol.type,
+        old_symbol.size,
+        symbol.related_symbols.new.size,
+        symbol.related_symbols.size_delta,
+    ]
+
+
+def getIsolatedOverviewRow(symbol: ValueTreeNode, plugin_scope: "PluginScope") -> List:
+    """Return a row of the virtual appeared or disappeared symbols overview table"""
+    actual_symbol = symbol.actual
+    return [
+        getDetailsId(symbol, actual_symbol.id),
+        actual_symbol.name,
+        actual_symbol.type,
+        actual_symbol.size,
+    ]
+
+
+def getSimilarOverviewRow(symbol: ValueTreeNode, plugin_scope: "PluginScope") -> List:
+    """Return a row of the virtual similar symbols overview table"""
+    old_symbol = symbol.related_symbols.old
+    new_symbol = symbol.related_symbols.new
+    return [
+        getDetailsId(symbol, symbol.id),
+        symbol.id,
+        [symbol.old.signature_tagged, symbol.new.signature_tagged],
+        [old_symbol.type, new_symbol.type],
+        [old_symbol.size, new_symbol.size],
+        symbol.related_symbols.size_delta,
+        round(symbol.similarities.signature, 1),
+        round(symbol.similarities.instruction, 1),
+    ]
+
+
+def getMigratedOverviewRow(symbol: ValueTreeNode, plugin_scope: "PluginScope") -> List:
+    """Return a row of the virtual migrated symbols overview table"""
+    old_symbol = symbol.related_symbols.old
+    input_files = plugin_scope.document.files.input
+    tagged_location_old, tagged_location_new = tagStringDiff(
+        getSymbolLocationOfDefinition(input_files.old, old_symbol),
+        getSymbolLocationOfDefinition(input_files.new, symbol.related_symbols.new),
+        plugin_scope.string_diff_backend,
     )
+    return [
+        getDetailsId(symbol, old_symbol.id),
+        old_symbol.name,
+        tagged_location_old,
+        tagged_location_new,
+    ]
 
-    return postHighlightSourceCode(diff_table)
+
+def getRenamedOverviewRow(symbol: ValueTreeNode, plugin_scope: "PluginScope") -> List:
+    """Return a row of the virtual renamed symbols overview table"""
+    old_symbol = symbol.related_symbols.old
+    return [
+        getDetailsId(symbol, old_symbol.id),
+        [symbol.old.signature_tagged, symbol.new.signature_tagged],
+        old_symbol.type,
+        old_symbol.size,
+    ]
 
 
 class PluginScope(object):
@@ -84,13 +383,35 @@ class PluginScope(object):
         self.skip_symbol_similarities: bool
         self.consider_equal_sized_identical: bool
         self.single_page: bool
+        self.virtual_overview_tables: bool
+        self.string_diff_backend: str
+        self.instruction_diff_max_lines: int
+        self.diff_cache: DiffCache
+        self.render_cache: RenderCache
         self.jinja_configurator: Configurator
         self.output_dir: str
+        self.output_manifest: OutputManifest
         self.document: ValueTreeNode
 
+    def getRenderKey(self) -> Hashable:
+        """Return a key that identifies all options that affect rendered HTML"""
+        return (
+            self.jinja_configurator.template_dir,
+            self.single_page,
+            self.virtual_overview_tables,
+            self.string_diff_backend,
+            self.instruction_diff_max_lines,
+            self.skip_symbol_similarities,
+            self.consider_equal_sized_identical,
+        )
+
     def getCommonJinjaKeywords(self) -> dict:
         """Get Jinja keywords that are used in all template files"""
-        return {"is_single_page_report": self.single_page, "document": self.document}
+        return {
+            "is_single_page_report": self.single_page,
+            "virtual_overview_tables": self.virtual_overview_tables,
+            "document": self.document,
+        }
 
 
 class Content(object):
@@ -158,10 +479,11 @@ class Content(object):
             }
         )
 
-        self._plugin_scope.jinja_configurator.configureTemplateWrite(
-            template_file=template_file,
-            output_file=html_output_file,
-            template_keywords=template_keywords,
+        self._plugin_scope.output_manifest.writeFile(
+            html_output_file,
+            self._plugin_scope.jinja_configurator.configureTemplate(
+                template_file=template_file, template_keywords=template_keywords
+            ),
         )
 
 
@@ -178,6 +500,10 @@ class SymbolClassProperties(object):
         additional_overview_content: Optional[str] = None,
         symbol_class_alias_getter: Optional[Callable] = None,
         update_entity_keywords: Optional[Callable] = None,
+        overview_order: str = "by_size",
+        show_instruction_differences: bool = False,
+        overview_columns: Optional[List[OverviewColumn]] = None,
+        overview_row_getter: Optional[Callable] = None,
     ):
         self.class_: str = class_
         self.id_getter: Callable = id_getter
@@ -189,6 +515,14 @@ class SymbolClassProperties(object):
         self.update_entity_keywords: Callable = update_entity_keywords or (
             lambda symbol, keywords: None
         )
+        # The document index (document.indexes.<class>.<overview_order>)
+        # that defines the order of the symbol overview table
+        self.overview_order: str = overview_order
+        # Symbol details of pairs of related symbols display a table of instruction differences
+        self.show_instruction_differences: bool = show_instruction_differences
+        # Columns and rows of virtual overview tables that are rendered in the browser
+        self.overview_columns: List[OverviewColumn] = overview_columns or []
+        self.overview_row_getter: Optional[Callable] = overview_row_getter
 
 
 class SymbolEntity(Content):
@@ -220,18 +554,38 @@ class SymbolEntity(Content):
                 "symbol_class": self._symbol_class_properties.class_,
             }
         )
+        if self._symbol_class_properties.show_instruction_differences:
+            # Difference tables do not depend on the type of report
+            self._template_keywords[
+                "instruction_differences_html"
+            ] = self._plugin_scope.render_cache.getOrRender(
+                (
+                    "instruction_differences",
+                    self._plugin_scope.instruction_diff_max_lines,
+                    self._symbol_class_properties.class_,
+                    self.getSymbolId(),
+                ),
+                lambda: getDifferencesAsHTML(
+                    self._symbol_of_class.related_symbols.old,
+                    self._symbol_of_class.related_symbols.new,
+                    self._plugin_scope.instruction_diff_max_lines,
+                    self._plugin_scope.diff_cache,
+                ),
+            )
         self._symbol_class_properties.update_entity_keywords(
             self._symbol_of_class, self._template_keywords
         )
 
+    def getSymbolId(self) -> int:
+        """Return the id of the symbol entity within its symbol class"""
+        return self._symbol_class_properties.id_getter(self._symbol_of_class)
+
     def getOutputFilepath(self) -> str:
         """Get the filepath of the output file associated with the symbol entity.
         The path is meant to be a subpath below the directory that stores
         index.html
         """
-        symbol_id: int = self._symbol_class_properties.id_getter(
-            self._symbol_of_class
-        )  # type(self) is necessary as there is some strange behavior class variable lambdas
+        symbol_id: int = self.getSymbolId()
         return os.path.join(
             "details", self._symbol_class_properties.class_, "%s.html" % symbol_id
         )
@@ -252,6 +606,18 @@ class SymbolEntity(Content):
         if hasattr(self, "_html"):
             return
 
+        self._html: str = self._plugin_scope.render_cache.getOrRender(
+            (
+                "symbol_details",
+                self._symbol_class_properties.class_,
+                self.getSymbolId(),
+            ),
+            self.renderHTML,
+            render_key=self._plugin_scope.getRenderKey(),
+        )
+
+    def renderHTML(self) -> str:
+        """Render the symbol details template"""
         self.prepareTemplateKeywords()
 
         # Appeared and disappeared symbols use the same Jinja template files.
@@ -263,7 +629,7 @@ class SymbolEntity(Content):
         )
         html_template_file: str = f"{symbol_class_alias}_symbol_details.html"
 
-        self._html: str = self._plugin_scope.jinja_configurator.configureTemplate(
+        return self._plugin_scope.jinja_configurator.configureTemplate(
             template_file=html_template_file, template_keywords=self._template_keywords
         )
 
@@ -293,19 +659,29 @@ class SymbolOverview(Content):
         if hasattr(self, "_html"):
             return
 
+        self._html: str = self._plugin_scope.render_cache.getOrRender(
+            ("symbol_overview", self._symbol_class_properties.class_),
+            self.renderHTML,
+            render_key=self._plugin_scope.getRenderKey(),
+        )
+
+    def renderHTML(self) -> str:
+        """Render the symbol overview template"""
         symbol_class: str = self._symbol_class_properties.class_
 
         symbols_of_class: dict = getattr(
             self._plugin_scope.document.symbols, symbol_class
         )
         if len(symbols_of_class) == 0:
-            self._html = f"No {symbol_class} symbols"
-            return
+            return f"No {symbol_class} symbols"
 
-        template_keywords: dict = self._plugin_scope.getCommonJinjaKeywords()
-        template_keywords.update(
-            {"symbols": symbols_of_class.values(), "symbol_class": symbol_class}
+        # Symbols are sorted once during document generation
+        sorted_ids: List[int] = getattr(
+            self._plugin_scope.document.indexes.getChild(symbol_class),
+            self._symbol_class_properties.overview_order,
         )
+        template_keywords: dict = self._plugin_scope.getCommonJinjaKeywords()
+        template_keywords["symbol_class"] = symbol_class
 
         if self._symbol_class_properties.symbol_class_alias_getter is None:
             raise Exception("Missing symbol_class_alias_getter")
@@ -314,14 +690,37 @@ class SymbolOverview(Content):
                 self._symbol_class_properties
             )
         )
-        html_template_file: str = f"{symbol_class_alias}_symbol_overview.html"
 
-        self._html: str = self._plugin_scope.jinja_configurator.configureTemplate(
+        if self._plugin_scope.virtual_overview_tables:
+            # Rows are embedded as JSON, the browser only renders visible rows
+            row_getter = self._symbol_class_properties.overview_row_getter
+            if row_getter is None:
+                raise Exception("Missing overview_row_getter")
+            template_keywords.update(
+                {
+                    "columns": [
+                        column.getTemplateData()
+                        for column in self._symbol_class_properties.overview_columns
+                    ],
+                    "rows": [
+                        row_getter(symbols_of_class[id_], self._plugin_scope)
+                        for id_ in sorted_ids
+                    ],
+                    "table_class": f"{symbol_class_alias}_symbols",
+                }
+            )
+            html_template_file = "virtual_symbol_overview.html"
+        else:
+            template_keywords["symbols"] = [symbols_of_class[id_] for id_ in sorted_ids]
+            html_template_file = f"{symbol_class_alias}_symbol_overview.html"
+
+        html: str = self._plugin_scope.jinja_configurator.configureTemplate(
             template_file=html_template_file, template_keywords=template_keywords
         )
 
         if self._symbol_class_properties.additional_overview_content is not None:
-            self._html += self._symbol_class_properties.additional_overview_content
+            html += self._symbol_class_properties.additional_overview_content
+        return html
 
     def getOutputFilepath(self) -> str:  # pylint: disable=no-self-use
         """Return the relative path of the output file from the directory that holds the
@@ -342,7 +741,10 @@ class SymbolOverview(Content):
 
 
 class SymbolDetails(Content):
-    """HTML content assoicated with symbol details"""
+    """HTML content assoicated with symbol details. Single page reports embed
+    the details of all symbols of a class as one string, multi page reports
+    export one page per symbol and never build the joint string.
+    """
 
     def __init__(
         self, symbol_class_properties: SymbolClassProperties, plugin_scope: PluginScope
@@ -353,21 +755,29 @@ class SymbolDetails(Content):
         self._plugin_scope: PluginScope = plugin_scope
 
     def generateHTML(self) -> None:
-        """Generate the HTML that represents the symbol details"""
+        """Generate the HTML that represents the details of all symbols of the class"""
         if hasattr(self, "_html"):
             return
 
-        symbols_of_class: dict = getattr(
-            self._plugin_scope.document.symbols, self._symbol_class_properties.class_
-        )
+        self._html = "".join(self.generateHTMLChunks())
 
-        symbols_listed = False
-        html_lines = []
+    def generateHTMLChunks(self) -> Iterator[str]:
+        """Generate the HTML that represents the details of all symbols of the class
+        chunk by chunk. Symbol entities are rendered lazily, when the next chunk is requested.
+        """
+        if self._plugin_scope.single_page is False:
+            raise Exception(
+                "Symbol details are only joined for single page reports, multi page reports export one file per symbol"
+            )
 
-        for symbol_of_class in symbols_of_class.values():
+        symbols_of_class: Mapping = self.getSymbolsOfClass()
 
-            symbols_listed = True
+        if len(symbols_of_class) == 0:
+            yield f"No {self._symbol_class_properties.class_} functions or no symbol changes"
+            return
 
+        separator = ""
+        for symbol_of_class in symbols_of_class.values():
             if symbol_of_class.display_info.display_symbol_details is False:
                 continue
 
@@ -378,25 +788,29 @@ class SymbolDetails(Content):
             )
             symbol_entity.generateHTML()
 
-            html_lines.append(symbol_entity.getHTML())
-
-        if not symbols_listed:
-            self._html = f"No {self._symbol_class_properties.class_} functions or no symbol changes"
-            return
-
-        self._html = "\n".join(html_lines)
+            yield separator
+            yield symbol_entity.getHTML()
+            separator = "\n"
 
     def exportFiles(self) -> None:
         """Export HTML files that hold the symbol details information"""
         if self._plugin_scope.single_page is True:
             return
 
-        symbol_class: str = self._symbol_class_properties.class_
-        symbols_of_class: dict = getattr(
-            self._plugin_scope.document.symbols, symbol_class
+        self.exportSymbolFiles(list(self.getSymbolsOfClass().keys()))
+
+    def getSymbolsOfClass(self) -> Mapping:
+        """Return the symbols of the symbol class by key"""
+        return getattr(
+            self._plugin_scope.document.symbols, self._symbol_class_properties.class_
         )
 
-        for symbol_of_class in symbols_of_class.values():
+    def exportSymbolFiles(self, keys: List[Hashable]) -> None:
+        """Export the detail pages of the symbols with the given keys"""
+        symbols_of_class: Mapping = self.getSymbolsOfClass()
+
+        for key in keys:
+            symbol_of_class = symbols_of_class[key]
             if symbol_of_class.display_info.display_symbol_details is False:
                 continue
             symbol_entity = SymbolEntity(
@@ -409,6 +823,27 @@ class SymbolDetails(Content):
             symbol_entity.exportFiles()
 
 
+# The symbol details of the multi page export that is currently run by
+# worker processes. Workers are forked and inherit the document and compiled
+# templates. Tasks only name the symbol class and keys of the pages to render.
+_forked_symbol_details: Dict[str, SymbolDetails] = {}
+
+
+def _exportDetailPagesBatch(batch: DetailPagesBatch) -> OutputManifest:
+    """Export a batch of symbol detail pages in a worker process and
+    return the record of the files written
+    """
+    symbol_class, keys = batch
+    symbol_details = _forked_symbol_details[symbol_class]
+    plugin_scope = symbol_details._plugin_scope
+    plugin_scope.output_manifest = plugin_scope.output_manifest.spawn()
+    # Fragments rendered by a worker would be lost with the worker process
+    plugin_scope.render_cache.read_only = True
+    symbol_details.exportSymbolFiles(keys)
+    plugin_scope.diff_cache.flush()
+    return plugin_scope.output_manifest
+
+
 class StatisticsOverview(Content):
     """HTML content of overall statistics of symbols"""
 
@@ -507,8 +942,14 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
     a single HTML page or a set of HMTL pages in a subdirectory
     """
 
-    SYMBOL_CLASSES = ["persisting", "appeared", "disappeared", "similar", "migrated"]
-    INFORMATION_TYPES = ["overview", "detail"]
+    SYMBOL_CLASSES = [
+        "persisting",
+        "appeared",
+        "disappeared",
+        "similar",
+        "migrated",
+        "renamed",
+    ]
 
     def __init__(self, settings: Settings, plugin_configuration: Dict[str, str]):
         """Initialize the pair report class."""
@@ -527,6 +968,14 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
             plugin_scope.single_page = True
         else:
             plugin_scope.single_page = False
+        plugin_scope.virtual_overview_tables = (
+            self.getConfigurationParameter("virtual_overview_tables") == "True"
+        )
+        plugin_scope.string_diff_backend = self._settings.string_diff_backend
+        plugin_scope.instruction_diff_max_lines = (
+            self._settings.instruction_diff_max_lines
+        )
+        plugin_scope.diff_cache = getDiffCache(self._settings)
         plugin_scope.jinja_configurator = Configurator(
             self._settings, jinja_template_dir
         )
@@ -545,9 +994,20 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
 
         self._content_is_prepared = False
 
+    def getRequiredDocumentParts(self) -> Set[str]:
+        """Return the document parts the plugin consumes (plugin interface method)"""
+        if self._plugin_scope.single_page:
+            return set(SINGLE_PAGE_HTML_REPORT_DOCUMENT_PARTS)
+        return super().getRequiredDocumentParts()
+
+    def getHTMLRenderKey(self) -> Optional[Hashable]:
+        """Return the key of the options that affect rendered HTML (plugin interface method)"""
+        return self._plugin_scope.getRenderKey()
+
     def export(self, document: ValueTreeNode) -> None:
         """Export files (plugin interface method)"""
         self._plugin_scope.document = document
+        self._plugin_scope.render_cache = getRenderCache()
 
         if self._plugin_scope.single_page:
             self.exportSinglePage()
@@ -586,13 +1046,10 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
             id_getter=lambda symbol: symbol.related_symbols.old.id,
             name_getter=lambda symbol: symbol.related_symbols.old.name,
             additional_overview_content=additional_overview_content,
-            update_entity_keywords=lambda symbol, keywords: keywords.update(
-                {
-                    "instruction_differences_html": getDifferencesAsHTML(
-                        symbol.related_symbols.old, symbol.related_symbols.new
-                    )
-                }
-            ),
+            overview_order="by_size_delta",
+            show_instruction_differences=True,
+            overview_columns=PERSISTING_OVERVIEW_COLUMNS,
+            overview_row_getter=getPersistingOverviewRow,
         )
         self.prepareContentForSymbolsOfClass(symbol_class_properties)
 
@@ -603,6 +1060,21 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
             class_="migrated",
             id_getter=lambda symbol: symbol.related_symbols.old.id,
             name_getter=lambda symbol: symbol.related_symbols.old.name,
+            overview_order="by_size_delta",
+            overview_columns=MIGRATED_OVERVIEW_COLUMNS,
+            overview_row_getter=getMigratedOverviewRow,
+        )
+        self.prepareContentForSymbolsOfClass(symbol_class_properties)
+
+    def prepareRenamedSymbolsContent(self) -> None:
+        """Prepare renamed symbols"""
+
+        symbol_class_properties = SymbolClassProperties(
+            class_="renamed",
+            id_getter=lambda symbol: symbol.related_symbols.old.id,
+            name_getter=lambda symbol: symbol.related_symbols.old.name,
+            overview_columns=RENAMED_OVERVIEW_COLUMNS,
+            overview_row_getter=getRenamedOverviewRow,
         )
         self.prepareContentForSymbolsOfClass(symbol_class_properties)
 
@@ -613,6 +1085,8 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
             id_getter=lambda symbol: symbol.actual.id,
             name_getter=lambda symbol: symbol.actual.name,
             symbol_class_alias_getter=lambda _: "isolated",
+            overview_columns=ISOLATED_OVERVIEW_COLUMNS,
+            overview_row_getter=getIsolatedOverviewRow,
         )
         self.prepareContentForSymbolsOfClass(symbol_class_properties)
 
@@ -630,13 +1104,10 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
             class_="similar",
             id_getter=lambda symbol: symbol.id,
             name_getter=lambda symbol: symbol.id,  # Similar symbols use the id also as name
-            update_entity_keywords=lambda symbol, keywords: keywords.update(
-                {
-                    "instruction_differences_html": getDifferencesAsHTML(
-                        symbol.related_symbols.old, symbol.related_symbols.new
-                    )
-                }
-            ),
+            overview_order="by_similarity",
+            show_instruction_differences=True,
+            overview_columns=SIMILAR_OVERVIEW_COLUMNS,
+            overview_row_getter=getSimilarOverviewRow,
         )
         self.prepareContentForSymbolsOfClass(symbol_class_properties)
 
@@ -666,6 +1137,7 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
             self.prepareSimilarSymbolsContent()
 
         self.prepareMigratedSymbolsContent()
+        self.prepareRenamedSymbolsContent()
 
         self._content_is_prepared = True
 
@@ -681,18 +1153,18 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
         template_keywords: dict = self._plugin_scope.getCommonJinjaKeywords()
 
         # Setup jinja keywords for overview/details of persisting, appeared, disappeared and similar symbols
-        for information_type in self.INFORMATION_TYPES:
-            contents = getattr(self, f"symbol_{information_type}s")
-            for symbol_class in self.SYMBOL_CLASSES:
-                # Some symbol classes like 'similar' may be suppressed by users choice
-                if symbol_class in contents.keys():
-                    content = contents[symbol_class]
-                    content_html: str = ""
-                    if content is not None:
-                        content_html = content.getHTML()
-                    template_keywords[
-                        f"{symbol_class}_symbol_{information_type}"
-                    ] = content_html
+        for symbol_class in self.SYMBOL_CLASSES:
+            # Some symbol classes like 'similar' may be suppressed by users choice
+            if symbol_class in self.symbol_overviews.keys():
+                template_keywords[
+                    f"{symbol_class}_symbol_overview"
+                ] = self.symbol_overviews[symbol_class].getHTML()
+            if symbol_class in self.symbol_details.keys():
+                # Details are the bulk of the report. They are rendered while
+                # the report is written, one symbol after the other.
+                template_keywords[
+                    f"{symbol_class}_symbol_detail"
+                ] = self.symbol_details[symbol_class].generateHTMLChunks()
 
         template_keywords.update(
             {
@@ -701,7 +1173,7 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
             }
         )
 
-        self._plugin_scope.jinja_configurator.configureTemplateWrite(
+        self._plugin_scope.jinja_configurator.configureTemplateStream(
             template_file=template_file,
             output_file=output_file,
             template_keywords=template_keywords,
@@ -724,6 +1196,7 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
             os.path.join(output_dir, "details", "appeared"),
             os.path.join(output_dir, "details", "similar"),
             os.path.join(output_dir, "details", "migrated"),
+            os.path.join(output_dir, "details", "renamed"),
             os.path.join(output_dir, "images"),
         ]
 
@@ -731,17 +1204,22 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
             if not os.path.exists(dir_):
                 pathlib.Path(dir_).mkdir(parents=True, exist_ok=True)
 
+        output_manifest = OutputManifest(
+            output_dir, self.getConfigurationParameter("incremental") == "True"
+        )
+        self._plugin_scope.output_manifest = output_manifest
+
         plugin_module_path: str = self.getModulePath()
 
-        recursiveCopy(
+        output_manifest.copyTree(
             os.path.join(plugin_module_path, "j2", "css"),
             os.path.join(output_dir, "css"),
         )
-        recursiveCopy(
+        output_manifest.copyTree(
             os.path.join(plugin_module_path, "j2", "js"),
             os.path.join(output_dir, "js"),
         )
-        copyfile(
+        output_manifest.copyFile(
             os.path.join(self._settings.module_path, "images", "favicon.png"),
             os.path.join(output_dir, "images", "favicon.png"),
         )
@@ -752,18 +1230,56 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
 
         template_keywords: dict = self._plugin_scope.getCommonJinjaKeywords()
 
-        self._plugin_scope.jinja_configurator.configureTemplateWrite(
-            template_file=html_template_file,
-            output_file=html_index_file,
-            template_keywords=template_keywords,
+        output_manifest.writeFile(
+            html_index_file,
+            self._plugin_scope.jinja_configurator.configureTemplate(
+                template_file=html_template_file, template_keywords=template_keywords
+            ),
         )
 
         # Generate subpages
+        jobs: int = self._settings.jobs
+        if jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            self.log("Worker processes cannot be forked, rendering pages serially")
+            jobs = 1
+
         for html_content in self._html_contents:
+            if (jobs > 1) and isinstance(html_content, SymbolDetails):
+                continue
             html_content.exportFiles()
 
+        if jobs > 1:
+            self.exportSymbolDetailsInParallel(jobs)
+
+        output_manifest.finish()
+        if output_manifest.incremental:
+            self.log(f"Incremental output: {output_manifest.getSummary()}")
+
         self.log(f"Multi page html pair report written to directory '{output_dir}'")
 
+    def exportSymbolDetailsInParallel(self, jobs: int) -> None:
+        """Render and write the symbol detail pages with a pool of worker processes"""
+        batches: List[DetailPagesBatch] = []
+        for symbol_class, symbol_details in self.symbol_details.items():
+            keys = list(symbol_details.getSymbolsOfClass().keys())
+            for start in range(0, len(keys), DETAIL_PAGES_PER_BATCH):
+                batches.append(
+                    (symbol_class, keys[start : start + DETAIL_PAGES_PER_BATCH])
+                )
+
+        _forked_symbol_details.update(self.symbol_details)
+        # Workers store their own diff cache entries
+        self._plugin_scope.diff_cache.flush()
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                # Consuming the results also propagates exceptions raised by workers
+                for batch_manifest in executor.map(_exportDetailPagesBatch, batches):
+                    self._plugin_scope.output_manifest.merge(batch_manifest)
+        finally:
+            _forked_symbol_details.clear()
+
     @staticmethod
     def getConfigurationInformation() -> PluginConfigurationInformation:
         """Return plugin configuration information"""
@@ -792,6 +1308,18 @@ class HTMLExportPairReportPlugin(ExportPairReportPlugin):
                 is_optional=True,
                 default=DEFAULT_TEMPLATE_DIRECTORY,
             ),
+            PluginConfigurationKey(
+                "incremental",
+                "If True, multi-page reports only rewrite files whose content changed since the previous report in the output directory and remove stale files",
+                is_optional=True,
+                default="False",
+            ),
+            PluginConfigurationKey(
+                "virtual_overview_tables",
+                "If True, symbol overview tables are embedded as JSON data and only visible rows are rendered by the browser, which also sorts and filters the data",
+                is_optional=True,
+                default="False",
+            ),
         ] + super(
             HTMLExportPairReportPlugin, HTMLExportPairReportPlugin
         ).getConfigurationInformation()
@@ -25,11 +25,14 @@ from elf_diff.plugin import (
     PluginConfigurationInformation,
 )
 from elf_diff.error_handling import warning
-from elf_diff.plugins.export.html.plugin import HTMLExportPairReportPlugin
+from elf_diff.plugins.export.html.plugin import (
+    HTMLExportPairReportPlugin,
+    SINGLE_PAGE_HTML_REPORT_DOCUMENT_PARTS,
+)
 from elf_diff.pair_report_document import ValueTreeNode
 import tempfile
 import os
-from typing import Dict
+from typing import Dict, Hashable, Optional, Set
 
 
 def convertHTMLToPDF(html_file: str, pdf_file: str):
@@ -58,6 +61,24 @@ class PDFExportPairReportPlugin(ExportPairReportPlugin):
         if os.path.isfile(self._tmp_html_file):
             os.remove(self._tmp_html_file)
 
+    def getRequiredDocumentParts(self) -> Set[str]:
+        """Return the document parts the plugin consumes (plugin interface method)"""
+        # The PDF document is converted from a single page HTML report
+        return set(SINGLE_PAGE_HTML_REPORT_DOCUMENT_PARTS)
+
+    def createHTMLExportPlugin(self, html_file: str) -> HTMLExportPairReportPlugin:
+        """Create the plugin that exports the single page HTML report the PDF document is converted from"""
+        plugin_configuration: Dict[str, str] = {
+            "single_page": "True",
+            "output_file": html_file,
+            "quiet": "True",
+        }
+        return HTMLExportPairReportPlugin(self._settings, plugin_configuration)
+
+    def getHTMLRenderKey(self) -> Optional[Hashable]:
+        """Return the key of the options that affect rendered HTML (plugin interface method)"""
+        return self.createHTMLExportPlugin("").getHTMLRenderKey()
+
     def export(self, document: ValueTreeNode) -> None:
         """Export the PDF document"""
 
@@ -67,15 +88,7 @@ class PDFExportPairReportPlugin(ExportPairReportPlugin):
             with tempfile.TemporaryDirectory() as tmp:
                 self._tmp_html_file = os.path.join(tmp, "tmp_html_file.html")
 
-                # use path
-                plugin_configuration: Dict[str, str] = {
-                    "single_page": "True",
-                    "output_file": self._tmp_html_file,
-                    "quiet": "True",
-                }
-                html_export_plugin = HTMLExportPairReportPlugin(
-                    self._settings, plugin_configuration
-                )
+                html_export_plugin = self.createHTMLExportPlugin(self._tmp_html_file)
                 html_export_plugin.export(document)
 
                 convertHTMLToPDF(self._tmp_html_file, pdf_output_file)
@@ -32,7 +32,12 @@ from elf_diff.document_explorer import (
 )
 from elf_diff.settings import Settings
 from elf_diff.pair_report_document import ValueTreeNode
-from typing import Dict
+from elf_diff.document_parts import (
+    DOCUMENT_PART_SYMBOL_CLASSES,
+    DOCUMENT_PART_INSTRUCTIONS,
+    DOCUMENT_PART_SIMILARITIES,
+)
+from typing import Dict, Set
 
 
 class TXTExportPairReportPlugin(ExportPairReportPlugin):
@@ -67,6 +72,16 @@ class TXTExportStatisticsPlugin(ExportPairReportPlugin):
     def __init__(self, settings: Settings, plugin_configuration: Dict[str, str]):
         super().__init__(settings, plugin_configuration)
 
+    def getRequiredDocumentParts(self) -> Set[str]:
+        """Return the document parts the plugin consumes (plugin interface method)"""
+        # Symbol counts only. Instructions are needed to detect renamed symbols
+        # and assembly differences.
+        return {
+            DOCUMENT_PART_SYMBOL_CLASSES,
+            DOCUMENT_PART_INSTRUCTIONS,
+            DOCUMENT_PART_SIMILARITIES,
+        }
+
     def export(self, document: ValueTreeNode):
         files_differ = (
             (document.statistics.overall.delta.resource_consumption.code != 0)
@@ -78,6 +93,7 @@ class TXTExportStatisticsPlugin(ExportPairReportPlugin):
             or (len(document.symbols.appeared) > 0)
             or (len(document.symbols.similar) > 0)
             or (len(document.symbols.migrated) > 0)
+            or (len(document.symbols.renamed) > 0)
             or (document.statistics.symbols.persisting.assembly_differs_count > 0)
         )
 
@@ -105,6 +121,7 @@ Symbol statistics:
     appeared:    {len(document.symbols.appeared)}
     similar:     {len(document.symbols.similar)}
     migrated:    {len(document.symbols.migrated)}
+    renamed:     {len(document.symbols.renamed)}
 
 """
             )
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2024  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""HTML fragments that are shared by the export plugins of a document.
+
+When several plugins render HTML from the same document, e.g. a multi page
+report, a single page report and a PDF document, the render cache makes
+them render each symbol's instruction differences only once. Symbol details
+and overviews also depend on the type of report. They are only stored if
+another plugin renders HTML with the same render key, e.g. a single page
+report and a PDF document. The shared cache only exists while a document is
+exported.
+"""
+
+import collections
+import contextlib
+from typing import (
+    Callable,
+    Collection,
+    Counter,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Set,
+)
+
+
+class RenderCache(object):
+    """Memoizes rendered HTML fragments by key. A disabled cache
+    renders every fragment and stores nothing. A read only cache returns
+    stored fragments but does not store new ones.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        shared_render_keys: Optional[Collection[Hashable]] = None,
+    ):
+        self.enabled: bool = enabled
+        self.read_only: bool = False
+        self.shared_render_keys: Set[Hashable] = set(shared_render_keys or [])
+        self._fragments: Dict[Hashable, str] = {}
+        self.num_hits: int = 0
+
+    def getOrRender(
+        self,
+        key: Hashable,
+        render: Callable[[], str],
+        render_key: Optional[Hashable] = None,
+    ) -> str:
+        """Return the fragment stored with the key or render and store it.
+        Fragments that depend on the render key of the rendering plugin are
+        only stored if the render key is shared by several plugins.
+        """
+        if not self.enabled:
+            return render()
+        if render_key is not None:
+            if render_key not in self.shared_render_keys:
+                return render()
+            key = (render_key, key)
+        fragment: Optional[str] = self._fragments.get(key)
+        if fragment is not None:
+            self.num_hits += 1
+            return fragment
+        fragment = render()
+        if not self.read_only:
+            self._fragments[key] = fragment
+        return fragment
+
+
+_shared_render_cache: Optional[RenderCache] = None
+
+
+def getSharedRenderKeys(render_keys: Collection[Hashable]) -> Set[Hashable]:
+    """Return the render keys that occur more than once"""
+    counts: Counter[Hashable] = collections.Counter(render_keys)
+    return {render_key for render_key, count in counts.items() if count > 1}
+
+
+@contextlib.contextmanager
+def sharedRenderCache(render_keys: Collection[Hashable]) -> Iterator[RenderCache]:
+    """Provide a render cache that is shared by all plugins while the context
+    is active. The render keys are those of all plugins that render HTML.
+    """
+    global _shared_render_cache
+    _shared_render_cache = RenderCache(
+        enabled=len(render_keys) > 1,
+        shared_render_keys=getSharedRenderKeys(render_keys),
+    )
+    try:
+        yield _shared_render_cache
+    finally:
+        _shared_render_cache = None
+
+
+def getRenderCache() -> RenderCache:
+    """Return the shared render cache. Without shared cache, fragments are
+    not stored, as nobody else would use them.
+    """
+    if _shared_render_cache is None:
+        return RenderCache(enabled=False)
+    return _shared_render_cache
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""Myers' O(ND) difference algorithm for arbitrary sequences of hashable elements.
+
+The linear space variant is used, see E. Myers (1986), "An O(ND) Difference
+Algorithm and Its Variations". Results are returned as opcodes compatible with
+difflib.SequenceMatcher.get_opcodes().
+
+The run time grows with the product of the sequence lengths and their edit
+distance. Callers that compare arbitrary input can bound the edit distance.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+Opcode = Tuple[str, int, int, int, int]
+MatchingBlock = Tuple[int, int, int]
+
+
+class EditDistanceExceeded(Exception):
+    """Raised if the edit distance of two sequences exceeds the given maximum"""
+
+    def __init__(self, max_edit_distance: int):
+        super().__init__(f"Edit distance exceeds {max_edit_distance}")
+        self.max_edit_distance: int = max_edit_distance
+
+
+class _MiddleSnakeSearch(object):
+    """Simultaneous forward and reverse search for the middle snake of an optimal edit path"""
+
+    def __init__(
+        self,
+        a: Sequence,
+        b: Sequence,
+        a_lo: int,
+        a_hi: int,
+        b_lo: int,
+        b_hi: int,
+        max_edit_distance: Optional[int] = None,
+    ):
+        self.a = a
+        self.b = b
+        self.a_lo = a_lo
+        self.a_hi = a_hi
+        self.b_lo = b_lo
+        self.b_hi = b_hi
+        self.n: int = a_hi - a_lo
+        self.m: int = b_hi - b_lo
+        self.max_edit_distance: Optional[int] = max_edit_distance
+        self.delta: int = self.n - self.m
+        self.max_d: int = (self.n + self.m + 1) // 2
+        if max_edit_distance is not None:
+            # Edit distances have the parity of delta. The middle snake of a path
+            # with D edits is found in step ceil(D / 2).
+            max_distance: int = max_edit_distance - (
+                (max_edit_distance - self.delta) % 2
+            )
+            self.max_d = min(self.max_d, (max_distance + 1) // 2 + 1)
+        self.v_offset: int = self.max_d
+        self.v_length: int = 2 * self.max_d + 2
+        self.v_forward: List[int] = [-1] * self.v_length
+        self.v_reverse: List[int] = [-1] * self.v_length
+        self.v_forward[self.v_offset + 1] = 0
+        self.v_reverse[self.v_offset + 1] = 0
+
+        # If the difference of the lengths is odd, the forward path will overlap
+        # the reverse path first. Otherwise the reverse path overlaps first.
+        self.check_forward: bool = (self.delta % 2) != 0
+
+        # Offsets for the start and end of the k loops, used to prune diagonals
+        # that run off the edit graph
+        self.k_start: List[int] = [0, 0]
+        self.k_end: List[int] = [0, 0]
+
+    def find(self) -> Optional[Tuple[int, int]]:
+        """Return a point (a index, b index) on an optimal edit path that splits
+        the problem into two halves or None if the two ranges have nothing in common
+        """
+        for d in range(self.max_d):
+            split = self._step(d, forward=True)
+            if split is not None:
+                return split
+            split = self._step(d, forward=False)
+            if split is not None:
+                return split
+        if (self.max_edit_distance is not None) and (
+            self.max_edit_distance < self.n + self.m
+        ):
+            raise EditDistanceExceeded(self.max_edit_distance)
+        return None
+
+    def _snake(self, x: int, y: int, forward: bool) -> Tuple[int, int]:
+        """Follow a diagonal of matching elements"""
+        a, b = self.a, self.b
+        if forward:
+            a_lo, b_lo = self.a_lo, self.b_lo
+            while (x < self.n) and (y < self.m) and (a[a_lo + x] == b[b_lo + y]):
+                x += 1
+                y += 1
+        else:
+            a_hi, b_hi = self.a_hi - 1, self.b_hi - 1
+            while (x < self.n) and (y < self.m) and (a[a_hi - x] == b[b_hi - y]):
+                x += 1
+                y += 1
+        return x, y
+
+    def _step(self, d: int, forward: bool) -> Optional[Tuple[int, int]]:
+        """Extend all furthest reaching d-paths in one direction by one edit"""
+        v: List[int] = self.v_forward if forward else self.v_reverse
+        v_other: List[int] = self.v_reverse if forward else self.v_forward
+        direction: int = 0 if forward else 1
+        check_overlap: bool = self.check_forward == forward
+
+        for k in range(-d + self.k_start[direction], d + 1 - self.k_end[direction], 2):
+            k_offset: int = self.v_offset + k
+            if (k == -d) or ((k != d) and (v[k_offset - 1] < v[k_offset + 1])):
+                x: int = v[k_offset + 1]
+            else:
+                x = v[k_offset - 1] + 1
+            x, y = self._snake(x, x - k, forward)
+            v[k_offset] = x
+            if x > self.n:
+                self.k_end[direction] += 2
+            elif y > self.m:
+                self.k_start[direction] += 2
+            elif check_overlap:
+                other_offset: int = self.v_offset + self.delta - k
+                if (0 <= other_offset < self.v_length) and (
+                    v_other[other_offset] != -1
+                ):
+                    if forward:
+                        x_forward, x_reverse = x, v_other[other_offset]
+                        y_forward = y
+                    else:
+                        x_forward, x_reverse = v_other[other_offset], x
+                        y_forward = self.v_offset + x_forward - other_offset
+                    if x_forward >= self.n - x_reverse:
+                        return self.a_lo + x_forward, self.b_lo + y_forward
+        return None
+
+
+def _collectMatchingBlocks(
+    a: Sequence,
+    b: Sequence,
+    a_lo: int,
+    a_hi: int,
+    b_lo: int,
+    b_hi: int,
+    blocks: List[MatchingBlock],
+    max_edit_distance: Optional[int],
+) -> None:
+    """Append the matching blocks of two sequence ranges in ascending order"""
+    # Common prefix
+    prefix: int = 0
+    while (
+        (a_lo + prefix < a_hi)
+        and (b_lo + prefix < b_hi)
+        and (a[a_lo + prefix] == b[b_lo + prefix])
+    ):
+        prefix += 1
+    if prefix > 0:
+        blocks.append((a_lo, b_lo, prefix))
+        a_lo += prefix
+        b_lo += prefix
+
+    # Common suffix
+    suffix: int = 0
+    while (
+        (a_lo < a_hi - suffix)
+        and (b_lo < b_hi - suffix)
+        and (a[a_hi - suffix - 1] == b[b_hi - suffix - 1])
+    ):
+        suffix += 1
+    a_hi -= suffix
+    b_hi -= suffix
+
+    if (a_lo < a_hi) and (b_lo < b_hi):
+        split: Optional[Tuple[int, int]] = _MiddleSnakeSearch(
+            a, b, a_lo, a_hi, b_lo, b_hi, max_edit_distance
+        ).find()
+        if (split is not None) and (split != (a_lo, b_lo)) and (split != (a_hi, b_hi)):
+            a_split, b_split = split
+            _collectMatchingBlocks(
+                a, b, a_lo, a_split, b_lo, b_split, blocks, max_edit_distance
+            )
+            _collectMatchingBlocks(
+                a, b, a_split, a_hi, b_split, b_hi, blocks, max_edit_distance
+            )
+
+    if suffix > 0:
+        blocks.append((a_hi, b_hi, suffix))
+
+
+def getMatchingBlocks(
+    a: Sequence, b: Sequence, max_edit_distance: Optional[int] = None
+) -> List[MatchingBlock]:
+    """Return the matching blocks of two sequences with adjacent blocks merged.
+    Raises EditDistanceExceeded if the sequences differ by more than max_edit_distance edits.
+    """
+    blocks: List[MatchingBlock] = []
+    _collectMatchingBlocks(a, b, 0, len(a), 0, len(b), blocks, max_edit_distance)
+
+    merged_blocks: List[MatchingBlock] = []
+    for block in blocks:
+        if merged_blocks:
+            i, j, size = merged_blocks[-1]
+            if (i + size == block[0]) and (j + size == block[1]):
+                merged_blocks[-1] = (i, j, size + block[2])
+                continue
+        merged_blocks.append(block)
+
+    return merged_blocks
+
+
+def getOpcodes(
+    a: Sequence, b: Sequence, max_edit_distance: Optional[int] = None
+) -> List[Opcode]:
+    """Return a list of opcodes that describe how to turn a into b,
+    see difflib.SequenceMatcher.get_opcodes(). Raises EditDistanceExceeded
+    if the sequences differ by more than max_edit_distance edits."""
+    opcodes: List[Opcode] = []
+    i: int = 0
+    j: int = 0
+    matching_blocks: List[MatchingBlock] = getMatchingBlocks(a, b, max_edit_distance)
+    for a_index, b_index, size in matching_blocks + [(len(a), len(b), 0)]:
+        tag: str = ""
+        if (i < a_index) and (j < b_index):
+            tag = "replace"
+        elif i < a_index:
+            tag = "delete"
+        elif j < b_index:
+            tag = "insert"
+        if tag:
+            opcodes.append((tag, i, a_index, j, b_index))
+        i = a_index + size
+        j = b_index + size
+        if size > 0:
+            opcodes.append(("equal", a_index, i, b_index, j))
+    return opcodes
@@ -20,7 +20,9 @@
 #
 
 from elf_diff.binary_pair_settings import BinaryPairSettings
+from elf_diff.budget_settings import BudgetRule
 from elf_diff.binutils import Binutils
+from elf_diff.string_diff import BACKENDS as STRING_DIFF_BACKENDS
 
 import sys
 import os
@@ -114,6 +116,16 @@ GROUPED_PARAMETERS: Dict[str, List[Parameter]] = {
             default=False,
             is_flag=True,
         ),
+        Parameter(
+            "string_diff_backend",
+            "The algorithm used to highlight differences of symbol names (difflib or myers). myers compares long names token by token and is faster for long, templated names",
+            default="difflib",
+        ),
+        Parameter(
+            "instruction_diff_max_lines",
+            "The maximum number of lines of instruction difference tables. Longer differences are truncated",
+            default=5000,
+        ),
         Parameter(
             "skip_persisting_same_size",
             "If this flag is provided, persisting symbols without size changes are skipped",
@@ -183,6 +195,10 @@ GROUPED_PARAMETERS: Dict[str, List[Parameter]] = {
             "html_file", "The filename of the generated single page HTML report."
         ),
         Parameter("html_dir", "The directory of the generated multi page HTML report."),
+        Parameter(
+            "compact_html_file",
+            "The filename of a compact single page HTML report that embeds compressed symbol data and renders it in the browser.",
+        ),
         Parameter("pdf_file", "The filename of the generated PDF report."),
         Parameter("yaml_file", "The filename of the generated YAML report."),
         Parameter("json_file", "The filename of the generated JSON report."),
@@ -191,6 +207,37 @@ GROUPED_PARAMETERS: Dict[str, List[Parameter]] = {
             "stats_txt_file", "The filename of the generated statistics text file."
         ),
         Parameter("xml_file", "The filename of the generated XML report."),
+        Parameter(
+            "incremental",
+            "If this flag is provided, multi page HTML reports (see html_dir) only rewrite files whose content changed since the previous report in the same directory and remove stale files",
+            default=False,
+            is_flag=True,
+        ),
+        Parameter(
+            "virtual_overview_tables",
+            "If this flag is provided, HTML reports (see html_dir and html_file) embed the rows of symbol overview tables as JSON, only visible rows are rendered by the browser",
+            default=False,
+            is_flag=True,
+        ),
+        Parameter(
+            "template_cache_dir",
+            "A directory where compiled Jinja2 templates are cached across runs. Templates that did not change are not compiled again.",
+        ),
+        Parameter(
+            "diff_cache_dir",
+            "A directory where instruction difference tables, symbol similarities and highlighted symbol name differences are cached across runs.",
+        ),
+        Parameter(
+            "diff_cache_max_mb",
+            "The maximum size of the diff cache (see diff_cache_dir) in megabytes. Least recently used entries are removed first",
+            default=256,
+        ),
+        Parameter(
+            "check",
+            "If this flag is provided, no report is generated. elf_diff only checks whether the binaries differ significantly (see stats_txt_file) and returns exit code 3 if they do",
+            default=False,
+            is_flag=True,
+        ),
         Parameter(
             "dump_document_structure",
             "If this flag is provided, the elf_diff document structure is written to stdout",
@@ -263,6 +310,16 @@ GROUPED_PARAMETERS: Dict[str, List[Parameter]] = {
             "driver_template_file",
             "A yaml file that is generated at the end of the run. It contains default parameters if no report was generated or, otherwise, the parameters that were read.",
         ),
+        Parameter(
+            "budget_verdict_file",
+            "A JSON file that receives the results of checking the budgets defined in the driver file.",
+        ),
+        Parameter(
+            "check_budgets",
+            "If this flag is provided, no report is generated. elf_diff only checks the budgets defined in the driver file and returns exit code 4 if any is exceeded",
+            default=False,
+            is_flag=True,
+        ),
     ],
 }
 
@@ -274,6 +331,11 @@ UNGROUPED_PARAMETERS = [
         default=False,
         is_flag=True,
     ),
+    Parameter(
+        "jobs",
+        "The number of worker processes used by parallelizable stages of elf_diff, e.g. rendering the pages of multi page HTML reports (0 uses all CPU cores).",
+        default=1,
+    ),
 ]
 
 PARAMETERS: List[Parameter] = []
@@ -303,15 +365,24 @@ class Settings(object):
         self.new_mangling_file: str
         self.html_file: str
         self.html_dir: str
+        self.compact_html_file: str
         self.pdf_file: str
         self.yaml_file: str
         self.json_file: str
         self.txt_file: str
         self.stats_txt_file: str
         self.xml_file: str
+        self.template_cache_dir: str
+        self.diff_cache_dir: str
+        self.diff_cache_max_mb: float
+        self.incremental: bool
+        self.virtual_overview_tables: bool
         self.project_title: str
         self.driver_file: str
         self.driver_template_file: str
+        self.budget_verdict_file: str
+        self.check_budgets: bool
+        self.check: bool
         self.dump_document_structure: bool
         self.mass_report: bool
         self.language: str
@@ -320,6 +391,8 @@ class Settings(object):
         self.new_source_prefix: List[str]
         self.similarity_threshold: float
         self.skip_symbol_similarities: bool
+        self.string_diff_backend: str
+        self.instruction_diff_max_lines: int
         self.skip_persisting_same_size: bool
         self.consider_equal_sized_identical: bool
         self.skip_details: bool
@@ -333,6 +406,7 @@ class Settings(object):
         self.load_default_plugin: str
         self.list_default_plugins: bool
         self.debug: bool
+        self.jobs: int
 
         self.binutils = Binutils()
 
@@ -357,6 +431,7 @@ class Settings(object):
     def _presetDefaults(self) -> None:
         """Preset default values"""
         self.mass_report_members: List[BinaryPairSettings] = []
+        self.budgets: List[BudgetRule] = []
 
         for parameter in PARAMETERS:
             if not parameter.no_member:
@@ -460,8 +535,11 @@ class Settings(object):
             my_yaml, bin_prefix=self.bin_prefix, bin_dir=self.bin_dir
         )
 
-        # Read binary pairs
+        self._readBinaryPairs(my_yaml)
+        self._readBudgets(my_yaml)
 
+    def _readBinaryPairs(self, my_yaml: Dict) -> None:
+        """Read binary pairs from a YAML driver file"""
         if "binary_pairs" in my_yaml.keys():
             bin_pair_id: int = 1
 
@@ -491,6 +569,12 @@ class Settings(object):
 
                 bin_pair_id += 1
 
+    def _readBudgets(self, my_yaml: Dict) -> None:
+        """Read budgets from a YAML driver file"""
+        if "budgets" in my_yaml.keys():
+            for rule_id, entry in enumerate(my_yaml["budgets"], start=1):
+                self.budgets.append(BudgetRule.fromDriverFileEntry(entry, rule_id))
+
     def _considerCommandLineArgs(self, cmd_line_args: Any) -> None:
         """Consider the supplied command line arguments"""
         for parameter in PARAMETERS:
@@ -538,6 +622,48 @@ class Settings(object):
                 % (self.new_binary_filename)
             )
 
+    def _validateStringDiffBackend(self) -> None:
+        if self.string_diff_backend not in STRING_DIFF_BACKENDS:
+            raise Exception(
+                "Unknown string diff backend '%s'. Available: %s"
+                % (self.string_diff_backend, ", ".join(STRING_DIFF_BACKENDS))
+            )
+
+    def _validateJobs(self) -> None:
+        try:
+            jobs = int(self.jobs)
+        except ValueError:
+            raise Exception(f"Invalid number of jobs '{self.jobs}'")
+        if jobs < 0:
+            raise Exception(f"Invalid number of jobs '{self.jobs}'")
+        self.jobs = jobs or (os.cpu_count() or 1)
+
+    def _validateInstructionDiffMaxLines(self) -> None:
+        try:
+            max_lines = int(self.instruction_diff_max_lines)
+        except ValueError:
+            raise Exception(
+                f"Invalid maximum number of instruction diff lines '{self.instruction_diff_max_lines}'"
+            )
+        if max_lines < 1:
+            raise Exception(
+                f"Invalid maximum number of instruction diff lines '{self.instruction_diff_max_lines}'"
+            )
+        self.instruction_diff_max_lines = max_lines
+
+    def _validateDiffCacheMaxMB(self) -> None:
+        try:
+            max_mb = float(self.diff_cache_max_mb)
+        except ValueError:
+            raise Exception(f"Invalid diff cache size '{self.diff_cache_max_mb}'")
+        if max_mb < 0:
+            raise Exception(f"Invalid diff cache size '{self.diff_cache_max_mb}'")
+        self.diff_cache_max_mb = max_mb
+
+    def _validateBudgets(self) -> None:
+        if self.check_budgets and (len(self.budgets) == 0):
+            raise Exception("No budgets defined. Please add budgets to the driver file")
+
     def _prepareInfoFiles(self) -> None:
         if self.old_info_file:
             if os.path.isfile(self.old_info_file):
@@ -570,6 +696,11 @@ class Settings(object):
 
     def _validateAndInitSettings(self) -> None:
         self._validateBinaries()
+        self._validateStringDiffBackend()
+        self._validateJobs()
+        self._validateInstructionDiffMaxLines()
+        self._validateDiffCacheMaxMB()
+        self._validateBudgets()
 
         self._prepareInfoFiles()
         self._prepareAlias()
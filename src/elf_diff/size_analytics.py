@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff.symbol import Symbol
+
+import numpy as np
+from typing import Dict, List, Tuple
+
+# The number of symbols listed as largest growth/shrinkage
+TOP_N_SYMBOLS = 10
+
+# The percentiles of symbol size deltas that are computed
+DELTA_PERCENTILES: Tuple[int, ...] = (1, 10, 50, 90, 99)
+
+# The number of bins of the size delta histogram
+NUM_HISTOGRAM_BINS = 10
+
+
+class SizeTotals(object):
+    """Old and new size totals of a group of symbols"""
+
+    def __init__(self, old: int, new: int):
+        """Initialize size totals object."""
+        self.old = old
+        self.new = new
+        self.delta = new - old
+
+
+class AlignedSymbols(object):
+    """Symbol properties of one binary aligned to a shared symbol name index"""
+
+    def __init__(self, symbols: Dict[str, Symbol], name_index: Dict[str, int]):
+        """Initialize aligned symbols object."""
+        n_symbols: int = len(symbols)
+        self.indices = np.fromiter(
+            (name_index[name] for name in symbols.keys()),
+            dtype=np.int64,
+            count=n_symbols,
+        )
+        self.sizes = np.fromiter(
+            (symbol.size for symbol in symbols.values()),
+            dtype=np.int64,
+            count=n_symbols,
+        )
+        self.ids = np.fromiter(
+            (symbol.id_ for symbol in symbols.values()), dtype=np.int64, count=n_symbols
+        )
+        self.types = np.array(
+            [symbol.type_ for symbol in symbols.values()], dtype="<U1"
+        )
+
+
+class SizeAnalytics(object):
+    """Vectorized statistics about the sizes of the symbols of two binaries"""
+
+    def __init__(self, old_symbols: Dict[str, Symbol], new_symbols: Dict[str, Symbol]):
+        """Initialize size analytics object."""
+        symbol_names: List[str] = sorted(
+            set(old_symbols.keys()) | set(new_symbols.keys())
+        )
+        name_index: Dict[str, int] = {
+            name: index for index, name in enumerate(symbol_names)
+        }
+        n_symbols: int = len(symbol_names)
+
+        self.old = AlignedSymbols(old_symbols, name_index)
+        self.new = AlignedSymbols(new_symbols, name_index)
+
+        old_sizes = np.zeros(n_symbols, dtype=np.int64)
+        old_sizes[self.old.indices] = self.old.sizes
+        new_sizes = np.zeros(n_symbols, dtype=np.int64)
+        new_sizes[self.new.indices] = self.new.sizes
+        old_ids = np.full(n_symbols, -1, dtype=np.int64)
+        old_ids[self.old.indices] = self.old.ids
+
+        is_persisting = np.zeros(n_symbols, dtype=bool)
+        is_persisting[self.old.indices] = True
+        is_new = np.zeros(n_symbols, dtype=bool)
+        is_new[self.new.indices] = True
+        is_persisting &= is_new
+
+        # Size deltas and old symbol ids of symbols present in both binaries
+        self.persisting_deltas = new_sizes[is_persisting] - old_sizes[is_persisting]
+        self.persisting_old_ids = old_ids[is_persisting]
+
+    def largestGrowth(self, n: int = TOP_N_SYMBOLS) -> List[int]:
+        """Return the old ids of the persisting symbols with the largest size increase, largest first"""
+        return self._largestDeltas(self.persisting_deltas, n)
+
+    def largestShrinkage(self, n: int = TOP_N_SYMBOLS) -> List[int]:
+        """Return the old ids of the persisting symbols with the largest size decrease, largest first"""
+        return self._largestDeltas(-self.persisting_deltas, n)
+
+    def _largestDeltas(self, deltas: np.ndarray, n: int) -> List[int]:
+        """Return the old ids of the persisting symbols with the n largest positive deltas"""
+        candidates = np.flatnonzero(deltas > 0)
+        if len(candidates) > n:
+            candidates = candidates[np.argpartition(-deltas[candidates], n - 1)[:n]]
+        # Sort by descending delta, equal deltas by ascending id
+        order = np.lexsort((self.persisting_old_ids[candidates], -deltas[candidates]))
+        return self.persisting_old_ids[candidates[order]].tolist()
+
+    def deltaPercentiles(self) -> Dict[int, float]:
+        """Return percentiles of the size deltas of persisting symbols"""
+        if len(self.persisting_deltas) == 0:
+            return {percentile: 0.0 for percentile in DELTA_PERCENTILES}
+        values = np.percentile(self.persisting_deltas, DELTA_PERCENTILES)
+        return dict(zip(DELTA_PERCENTILES, values.tolist()))
+
+    def deltaHistogram(
+        self, num_bins: int = NUM_HISTOGRAM_BINS
+    ) -> Tuple[List[int], List[float]]:
+        """Return counts and bin edges of a histogram of the size deltas of persisting symbols
+        whose size changed"""
+        changed_deltas = self.persisting_deltas[self.persisting_deltas != 0]
+        if len(changed_deltas) == 0:
+            return [], []
+        counts, bin_edges = np.histogram(changed_deltas, bins=num_bins)
+        return counts.tolist(), bin_edges.tolist()
+
+    def totalsByType(self) -> Dict[str, SizeTotals]:
+        """Return the size totals of all symbols grouped by nm symbol type"""
+        types, inverse = np.unique(
+            np.concatenate((self.old.types, self.new.types)), return_inverse=True
+        )
+        n_old: int = len(self.old.types)
+        old_totals = np.bincount(
+            inverse[:n_old], weights=self.old.sizes, minlength=len(types)
+        )
+        new_totals = np.bincount(
+            inverse[n_old:], weights=self.new.sizes, minlength=len(types)
+        )
+        return {
+            type_: SizeTotals(int(old_total), int(new_total))
+            for type_, old_total, new_total in zip(
+                types.tolist(), old_totals.tolist(), new_totals.tolist()
+            )
+        }
+
+    def totalsByMemoryClass(self) -> Tuple[SizeTotals, SizeTotals]:
+        """Return the size totals of all symbols stored in program memory and of
+        those only stored in RAM"""
+        old_in_ram = np.isin(self.old.types, Symbol.RAM_ONLY_TYPES)
+        new_in_ram = np.isin(self.new.types, Symbol.RAM_ONLY_TYPES)
+        program_memory = SizeTotals(
+            int(self.old.sizes[~old_in_ram].sum()),
+            int(self.new.sizes[~new_in_ram].sum()),
+        )
+        ram = SizeTotals(
+            int(self.old.sizes[old_in_ram].sum()),
+            int(self.new.sizes[new_in_ram].sum()),
+        )
+        return program_memory, ram
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff.binary_pair import BinaryPair
+from elf_diff.binary import Binary
+from elf_diff.symbol import Symbol
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+NAMESPACE_SEPARATOR = "::"
+
+# Matches both types of path separators to support sources compiled on Windows
+PATH_SEPARATOR_RE = re.compile(r"[/\\]+")
+
+
+def splitNamespace(namespace: Optional[str]) -> List[str]:
+    """Split a namespace into its components. Separators nested in template
+    argument lists or function argument lists are ignored."""
+    if not namespace:
+        return []
+
+    components: List[str] = []
+    depth: int = 0
+    start: int = 0
+    i: int = 0
+    n: int = len(namespace)
+    while i < n:
+        c = namespace[i]
+        if c in "<(":
+            depth += 1
+        elif c in ">)":
+            depth -= 1
+        elif (depth == 0) and namespace.startswith(NAMESPACE_SEPARATOR, i):
+            components.append(namespace[start:i])
+            i += len(NAMESPACE_SEPARATOR)
+            start = i
+            continue
+        i += 1
+    components.append(namespace[start:])
+
+    return components
+
+
+def splitSourceDirectory(path: str) -> List[str]:
+    """Split the directory portion of a source file path into its components"""
+    components: List[str] = PATH_SEPARATOR_RE.split(path)
+    return [component for component in components[:-1] if component != ""]
+
+
+class RollupEntry(object):
+    """A node of a rollup prefix tree that aggregates the sizes of all symbols
+    within its scope"""
+
+    def __init__(self, name: str):
+        """Initialize rollup entry object."""
+        self.name: str = name
+        self.old: int = 0
+        self.new: int = 0
+        self.appeared: int = 0
+        self.disappeared: int = 0
+        self.children: Dict[str, RollupEntry] = {}
+
+    @property
+    def delta(self) -> int:
+        """The size difference between new and old version"""
+        return self.new - self.old
+
+    def getChild(self, name: str) -> "RollupEntry":
+        """Return a child entry, create it if necessary"""
+        child: Optional[RollupEntry] = self.children.get(name)
+        if child is None:
+            child = RollupEntry(name)
+            self.children[name] = child
+        return child
+
+    def add(self, old: int, new: int, appeared: int, disappeared: int) -> None:
+        """Add sizes to the entry"""
+        self.old += old
+        self.new += new
+        self.appeared += appeared
+        self.disappeared += disappeared
+
+
+class SizeRollups(object):
+    """Size aggregates of old and new symbols by namespace, by class and by source directory"""
+
+    def __init__(self, binary_pair: BinaryPair):
+        """Initialize size rollups object."""
+        self.by_namespace = RollupEntry("")
+        self.by_source_directory = RollupEntry("")
+
+        # Namespaces and classes cannot be distinguished from a naming perspective.
+        # Thus, classes are identified with the innermost scope that directly
+        # contains symbols.
+        self.by_class: Dict[str, RollupEntry] = {}
+
+        self._source_directory_cache: Dict[Tuple[int, int], List[str]] = {}
+
+        self._rollupBinary(binary_pair.old_binary, binary_pair.new_binary, is_old=True)
+        self._rollupBinary(binary_pair.new_binary, binary_pair.old_binary, is_old=False)
+
+    def _getSourceDirectory(self, binary: Binary, symbol: Symbol) -> List[str]:
+        """Return the source directory components of a symbol"""
+        if symbol.source_id is None:
+            return []
+        key = (id(binary), symbol.source_id)
+        components: Optional[List[str]] = self._source_directory_cache.get(key)
+        if components is None:
+            components = splitSourceDirectory(
+                binary.source_files[symbol.source_id].path_wo_prefix
+            )
+            self._source_directory_cache[key] = components
+        return components
+
+    @staticmethod
+    def _addToPath(
+        root: RollupEntry, path: List[str], sizes: Tuple[int, int, int, int]
+    ) -> RollupEntry:
+        """Add sizes to all entries along a path, return the final entry"""
+        entry: RollupEntry = root
+        entry.add(*sizes)
+        for component in path:
+            entry = entry.getChild(component)
+            entry.add(*sizes)
+        return entry
+
+    def _rollupBinary(self, binary: Binary, other_binary: Binary, is_old: bool) -> None:
+        """Add the sizes of all symbols of a binary to the rollups"""
+        other_symbols: Dict[str, Symbol] = other_binary.symbols
+        for symbol_name, symbol in binary.symbols.items():
+            is_isolated: bool = symbol_name not in other_symbols
+            isolated_size: int = symbol.size if is_isolated else 0
+            sizes: Tuple[int, int, int, int]
+            if is_old:
+                sizes = (symbol.size, 0, 0, isolated_size)
+            else:
+                sizes = (0, symbol.size, isolated_size, 0)
+
+            namespace: Optional[str] = getattr(symbol, "namespace", None)
+            self._addToPath(self.by_namespace, splitNamespace(namespace), sizes)
+
+            if namespace:
+                class_entry: Optional[RollupEntry] = self.by_class.get(namespace)
+                if class_entry is None:
+                    class_entry = RollupEntry(namespace)
+                    self.by_class[namespace] = class_entry
+                class_entry.add(*sizes)
+
+            self._addToPath(
+                self.by_source_directory,
+                self._getSourceDirectory(binary, symbol),
+                sizes,
+            )
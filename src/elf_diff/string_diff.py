@@ -18,46 +18,153 @@
 # You should have received a copy of the GNU General Public License along with along with
 # this program. If not, see <http://www.gnu.org/licenses/>.
 #
+from elf_diff.sequence_diff import (
+    getOpcodes as getMyersOpcodes,
+    EditDistanceExceeded,
+    Opcode,
+)
+
 import difflib
-from typing import List
+import re
+from typing import List, Tuple
 
 HIGHLIGHT_START_TAG = "...HIGHLIGHT_START..."
 HIGHLIGHT_END_TAG = "...HIGHLIGHT_END..."
 
+BACKEND_DIFFLIB = "difflib"
+BACKEND_MYERS = "myers"
 
-def tagStringDiffSource(str1: str, str2: str):
-    """Determine the difference between two strings, and tag them wrt. the source string"""
-    seqm = difflib.SequenceMatcher(isjunk=None, a=str1, b=str2)
-    output: List[str] = []
-    for opcode, a0, a1, b0, b1 in seqm.get_opcodes():  # pylint: disable=unused-variable
-        if opcode == "equal":
-            output.append(str1[a0:a1])
-        elif opcode == "insert":
-            pass
-        elif opcode == "delete":
-            output.append(HIGHLIGHT_START_TAG + str1[a0:a1] + HIGHLIGHT_END_TAG)
-        elif opcode == "replace":
-            output.append(HIGHLIGHT_START_TAG + str1[a0:a1] + HIGHLIGHT_END_TAG)
+BACKENDS: Tuple[str, ...] = (BACKEND_DIFFLIB, BACKEND_MYERS)
+
+# Must be increased whenever the tagged strings of any backend change
+STRING_DIFF_VERSION = 1
+
+# Identifiers and numbers, runs of whitespace and single other characters
+TOKEN_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+
+# Token based diffs only pay off for long strings. Shorter strings
+# (by overall number of characters) are compared with difflib.
+MYERS_MIN_LENGTH = 1000
+
+# The run time of Myers' algorithm grows with the edit distance. Strings that
+# differ by more tokens are compared with difflib, token by token.
+MYERS_MAX_EDIT_DISTANCE = 64
+
+
+def _commonPrefixLength(str1: str, str2: str) -> int:
+    """Return the length of the common prefix of two strings. Bisection on
+    slice comparisons avoids comparing character by character in Python."""
+    lo: int = 0
+    hi: int = min(len(str1), len(str2))
+    while lo < hi:
+        mid: int = (lo + hi + 1) // 2
+        if str1[:mid] == str2[:mid]:
+            lo = mid
         else:
-            raise RuntimeError("unexpected opcode")
+            hi = mid - 1
+    return lo
 
-    return "".join(output)
 
+def _commonSuffixLength(str1: str, str2: str, max_length: int) -> int:
+    """Return the length of the common suffix of two strings, at most max_length"""
+    lo: int = 0
+    hi: int = max_length
+    while lo < hi:
+        mid: int = (lo + hi + 1) // 2
+        if str1[len(str1) - mid :] == str2[len(str2) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
 
-def tagStringDiffTarget(str1: str, str2: str):
-    """Determine the difference between two strings, and tag them wrt. the target string"""
-    seqm = difflib.SequenceMatcher(isjunk=None, a=str1, b=str2)
-    output = []
-    for opcode, a0, a1, b0, b1 in seqm.get_opcodes():
+
+def _tokenOffsets(start: int, tokens: List[str]) -> List[int]:
+    """Return the string offsets of all tokens and the end of the last token"""
+    offsets: List[int] = [start]
+    for token in tokens:
+        offsets.append(offsets[-1] + len(token))
+    return offsets
+
+
+def _getTokenDiffOpcodes(str1: str, str2: str) -> List[Opcode]:
+    """Return the opcodes that describe how to turn str1 into str2. The common
+    prefix and suffix are skipped, the remainders are compared token by token."""
+    prefix: int = _commonPrefixLength(str1, str2)
+    suffix: int = _commonSuffixLength(str1, str2, min(len(str1), len(str2)) - prefix)
+    end1: int = len(str1) - suffix
+    end2: int = len(str2) - suffix
+    tokens1: List[str] = TOKEN_PATTERN.findall(str1, prefix, end1)
+    tokens2: List[str] = TOKEN_PATTERN.findall(str2, prefix, end2)
+
+    token_opcodes: List[Opcode]
+    try:
+        token_opcodes = getMyersOpcodes(tokens1, tokens2, MYERS_MAX_EDIT_DISTANCE)
+    except EditDistanceExceeded:
+        token_opcodes = list(
+            difflib.SequenceMatcher(isjunk=None, a=tokens1, b=tokens2).get_opcodes()
+        )
+
+    offsets1: List[int] = _tokenOffsets(prefix, tokens1)
+    offsets2: List[int] = _tokenOffsets(prefix, tokens2)
+    opcodes: List[Opcode] = []
+    if prefix > 0:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    for tag, i1, i2, j1, j2 in token_opcodes:
+        opcodes.append((tag, offsets1[i1], offsets1[i2], offsets2[j1], offsets2[j2]))
+    if suffix > 0:
+        opcodes.append(("equal", end1, len(str1), end2, len(str2)))
+    return opcodes
+
+
+def getStringDiffOpcodes(
+    str1: str, str2: str, backend: str = BACKEND_DIFFLIB
+) -> List[Opcode]:
+    """Return the opcodes that describe how to turn str1 into str2. The myers
+    backend compares long strings token by token, see _getTokenDiffOpcodes()."""
+    if backend == BACKEND_MYERS:
+        if len(str1) + len(str2) >= MYERS_MIN_LENGTH:
+            return _getTokenDiffOpcodes(str1, str2)
+        backend = BACKEND_DIFFLIB
+    if backend == BACKEND_DIFFLIB:
+        return list(difflib.SequenceMatcher(isjunk=None, a=str1, b=str2).get_opcodes())
+
+    raise Exception(
+        f"Unknown string diff backend '{backend}'. Available: {', '.join(BACKENDS)}"
+    )
+
+
+def _tag(str_: str) -> str:
+    return HIGHLIGHT_START_TAG + str_ + HIGHLIGHT_END_TAG
+
+
+def tagStringDiff(
+    str1: str, str2: str, backend: str = BACKEND_DIFFLIB
+) -> Tuple[str, str]:
+    """Determine the difference between two strings once and tag both of them wrt. each other"""
+    source_output: List[str] = []
+    target_output: List[str] = []
+    for opcode, a0, a1, b0, b1 in getStringDiffOpcodes(str1, str2, backend):
         if opcode == "equal":
-            output.append(str2[b0:b1])
+            source_output.append(str1[a0:a1])
+            target_output.append(str2[b0:b1])
         elif opcode == "insert":
-            output.append(HIGHLIGHT_START_TAG + str2[b0:b1] + HIGHLIGHT_END_TAG)
+            target_output.append(_tag(str2[b0:b1]))
         elif opcode == "delete":
-            pass
+            source_output.append(_tag(str1[a0:a1]))
         elif opcode == "replace":
-            output.append(HIGHLIGHT_START_TAG + str2[b0:b1] + HIGHLIGHT_END_TAG)
+            source_output.append(_tag(str1[a0:a1]))
+            target_output.append(_tag(str2[b0:b1]))
         else:
             raise RuntimeError("unexpected opcode")
 
-    return "".join(output)
+    return "".join(source_output), "".join(target_output)
+
+
+def tagStringDiffSource(str1: str, str2: str, backend: str = BACKEND_DIFFLIB):
+    """Determine the difference between two strings, and tag them wrt. the source string"""
+    return tagStringDiff(str1, str2, backend)[0]
+
+
+def tagStringDiffTarget(str1: str, str2: str, backend: str = BACKEND_DIFFLIB):
+    """Determine the difference between two strings, and tag them wrt. the target string"""
+    return tagStringDiff(str1, str2, backend)[1]
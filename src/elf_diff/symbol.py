@@ -26,6 +26,9 @@ class Symbol(object):
     TYPE_FUNCTION = 1
     TYPE_DATA = 2
 
+    # nm symbol types of symbols that are not stored in program memory
+    RAM_ONLY_TYPES: Tuple[str, ...] = ("B", "b", "S", "s")
+
     _CONSECUTIVE_ID = 0
 
     def __init__(self, name: str, name_mangled: str, is_demangled: bool):
@@ -49,13 +52,17 @@ class Symbol(object):
 
     def init(self) -> None:
         """A delayed initialization method"""
+        self.initInstructions()
+        self.id_ = Symbol._getConsecutiveId()
+
+    def initInstructions(self) -> None:
+        """Derive instruction string and hash from the instruction lines"""
         self.instructions: str = ""
         instructions_for_hash: str = ""
         for instruction_line in self.instruction_lines:
             self.instructions += "%s\n" % instruction_line
             instructions_for_hash += "".join(instruction_line)
         self.instructions_hash = hash(instructions_for_hash)
-        self.id_ = Symbol._getConsecutiveId()
 
     def hasInstructions(self) -> bool:
         """Check wether a symbol has related assmbly instructions"""
@@ -103,12 +110,7 @@ class Symbol(object):
 
     def livesInProgramMemory(self) -> bool:
         """Return True if the symbol is of a type that is stored in program memory (on a Harvard system)"""
-        return (
-            (self.type_ != "B")
-            and (self.type_ != "b")
-            and (self.type_ != "S")
-            and (self.type_ != "s")
-        )
+        return self.type_ not in Symbol.RAM_ONLY_TYPES
 
 
 class CppSymbol(Symbol):
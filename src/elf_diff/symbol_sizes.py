@@ -23,6 +23,17 @@ from elf_diff.binutils import Binutils
 from elf_diff.error_handling import warning
 
 import re
+from typing import Dict
+
+# Resource consumption values as named in the document, mapped to the
+# respective attributes of SymbolSizes
+RESOURCE_CONSUMPTION_ATTRIBUTES: Dict[str, str] = {
+    "code": "progmem_size",
+    "text": "text_size",
+    "data": "data_size",
+    "static_ram": "static_ram_size",
+    "bss": "bss_size",
+}
 
 
 class SymbolSizes(object):
@@ -57,3 +68,25 @@ class SymbolSizes(object):
                 self.progmem_size = self.text_size + self.data_size
                 self.static_ram_size = self.data_size + self.bss_size
                 break
+
+
+def getSectionSizes(filename: str, binutils: Binutils) -> Dict[str, int]:
+    """Determine the sizes of all sections of a binary. For archives the sizes
+    of equally named sections of all members are accumulated."""
+    section_sizes: Dict[str, int] = {}
+    if binutils.size_command is None:
+        warning("No binutils size command available. Unable to read section sizes")
+        return section_sizes
+
+    size_output: str = runSystemCommand([binutils.size_command, "-A", filename])
+
+    section_re = re.compile(r"^(\S+)\s+([0-9]+)\s+([0-9]+)\s*$")
+    for line in size_output.splitlines():
+        section_match = re.match(section_re, line)
+        if section_match:
+            section_name: str = section_match.group(1)
+            section_sizes[section_name] = section_sizes.get(section_name, 0) + int(
+                section_match.group(2)
+            )
+
+    return section_sizes
@@ -26,19 +26,39 @@ from elf_diff.meta_tree import (  # pylint: disable=unused-import  # noqa: F401
 )
 from elf_diff.tree_exception import TreeException
 
+import contextlib
+from types import MappingProxyType
+from collections.abc import Mapping
+
 # Type Any used for type checking. Pylint seems not to see that.
 from typing import (  # pylint: disable=unused-import # noqa: F401
     Union,
     Dict,
     Optional,
     Type,
+    Callable,
+    Tuple,
+    List,
+    Set,
+    Iterator,
+    Iterable,
+    Hashable,
     Any,  # pylint: disable=unused-import # noqa: F401
 )
 
-ValueType = Union[str, int, float, dict]
+ValueType = Union[str, int, float, dict, list]
+
+# If enabled, assignments to value tree nodes are neither checked against
+# the meta tree nor validated. See trustedAssignments() and validateTree(...)
+TRUSTED_ASSIGNMENTS: bool = False
 
 
 class Value(object):
+    """A lightweight wrapper of a value and its meta tree value. Wrappers are
+    created on demand and are not stored in the value tree."""
+
+    __slots__ = ("_value", "_meta_tree_value")
+
     def __init__(self, value: ValueType, meta_tree_value: MetaTreeValue):
         self._value = value
         self._meta_tree_value = meta_tree_value
@@ -77,62 +97,117 @@ class Value(object):
             self._meta_tree_value._properties._type.validate(self)
 
 
+class NodeValues(Mapping):
+    """A read-only view of the values of a value tree node. Value wrappers
+    are created on access."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        # type: (Node) -> None
+        self._node = node
+
+    def __getitem__(self, name: str) -> Value:
+        if name not in self._node._m._values:
+            raise KeyError(name)
+        return self._node.getValue(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._node._m._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._node._value_names)
+
+    def __len__(self) -> int:
+        return len(self._node._value_names)
+
+
+class NodeChildren(Mapping):
+    """A read-only view of the child nodes of a value tree node"""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        # type: (Node) -> None
+        self._node = node
+
+    def __getitem__(self, name):
+        # type: (str) -> Node
+        if name not in self._node._m._children:
+            raise KeyError(name)
+        return getattr(self._node, name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._node._m._children
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._node._child_names)
+
+    def __len__(self) -> int:
+        return len(self._node._child_names)
+
+
 class Node(object):
-    """A node of the tree that represents the document externally"""
+    """A node of the tree that represents the document externally.
+    Values and children are stored in slots of classes that are compiled
+    per meta tree node (see getNodeFactory(...)). Nodes have no instance dict."""
 
     NODE_ATTRIBUTE = 1
     VALUE_ATTRIBUTE = 2
 
-    def __init__(self):
-        self.attachMetaTreeNode(None)
+    __slots__ = ()
+
+    # The following class attributes are defined by compiled node classes
+
+    # The associated meta tree node
+    _m: MetaTreeNode
+
+    # Names of values and children in the order of the slots
+    _value_names: Tuple[str, ...] = ()
+    _child_names: Tuple[str, ...] = ()
+
+    # Value and child attributes by name, shared by all nodes of a compiled class
+    _attributes: Mapping = MappingProxyType({})
 
     def __getattr__(self, name):
         # type: (str) -> Any
         """An overloaded attribute getter method that helps with error reporting
-        when developing Jinja templates.
+        when developing Jinja templates. It is only called for undefined members.
 
         name: The name of the member to be accessed.
         """
-        if name not in self.__dict__.keys():
-            # print("Members available")
-            # for key in self.__dict__.keys():
-            #    print("   %s" % key)
-            raise Exception(
-                "Tree node %s does not have a member '%s'" % (self.getPath(), name)
-            )
-        return self.__dict__[name]
+        raise Exception(
+            "Tree node %s does not have a member '%s'" % (self.getPath(), name)
+        )
 
     def __setattr__(self, name: str, value: ValueType) -> None:
         """An overloaded attribute setter method that takes care of notifying the associated
         meta tree node of the value update.
         """
-        super().__setattr__(name, value)
+        if TRUSTED_ASSIGNMENTS:
+            object.__setattr__(self, name, value)
+            return
 
         meta_tree_node = self.getMetaTreeNode()
-        if name not in meta_tree_node._values.keys():
+        if name not in meta_tree_node._values:
             raise TreeException(
                 meta_tree_node, f"Trying to assign to undefined member '{name}'"
             )
 
+        object.__setattr__(self, name, value)
+
         if value is not None:
             self.getValue(name).validate()
 
-    def attachMetaTreeNode(self, meta_tree_node):
-        # type: (Optional[MetaTreeNode]) -> None
-        """Attach the associated meta tree node"""
-        self.__dict__[
-            "_m"
-        ] = meta_tree_node  # Not using setattr(...) prevents __setattr__ being invoked
-
     def addChild(self, name, value_tree_node):
         # type: (str, Node) -> None
         """Add a child value tree node"""
-        self.__dict__[name] = value_tree_node
+        object.__setattr__(self, name, value_tree_node)
 
     def getMetaTreeNode(self):
         # type: () -> MetaTreeNode # Class Node yet undeclared at this point
         """Return the associated meta tree node"""
-        return self.__dict__["_m"]
+        return self._m
 
     def getPath(self) -> str:
         """Return a formatted version of the node's tree path"""
@@ -140,26 +215,19 @@ class Node(object):
         return meta_tree_node.getPath()
 
     def getValue(self, name) -> Value:
-        return Value(getattr(self, name), self.getMetaTreeNode()._values[name])
+        return Value(getattr(self, name), self._m._values[name])
 
-    def getValues(self) -> Dict[str, Value]:
-        meta_tree_values = self.getMetaTreeNode()._values
-        values: Dict[str, Value] = {}
-        for name, meta_tree_value in meta_tree_values.items():
-            values[meta_tree_value._name] = self.getValue(name)
-        return values
+    def getValues(self) -> Mapping:
+        """Return a read-only view of the values by name"""
+        return NodeValues(self)
 
     def getChild(self, name):
         # type: (str) -> Node
         return getattr(self, name)
 
-    def getChildren(self):
-        # type: () -> Dict[str, Node]
-        children: Dict[str, Node] = {}
-        meta_tree_children = self.getMetaTreeNode()._children
-        for name, meta_tree_child in meta_tree_children.items():
-            children[meta_tree_child._name] = self.getChild(name)
-        return children
+    def getChildren(self) -> Mapping:
+        """Return a read-only view of the child nodes by name"""
+        return NodeChildren(self)
 
     def getDocumentation(self) -> str:
         """Get a formatted version of the documentation"""
@@ -175,15 +243,138 @@ class Node(object):
         """Return the node's name"""
         return self.getMetaTreeNode()._name
 
-    def getValueAndChildAttributes(self) -> Dict[str, int]:
-        attrs: Dict[str, int] = {}
-
-        children = self.getChildren()
-        for name in children.keys():
-            attrs[name] = Node.NODE_ATTRIBUTE
-
-        values = self.getValues()
-        for name in values.keys():
-            attrs[name] = Node.VALUE_ATTRIBUTE
-
-        return attrs
+    def getValueAndChildAttributes(self) -> Mapping:
+        """Return a read-only mapping of value and child names to their attribute type"""
+        return self._attributes
+
+
+def _compileNodeFactory(meta_tree_node):
+    # type: (MetaTreeNode) -> Callable[[], Node]
+    """Compile a meta tree node into a specialized value tree node class
+    that stores values and children in slots and return its constructor"""
+    value_names: Tuple[str, ...] = tuple(meta_tree_node._values.keys())
+    child_factories: Tuple[Tuple[str, Callable[[], Node]], ...] = tuple(
+        (name, getNodeFactory(child))
+        for name, child in sorted(meta_tree_node._children.items())
+    )
+
+    def __init__(self) -> None:
+        # Values are known to be valid and need no notification of the meta tree node
+        for set_value in value_setters:
+            set_value(self, None)
+        for set_child, factory in child_setters:
+            set_child(self, factory())
+
+    child_names: Tuple[str, ...] = tuple(name for name, _ in child_factories)
+    attributes: Dict[str, int] = dict.fromkeys(child_names, Node.NODE_ATTRIBUTE)
+    attributes.update(dict.fromkeys(value_names, Node.VALUE_ATTRIBUTE))
+
+    node_class = type(
+        "%sValueNode" % type(meta_tree_node).__name__,
+        (Node,),
+        {
+            "__slots__": value_names + child_names,
+            "__init__": __init__,
+            "_m": meta_tree_node,
+            "_value_names": value_names,
+            "_child_names": child_names,
+            "_attributes": MappingProxyType(attributes),
+        },
+    )
+
+    # The slot descriptors allow assigning without any attribute lookup
+    value_setters = tuple(node_class.__dict__[name].__set__ for name in value_names)
+    child_setters = tuple(
+        (node_class.__dict__[name].__set__, factory)
+        for name, factory in child_factories
+    )
+
+    return node_class
+
+
+def getNodeFactory(meta_tree_node):
+    # type: (MetaTreeNode) -> Callable[[], Node]
+    """Return a constructor of value tree nodes for a meta tree node.
+    The meta tree node is compiled once and the result is cached with the meta tree node."""
+    if meta_tree_node._value_node_factory is None:
+        meta_tree_node._value_node_factory = _compileNodeFactory(meta_tree_node)
+    return meta_tree_node._value_node_factory
+
+
+@contextlib.contextmanager
+def trustedAssignments() -> Iterator[None]:
+    """A context in which assignments to value tree nodes are not validated"""
+    global TRUSTED_ASSIGNMENTS
+    previous: bool = TRUSTED_ASSIGNMENTS
+    TRUSTED_ASSIGNMENTS = True
+    try:
+        yield
+    finally:
+        TRUSTED_ASSIGNMENTS = previous
+
+
+def _validateNode(node: Node) -> List[Node]:
+    """Validate the members and values of a single node and return the nodes it references"""
+    # Nodes have no instance dict, so there are no undefined members to check
+    meta_tree_node = node.getMetaTreeNode()
+    referenced: List[Node] = list(node.getChildren().values())
+    for name in meta_tree_node._values.keys():
+        value: Value = node.getValue(name)
+        raw_value = value.getValue()
+        if raw_value is None:
+            continue
+        value.validate()
+        if isinstance(raw_value, Node):
+            referenced.append(raw_value)
+        elif isinstance(raw_value, Mapping):
+            referenced += [
+                item for item in raw_value.values() if isinstance(item, Node)
+            ]
+    return referenced
+
+
+def validateTree(root: Node) -> None:
+    """Validate a value tree in a single pass, e.g. after it has been
+    generated with trusted assignments"""
+    visited: Set[int] = set()
+    stack: List[Node] = [root]
+    while stack:
+        node: Node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        stack += _validateNode(node)
+
+
+class LazyNodeDict(Mapping):
+    """A read-only mapping of keys to value tree nodes. Nodes are created on first
+    access by a callable that receives the key. The number of entries is known
+    without creating any node."""
+
+    def __init__(
+        self, keys: Iterable[Hashable], create_node: Callable[[Any], Node]
+    ) -> None:
+        self._nodes: Dict[Hashable, Optional[Node]] = dict.fromkeys(keys)
+        self._create_node: Callable[[Any], Node] = create_node
+
+    def __getitem__(self, key: Hashable) -> Node:
+        node: Optional[Node] = self._nodes[key]
+        if node is None:
+            # Nodes are set up by the same trusted code as the rest of the document
+            with trustedAssignments():
+                node = self._create_node(key)
+            self._nodes[key] = node
+        return node
+
+    def __contains__(self, key: object) -> bool:
+        # Mapping's default implementation would create the node
+        return key in self._nodes
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        return "LazyNodeDict(%d entries)" % len(self._nodes)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""Measures the time spent on generating the elf_diff document from the test archives
+with validation of every value assignment, with trusted assignments and with trusted
+assignments followed by a single validation pass (as done in debug mode).
+
+Usage: python benchmark_document_generation.py [repetitions]
+"""
+import contextlib
+import os
+import sys
+import timeit
+
+module_dir = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(module_dir)
+
+from elf_diff_test.module_search_path import (  # noqa: F401 # pylint: disable=unused-import
+    addDevelElfDiffModuleSearchPath,
+)
+from elf_diff_test.test_binaries import getTestBinary
+
+from elf_diff.settings import Settings
+from elf_diff.binary_pair import BinaryPair, BinaryPairSettings
+from elf_diff.pair_report_document import MetaDocument, Symbol, _generateValueTree
+from elf_diff.value_tree import getNodeFactory, trustedAssignments, validateTree
+
+TEST_ARCHIVES = [
+    ("x86_64", "test", "debug"),
+    ("x86_64", "test", "release"),
+    ("x86_64", "test2", "debug"),
+]
+
+
+@contextlib.contextmanager
+def silenced():
+    """Silence any output on stdout and stderr, including the progress bars"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = [os.dup(1), os.dup(2)]
+    with open(os.devnull, "w") as devnull:
+        os.dup2(devnull.fileno(), 1)
+        os.dup2(devnull.fileno(), 2)
+        try:
+            yield
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            for fd in saved_fds:
+                os.close(fd)
+
+
+VALIDATED = "validated"
+TRUSTED = "trusted"
+TRUSTED_AND_VALIDATION_PASS = "trusted + validation pass"
+MODES = [VALIDATED, TRUSTED, TRUSTED_AND_VALIDATION_PASS]
+
+
+def runInMode(mode, configure, value_trees):
+    if mode == VALIDATED:
+        configure()
+        return
+    with trustedAssignments():
+        configure()
+    if mode == TRUSTED_AND_VALIDATION_PASS:
+        for value_tree in value_trees:
+            validateTree(value_tree)
+
+
+def generateDocument(settings, binary_pair, mode):
+    """Generate the entire document"""
+    meta_document = MetaDocument()
+    value_tree = _generateValueTree(meta_document)
+    runInMode(
+        mode,
+        lambda: meta_document.configureValueTree(
+            value_tree, settings=settings, binary_pair=binary_pair
+        ),
+        [value_tree],
+    )
+
+
+def generateSymbolNodes(binary_pair, mode):
+    """Generate the value tree nodes of all old and new symbols (the hottest path of document generation)"""
+    meta_node = Symbol()
+    create_node = getNodeFactory(meta_node)
+    symbols = list(binary_pair.old_binary.symbols.values()) + list(
+        binary_pair.new_binary.symbols.values()
+    )
+    nodes = [create_node() for _ in symbols]
+
+    def configure():
+        for node, symbol in zip(nodes, symbols):
+            meta_node.configureValueTree(node, symbol=symbol)
+
+    runInMode(mode, configure, nodes)
+
+
+def printDurations(title, durations):
+    print(
+        "   %-14s %s"
+        % (
+            title,
+            "   ".join(
+                "%s: %7.3f ms" % (mode, duration * 1000)
+                for mode, duration in zip(MODES, durations)
+            ),
+        )
+    )
+
+
+def benchmarkArchive(platform, test_name, build_type, repetitions):
+    old_binary = getTestBinary(platform, test_name, build_type, "old")
+    new_binary = getTestBinary(platform, test_name, build_type, "new")
+    sys.argv = [sys.argv[0], old_binary, new_binary]
+
+    with silenced():
+        settings = Settings(os.path.join(module_dir, "..", "src", "elf_diff"))
+        binary_pair = BinaryPair(
+            settings,
+            BinaryPairSettings("", old_binary, new_binary),
+        )
+        document_durations = [
+            timeit.timeit(
+                lambda: generateDocument(settings, binary_pair, mode),
+                number=repetitions,
+            )
+            / repetitions
+            for mode in MODES
+        ]
+        symbol_durations = [
+            timeit.timeit(
+                lambda: generateSymbolNodes(binary_pair, mode),
+                number=repetitions,
+            )
+            / repetitions
+            for mode in MODES
+        ]
+
+    print(
+        "%s (%d symbols)"
+        % (
+            os.path.basename(old_binary),
+            len(binary_pair.old_binary.symbols) + len(binary_pair.new_binary.symbols),
+        )
+    )
+    printDurations("document:", document_durations)
+    printDurations("symbol nodes:", symbol_durations)
+
+
+if __name__ == "__main__":
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    for platform, test_name, build_type in TEST_ARCHIVES:
+        benchmarkArchive(platform, test_name, build_type, repetitions)
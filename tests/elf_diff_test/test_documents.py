@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2024  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from .test_binaries import getTestBinary
+
+from elf_diff.settings import Settings
+from elf_diff.pair_report_document import generateDocument, ValueTreeNode
+
+import elf_diff
+
+import os
+import sys
+import unittest
+
+
+def getTestSettings(
+    platform: str = "x86_64", test_name: str = "test", build_type: str = "debug"
+) -> Settings:
+    """Return default settings that compare the old and the new test binary"""
+    argv = sys.argv
+    sys.argv = [
+        sys.argv[0],
+        getTestBinary(platform, test_name, build_type, "old"),
+        getTestBinary(platform, test_name, build_type, "new"),
+    ]
+    try:
+        return Settings(os.path.dirname(elf_diff.__file__))
+    finally:
+        sys.argv = argv
+
+
+class TestCaseWithDocument(unittest.TestCase):
+    """A test case whose tests share a document of the x86_64 debug test binaries"""
+
+    settings: Settings
+    document: ValueTreeNode
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.settings = getTestSettings()
+        cls.document = generateDocument(cls.settings)
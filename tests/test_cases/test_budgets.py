@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff_test.test_in_subdirs import TestCaseWithSubdirs
+from elf_diff_test.elf_diff_execution import ElfDiffExecutionMixin
+
+from elf_diff.__main__ import RETURN_CODE_BUDGET_EXCEEDED
+
+import json
+
+BUDGETS_DRIVER_FILE = """\
+budgets:
+  - name: flash
+    size: code
+    max: 65536
+    max_delta: {max_delta}
+  - section: .text
+    max: 65536
+  - namespace: Test
+    max: 65536
+"""
+
+
+class TestBudgets(ElfDiffExecutionMixin, TestCaseWithSubdirs):
+    def runBudgetCheck(self, max_delta: int):
+        driver_file = "budgets.yml"
+        verdict_file = "budget_verdict.json"
+        with open(driver_file, "w") as f:
+            f.write(BUDGETS_DRIVER_FILE.format(max_delta=max_delta))
+
+        self.runSimpleTestBase(
+            args=[
+                ("driver_file", driver_file),
+                ("check_budgets", None),
+                ("budget_verdict_file", verdict_file),
+            ],
+            output_file=verdict_file,
+        )
+
+        with open(verdict_file, "r") as f:
+            return json.load(f)
+
+    def test_budgets_passed(self):
+        verdict = self.runBudgetCheck(max_delta=4096)
+
+        self.assertEqual(verdict["verdict"], "passed")
+        self.assertEqual(
+            [budget["status"] for budget in verdict["budgets"]], ["passed"] * 3
+        )
+        flash = verdict["budgets"][0]
+        self.assertEqual(flash["delta"], flash["new"] - flash["old"])
+        self.assertGreater(verdict["budgets"][2]["old"], 0)
+
+    def test_budgets_exceeded(self):
+        self.expected_return_code = RETURN_CODE_BUDGET_EXCEEDED
+        verdict = self.runBudgetCheck(max_delta=-4096)
+
+        self.assertEqual(verdict["verdict"], "exceeded")
+
+        # Evaluation stops after the stage that contains the exceeded budget
+        self.assertEqual(
+            [budget["status"] for budget in verdict["budgets"]],
+            ["exceeded", "skipped", "skipped"],
+        )
@@ -24,8 +24,13 @@ from elf_diff_test.test_binaries import getTestBinary
 from elf_diff_test.args_watcher import ElfDiffCommandLineArgsWatcher, ArgsList
 from elf_diff_test.test_binaries import TESTING_DIR
 
-from elf_diff.__main__ import RETURN_CODE_WARNINGS_OCCURRED
+from elf_diff.__main__ import (
+    RETURN_CODE_WARNINGS_OCCURRED,
+    RETURN_CODE_FILES_DIFFER,
+    RETURN_CODE_BUDGET_EXCEEDED,
+)
 
+import filecmp
 import os
 import unittest
 from typing import Optional
@@ -76,12 +81,96 @@ class TestCommandLineArgs(ElfDiffExecutionMixin, TestCaseWithSubdirs):
     def test_bin_prefix2(self):
         self.runSimpleTestArm([("bin_prefix", "___bad_prefix___")])
 
+    def writeBudgetsDriverFile(self) -> str:
+        driver_file = "budgets.yml"
+        with open(driver_file, "w") as f:
+            f.write("budgets:\n")
+            f.write("  - size: code\n")
+            f.write("    max_delta: -1\n")
+        return driver_file
+
+    def test_budget_verdict_file(self):
+        self.expected_return_code = RETURN_CODE_BUDGET_EXCEEDED
+        self.runSimpleTest(
+            [
+                ("driver_file", self.writeBudgetsDriverFile()),
+                ("budget_verdict_file", "budget_verdict.json"),
+            ]
+        )
+        self.assertTrue(os.path.isfile("budget_verdict.json"))
+
     def test_build_info(self):
         self.runSimpleTest([("build_info", "Some buildinfo string")])
 
+    def test_check(self):
+        self.expected_return_code = RETURN_CODE_FILES_DIFFER
+        self.runSimpleTestBase([("check", None)])
+
+    def test_check_budgets(self):
+        self.expected_return_code = RETURN_CODE_BUDGET_EXCEEDED
+        self.runSimpleTestBase(
+            [("driver_file", self.writeBudgetsDriverFile()), ("check_budgets", None)]
+        )
+
+    def test_check_identical_binaries(self):
+        binary_filename = getTestBinary("x86_64", "test", "debug", "old")
+        self.runSimpleTestBase(
+            [("check", None)],
+            old_binary_filename=binary_filename,
+            new_binary_filename=binary_filename,
+        )
+
+    def test_check_migrated_symbol(self):
+        # Both binaries consume the same resources, the difference is only
+        # detected when the symbols are compared
+        self.expected_return_code = RETURN_CODE_FILES_DIFFER
+        self.runSimpleTestBase(
+            [("check", None)],
+            old_binary_filename=getTestBinary(
+                "x86_64", "migration_test", "debug", "old"
+            ),
+            new_binary_filename=getTestBinary(
+                "x86_64", "migration_test", "debug", "new"
+            ),
+        )
+
+    def test_compact_html_file(self):
+        compact_html_file = "parameter_test_compact_pair_report.html"
+        self.runSimpleTestBase([("compact_html_file", compact_html_file)])
+        self.assertTrue(os.path.isfile(compact_html_file))
+
     def test_consider_equal_sized_identical(self):
         self.runSimpleTest([("consider_equal_sized_identical", None)])
 
+    def test_diff_cache_dir(self):
+        diff_cache_dir = "diff_cache"
+        html_dirs = ["uncached_multi_page_pair_report", "cached_multi_page_pair_report"]
+        for html_dir in html_dirs:
+            self.runSimpleTestBase(
+                [
+                    ("html_dir", html_dir),
+                    ("diff_cache_dir", diff_cache_dir),
+                    ("diff_cache_max_mb", "16"),
+                ]
+            )
+        self.assertTrue(os.listdir(diff_cache_dir))
+
+        # Detail pages based on cached diffs equal those of the first run
+        details_dirs = [os.path.join(html_dir, "details") for html_dir in html_dirs]
+        num_pages = 0
+        for dir_path, _, filenames in os.walk(details_dirs[0]):
+            rel_dir_path = os.path.relpath(dir_path, details_dirs[0])
+            for filename in filenames:
+                num_pages += 1
+                self.assertTrue(
+                    filecmp.cmp(
+                        os.path.join(dir_path, filename),
+                        os.path.join(details_dirs[1], rel_dir_path, filename),
+                        shallow=False,
+                    )
+                )
+        self.assertGreater(num_pages, 0)
+
     def test_driver_file(self):
 
         elf_diff_test_yaml_file = "pair_report.elf_diff_test.yml"
@@ -157,6 +246,43 @@ class TestCommandLineArgs(ElfDiffExecutionMixin, TestCaseWithSubdirs):
         # self.runSimpleTest([("html_template_dir": target_template_path})
         pass
 
+    def test_incremental(self):
+        html_dir = "incremental_multi_page_pair_report"
+        self.runSimpleTestBase([("html_dir", html_dir), ("incremental", None)])
+        self.assertTrue(
+            os.path.isfile(os.path.join(html_dir, "elf_diff_manifest.json"))
+        )
+
+        # Unchanged pages are not written again
+        stylesheet = os.path.join(html_dir, "css", "elf_diff_general.css")
+        mtime_ns = os.stat(stylesheet).st_mtime_ns - 10**9
+        os.utime(stylesheet, ns=(mtime_ns, mtime_ns))
+        self.runSimpleTestBase([("html_dir", html_dir), ("incremental", None)])
+        self.assertEqual(os.stat(stylesheet).st_mtime_ns, mtime_ns)
+
+    def test_jobs(self):
+        serial_html_dir = "serial_multi_page_pair_report"
+        parallel_html_dir = "parallel_multi_page_pair_report"
+        self.runSimpleTestBase([("html_dir", serial_html_dir)])
+        self.runSimpleTestBase([("html_dir", parallel_html_dir), ("jobs", "2")])
+
+        # Detail pages rendered by worker processes equal those rendered serially
+        serial_details_dir = os.path.join(serial_html_dir, "details")
+        parallel_details_dir = os.path.join(parallel_html_dir, "details")
+        num_pages = 0
+        for dir_path, _, filenames in os.walk(serial_details_dir):
+            rel_dir_path = os.path.relpath(dir_path, serial_details_dir)
+            for filename in filenames:
+                num_pages += 1
+                self.assertTrue(
+                    filecmp.cmp(
+                        os.path.join(dir_path, filename),
+                        os.path.join(parallel_details_dir, rel_dir_path, filename),
+                        shallow=False,
+                    )
+                )
+        self.assertGreater(num_pages, 0)
+
     def test_json_file(self):
         self.runSimpleTest([("json_file", "output.json")])
 
@@ -373,6 +499,12 @@ class TestCommandLineArgs(ElfDiffExecutionMixin, TestCaseWithSubdirs):
     def test_skip_persisting_same_size(self):
         self.runSimpleTest([("skip_persisting_same_size", None)])
 
+    def test_string_diff_backend(self):
+        self.runSimpleTest([("string_diff_backend", "myers")])
+
+    def test_instruction_diff_max_lines(self):
+        self.runSimpleTest([("instruction_diff_max_lines", "10")])
+
     def test_skip_symbol_similarities(self):
         self.runSimpleTest([("skip_symbol_similarities", None)])
 
@@ -413,9 +545,17 @@ class TestCommandLineArgs(ElfDiffExecutionMixin, TestCaseWithSubdirs):
             new_binary_filename=binary,
         )
 
+    def test_template_cache_dir(self):
+        template_cache_dir = "template_cache"
+        self.runSimpleTest([("template_cache_dir", template_cache_dir)])
+        self.assertTrue(os.listdir(template_cache_dir))
+
     def test_txt_file(self):
         self.runSimpleTest([("txt_file", "output.txt")])
 
+    def test_virtual_overview_tables(self):
+        self.runSimpleTest([("virtual_overview_tables", None)])
+
     def test_xml_file(self):
         self.runSimpleTest([("xml_file", "output.xml")])
 
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff_test.test_documents import TestCaseWithDocument
+
+from elf_diff.plugins.export.compact_html.plugin import (
+    CompactHTMLExportPairReportPlugin,
+    encodeChunk,
+    decodeChunk,
+)
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+EMBEDDED_DATA_PATTERN = re.compile(
+    r'<script type="application/octet-stream" id="([a-z_0-9]+)">([^<]*)</script>'
+)
+
+
+class TestCompactHTML(TestCaseWithDocument):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def exportEmbeddedData(self, chunk_size):
+        """Export the compact report and return its decoded embedded data"""
+        output_file = os.path.join(self.output_dir, "compact.html")
+        plugin = CompactHTMLExportPairReportPlugin(
+            self.settings,
+            {"output_file": output_file, "chunk_size": chunk_size, "quiet": "True"},
+        )
+        plugin.export(self.document)
+        with open(output_file, "r", encoding="utf-8") as f:
+            html = f.read()
+        return {
+            element_id: decodeChunk(chunk)
+            for element_id, chunk in EMBEDDED_DATA_PATTERN.findall(html)
+        }
+
+    def test_embedded_data(self):
+        embedded_data = self.exportEmbeddedData(chunk_size="1024")
+        meta_data = embedded_data.pop("elf_diff_meta_data")
+        self.assertEqual(meta_data["title"], self.document.general.page_title)
+
+        instructions = {}
+        for element_id, chunk in embedded_data.items():
+            chunk_index = int(element_id[len("elf_diff_instruction_chunk_") :])
+            for key in chunk:
+                instructions[key] = chunk_index
+        # Small chunks distribute the instructions over several chunks
+        self.assertGreater(len(embedded_data), 1)
+
+        symbol_classes = {
+            symbol_class["name"]: symbol_class["entries"]
+            for symbol_class in meta_data["symbol_classes"]
+        }
+        for symbol_class, entries in symbol_classes.items():
+            symbols_of_class = getattr(self.document.symbols, symbol_class)
+            self.assertEqual(len(entries), len(symbols_of_class))
+
+            for entry in entries:
+                if "symbol" in entry:
+                    side = "new" if symbol_class == "appeared" else "old"
+                    symbols = [(side, entry["symbol"])]
+                else:
+                    symbols = [("old", entry["old"]), ("new", entry["new"])]
+                for side, symbol in symbols:
+                    if symbol["chunk"] is not None:
+                        key = f"{side}:{symbol['id']}"
+                        self.assertEqual(instructions[key], symbol["chunk"])
+
+    def test_encoding_is_reproducible(self):
+        data = {"b": [1, 2, 3], "a": "instructions"}
+        self.assertEqual(encodeChunk(data), encodeChunk(dict(reversed(data.items()))))
+        self.assertEqual(decodeChunk(encodeChunk(data)), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2024  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff.diff_cache import DiffCache
+from elf_diff.string_diff import tagStringDiff
+
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+
+
+class TestDiffCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.num_computations = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def concat(self, old, new):
+        self.num_computations += 1
+        return old + new
+
+    def test_results_are_reused_across_runs(self):
+        for _ in range(2):
+            diff_cache = DiffCache(self.cache_dir)
+            self.assertEqual(
+                diff_cache.getOrCompute("concat", "a", "b", self.concat), "ab"
+            )
+            self.assertEqual(
+                diff_cache.getOrCompute("concat", "a", "b", self.concat), "ab"
+            )
+            diff_cache.close()
+        self.assertEqual(self.num_computations, 1)
+        self.assertEqual(diff_cache.num_hits, 2)
+
+    def test_kinds_are_distinguished(self):
+        diff_cache = DiffCache(self.cache_dir)
+        diff_cache.getOrCompute("concat/1", "a", "b", self.concat)
+        diff_cache.getOrCompute("concat/2", "a", "b", self.concat)
+        diff_cache.getOrCompute("concat/2", "b", "a", self.concat)
+        self.assertEqual(self.num_computations, 3)
+
+    def test_tagged_strings(self):
+        diff_cache = DiffCache(self.cache_dir)
+        diff_cache.getOrCompute("tag", "f(int)", "g(int)", tagStringDiff)
+        diff_cache.close()
+        source, target = DiffCache(self.cache_dir).getOrCompute(
+            "tag", "f(int)", "g(int)", tagStringDiff
+        )
+        self.assertEqual((source, target), tagStringDiff("f(int)", "g(int)"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        diff_cache = DiffCache(self.cache_dir, max_size=1000)
+        diff_cache.getOrCompute("concat", "old", "x" * 400, self.concat)
+        diff_cache.flush()
+        time.sleep(0.05)
+        diff_cache.getOrCompute("concat", "new", "x" * 400, self.concat)
+        diff_cache.flush()
+        time.sleep(0.05)
+        diff_cache.getOrCompute("concat", "newest", "x" * 400, self.concat)
+        diff_cache.close()
+
+        with sqlite3.connect(DiffCache(self.cache_dir).getDatabasePath()) as connection:
+            num_entries = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[
+                0
+            ]
+        self.assertEqual(num_entries, 2)
+
+        diff_cache = DiffCache(self.cache_dir)
+        diff_cache.getOrCompute("concat", "newest", "x" * 400, self.concat)
+        diff_cache.getOrCompute("concat", "old", "x" * 400, self.concat)
+        self.assertEqual(diff_cache.num_hits, 1)
+
+    def test_disabled_cache(self):
+        diff_cache = DiffCache()
+        diff_cache.getOrCompute("concat", "a", "b", self.concat)
+        diff_cache.getOrCompute("concat", "a", "b", self.concat)
+        diff_cache.close()
+        self.assertEqual(self.num_computations, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff_test.test_documents import TestCaseWithDocument
+
+from elf_diff.document_explorer import (
+    DictGenerator,
+    TreeTraversalOptions,
+    ValueTreeVisitor,
+    dumpTreeTxt,
+)
+
+import sys
+import unittest
+from types import FrameType
+from typing import Optional
+
+
+def callStackDepth():
+    """Return the number of frames on the Python call stack"""
+    depth = 0
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+class CallStackDepthRecorder(ValueTreeVisitor):
+    """Records the call stack depths that nodes are entered at"""
+
+    def __init__(self):
+        super().__init__()
+        self.depths = set()
+        self.num_nodes = 0
+
+    def _onDown(self, value_tree_node, **kvargs):
+        self.depths.add(callStackDepth())
+        self.num_nodes += 1
+
+
+class TestDocumentExplorer(TestCaseWithDocument):
+    def test_field_plan_is_cached(self):
+        meta_tree_node = self.document.getMetaTreeNode()
+        visitor = ValueTreeVisitor()
+        plan = visitor._fieldPlan(meta_tree_node)
+
+        self.assertIs(ValueTreeVisitor()._fieldPlan(meta_tree_node), plan)
+        names = [name for name, _, _ in plan]
+        self.assertEqual(names, sorted(names))
+        # Transient document parts are not visited by default
+        self.assertNotIn("indexes", names)
+
+        transient_visitor = ValueTreeVisitor(TreeTraversalOptions(visit_transient=True))
+        transient_plan = transient_visitor._fieldPlan(meta_tree_node)
+        self.assertIsNot(transient_plan, plan)
+        self.assertIn("indexes", [name for name, _, _ in transient_plan])
+
+    def test_values_can_be_skipped(self):
+        visitor = ValueTreeVisitor(TreeTraversalOptions(visit_values=False))
+        plan = visitor._fieldPlan(self.document.getMetaTreeNode())
+        self.assertTrue(plan)
+        self.assertFalse([name for name, is_value, _ in plan if is_value])
+
+    def test_traversal_does_not_recurse(self):
+        recorder = CallStackDepthRecorder()
+        recorder.visit(self.document)
+
+        self.assertGreater(recorder.num_nodes, 1)
+        # Nodes of any tree depth are entered at the same call stack depth
+        self.assertEqual(len(recorder.depths), 1)
+
+    def test_attributes_are_visited_in_sorted_order(self):
+        dict_generator = DictGenerator()
+        dict_generator.visit(self.document)
+
+        document_dict = dict_generator.root_dict["document"]
+        assert isinstance(document_dict, dict)
+        keys = list(document_dict.keys())
+        self.assertEqual(keys, sorted(keys))
+        self.assertNotIn("indexes", keys)
+
+    def test_dump_with_transient_dict_nodes(self):
+        # The document indexes map names to lists of ids, not to subtrees
+        tree_txt = dumpTreeTxt(
+            self.document, only_base_tree=False, visit_transient=True
+        )
+        self.assertIn("by_name", tree_txt)
+        self.assertIn("by_source_file", tree_txt)
+        self.assertNotIn("by_name", dumpTreeTxt(self.document, only_base_tree=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff_test.test_documents import TestCaseWithDocument
+
+from elf_diff.pair_report_document import SYMBOL_CLASSES
+from elf_diff.document_explorer import generateDictionary
+
+
+def entrySymbols(entry):
+    """Return the symbol nodes a symbol dict entry refers to"""
+    meta_tree_node = entry.getMetaTreeNode()
+    if "related_symbols" in meta_tree_node._children:
+        return [entry.related_symbols.old, entry.related_symbols.new]
+    if "actual" in meta_tree_node._values:
+        return [entry.actual]
+    return [entry]
+
+
+class TestDocumentIndexes(TestCaseWithDocument):
+    def test_by_name(self):
+        for symbol_class in SYMBOL_CLASSES:
+            symbols = getattr(self.document.symbols, symbol_class)
+            index = self.document.indexes.getChild(symbol_class)
+            for name, ids in index.by_name.items():
+                for id_ in ids:
+                    self.assertIn(
+                        name, [symbol.name for symbol in entrySymbols(symbols[id_])]
+                    )
+            self.assertEqual(
+                sorted({id_ for ids in index.by_name.values() for id_ in ids}),
+                sorted(symbols.keys()),
+            )
+
+        persisting_ids = self.document.indexes.persisting.by_name["persisting1(int)"]
+        self.assertEqual(len(persisting_ids), 1)
+        self.assertEqual(
+            self.document.symbols.persisting[
+                persisting_ids[0]
+            ].related_symbols.old.name,
+            "persisting1(int)",
+        )
+
+    def test_by_source_file(self):
+        old_source_files = self.document.files.input.old.source_files
+        for id_ in self.document.symbols.old.keys():
+            symbol = self.document.symbols.old[id_]
+            if symbol.source.file_id is None:
+                continue
+            path = old_source_files[symbol.source.file_id].path_wo_prefix
+            self.assertIn(id_, self.document.indexes.old.by_source_file[path])
+
+    def test_sorted_ids(self):
+        appeared = self.document.symbols.appeared
+        sizes = [
+            appeared[id_].actual.size for id_ in self.document.indexes.appeared.by_size
+        ]
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+        self.assertEqual(
+            sorted(self.document.indexes.appeared.by_size), sorted(appeared.keys())
+        )
+
+        persisting = self.document.symbols.persisting
+        deltas = [
+            persisting[id_].related_symbols.size_delta
+            for id_ in self.document.indexes.persisting.by_size_delta
+        ]
+        self.assertEqual(deltas, sorted(deltas, reverse=True))
+
+        self.assertIsNone(self.document.indexes.old.by_size_delta)
+
+        similar = self.document.symbols.similar
+        similarities = [
+            similar[id_].similarities.signature
+            for id_ in self.document.indexes.similar.by_similarity
+        ]
+        self.assertGreater(len(similarities), 0)
+        self.assertEqual(similarities, sorted(similarities, reverse=True))
+        self.assertIsNone(self.document.indexes.persisting.by_similarity)
+
+    def test_indexes_are_not_exported(self):
+        document_dict = generateDictionary(self.document)["document"]
+        assert isinstance(document_dict, dict)
+        self.assertNotIn("indexes", document_dict)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff_test.test_documents import getTestSettings
+
+from elf_diff.plugin import Plugin, ExportPairReportPlugin, getRequiredDocumentParts
+from elf_diff.pair_report_document import generateDocument
+from elf_diff.document_parts import (
+    DOCUMENT_PARTS,
+    DOCUMENT_PART_SYMBOL_CLASSES,
+    DOCUMENT_PART_SIZE_ANALYTICS,
+)
+
+import unittest
+from typing import List
+
+
+class AllPartsPlugin(ExportPairReportPlugin):
+    def export(self, document):
+        pass
+
+
+class StatisticsPlugin(ExportPairReportPlugin):
+    def export(self, document):
+        pass
+
+    def getRequiredDocumentParts(self):
+        return {DOCUMENT_PART_SIZE_ANALYTICS}
+
+
+class SymbolsPlugin(StatisticsPlugin):
+    def getRequiredDocumentParts(self):
+        return {DOCUMENT_PART_SYMBOL_CLASSES}
+
+
+class UnknownPartPlugin(StatisticsPlugin):
+    def getRequiredDocumentParts(self):
+        return {"unknown"}
+
+
+class TestDocumentParts(unittest.TestCase):
+    def setUp(self):
+        self.settings = getTestSettings()
+
+    def test_required_document_parts(self):
+        plugins: List[Plugin] = [StatisticsPlugin(self.settings, {})]
+        self.assertEqual(
+            getRequiredDocumentParts(plugins), {DOCUMENT_PART_SIZE_ANALYTICS}
+        )
+
+        plugins.append(SymbolsPlugin(self.settings, {}))
+        self.assertEqual(
+            getRequiredDocumentParts(plugins),
+            {DOCUMENT_PART_SIZE_ANALYTICS, DOCUMENT_PART_SYMBOL_CLASSES},
+        )
+
+        plugins.append(AllPartsPlugin(self.settings, {}))
+        self.assertEqual(getRequiredDocumentParts(plugins), DOCUMENT_PARTS)
+
+        with self.assertRaises(Exception):
+            getRequiredDocumentParts([UnknownPartPlugin(self.settings, {})])
+
+    def test_pruned_document(self):
+        document = generateDocument(
+            self.settings, document_parts={DOCUMENT_PART_SIZE_ANALYTICS}
+        )
+
+        self.assertEqual(len(document.symbols.old), 0)
+        self.assertEqual(len(document.files.input.new.source_files), 0)
+        self.assertIsNone(document.rollups.by_namespace)
+        self.assertFalse(document.configuration.instructions_available)
+        self.assertFalse(document.configuration.display_similar_symbols)
+
+        # Overall statistics are always available
+        self.assertGreater(document.statistics.symbols.old.count.selected, 0)
+        self.assertIsNotNone(document.statistics.size_analytics.largest_growth)
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff_test.test_documents import TestCaseWithDocument
+
+from elf_diff.plugins.export.html.plugin import HTMLExportPairReportPlugin
+from elf_diff.jinja import Configurator
+from elf_diff.render_cache import RenderCache, getSharedRenderKeys, sharedRenderCache
+import elf_diff.plugins.export.html.plugin as html_plugin
+
+import collections
+import json
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from typing import Counter
+from unittest import mock
+
+DETAILS_TEMPLATE_SUFFIX = "_symbol_details.html"
+OVERVIEW_DATA_PATTERN = re.compile(
+    r'<script type="application/json" id="([a-z]+)_symbol_overview_data">([^<]*)</script>'
+)
+
+
+class TestHTMLExport(TestCaseWithDocument):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def export(self, plugin_configuration):
+        """Export the document and return the number of renders by template file"""
+        renders: Counter[str] = collections.Counter()
+        configure_template = Configurator.configureTemplate
+
+        def countingConfigureTemplate(configurator, template_file, template_keywords):
+            renders[template_file] += 1
+            return configure_template(configurator, template_file, template_keywords)
+
+        plugin_configuration["quiet"] = "True"
+        plugin = HTMLExportPairReportPlugin(self.settings, plugin_configuration)
+        with mock.patch.object(
+            Configurator, "configureTemplate", countingConfigureTemplate
+        ):
+            plugin.export(self.document)
+        return plugin, renders
+
+    @staticmethod
+    def numDetailRenders(renders):
+        return sum(
+            count
+            for template_file, count in renders.items()
+            if template_file.endswith(DETAILS_TEMPLATE_SUFFIX)
+        )
+
+    def test_multi_page_details_are_rendered_once(self):
+        plugin, renders = self.export(
+            {"single_page": "False", "output_dir": self.output_dir}
+        )
+
+        num_detail_pages = sum(
+            len(filenames)
+            for _, _, filenames in os.walk(os.path.join(self.output_dir, "details"))
+        )
+        self.assertGreater(num_detail_pages, 0)
+        self.assertEqual(self.numDetailRenders(renders), num_detail_pages)
+
+        # The joint details string is reserved for single page reports
+        with self.assertRaises(Exception):
+            plugin.symbol_details["persisting"].getHTML()
+
+    def test_single_page_details_are_rendered_once(self):
+        _, multi_page_renders = self.export(
+            {"single_page": "False", "output_dir": self.output_dir}
+        )
+        _, single_page_renders = self.export(
+            {
+                "single_page": "True",
+                "output_file": os.path.join(self.output_dir, "report.html"),
+            }
+        )
+        self.assertEqual(
+            self.numDetailRenders(single_page_renders),
+            self.numDetailRenders(multi_page_renders),
+        )
+
+    def test_single_page_details_are_streamed(self):
+        renders: Counter[str] = collections.Counter()
+        detail_renders_before_streaming = []
+        configure_template = Configurator.configureTemplate
+        configure_template_stream = Configurator.configureTemplateStream
+
+        def countingConfigureTemplate(configurator, template_file, template_keywords):
+            renders[template_file] += 1
+            return configure_template(configurator, template_file, template_keywords)
+
+        def recordingConfigureTemplateStream(configurator, **kvargs):
+            detail_renders_before_streaming.append(self.numDetailRenders(renders))
+            configure_template_stream(configurator, **kvargs)
+
+        plugin = HTMLExportPairReportPlugin(
+            self.settings,
+            {
+                "single_page": "True",
+                "output_file": os.path.join(self.output_dir, "report.html"),
+                "quiet": "True",
+            },
+        )
+        with mock.patch.object(
+            Configurator, "configureTemplate", countingConfigureTemplate
+        ), mock.patch.object(
+            Configurator, "configureTemplateStream", recordingConfigureTemplateStream
+        ):
+            plugin.export(self.document)
+
+        # Symbol details are rendered while the report is written
+        self.assertEqual(detail_renders_before_streaming, [0])
+        self.assertGreater(self.numDetailRenders(renders), 0)
+
+    def renderKey(self, plugin_configuration):
+        """Return the render key of a plugin with the given configuration"""
+        return HTMLExportPairReportPlugin(
+            self.settings, plugin_configuration
+        ).getHTMLRenderKey()
+
+    def exportWithSharedRenderCache(self, configurations):
+        """Export the document with all configurations while they share a render cache.
+        Return the render cache, the number of difference tables rendered by the
+        first export and overall, and the renders of each export.
+        """
+        diff_tables = []
+        get_differences_as_html = html_plugin.getDifferencesAsHTML
+
+        def countingGetDifferencesAsHTML(*args):
+            diff_tables.append(args)
+            return get_differences_as_html(*args)
+
+        render_keys = [self.renderKey(c) for c in configurations]
+        renders = []
+        with sharedRenderCache(render_keys) as render_cache, mock.patch.object(
+            html_plugin, "getDifferencesAsHTML", countingGetDifferencesAsHTML
+        ):
+            for configuration in configurations:
+                renders.append(self.export(configuration)[1])
+                if len(renders) == 1:
+                    num_first_diff_tables = len(diff_tables)
+        return render_cache, num_first_diff_tables, len(diff_tables), renders
+
+    def test_shared_render_cache(self):
+        report_files = [
+            os.path.join(self.output_dir, "report1.html"),
+            os.path.join(self.output_dir, "report2.html"),
+        ]
+        (
+            render_cache,
+            num_first_diff_tables,
+            num_diff_tables,
+            renders,
+        ) = self.exportWithSharedRenderCache(
+            [
+                {"single_page": "False", "output_dir": self.output_dir},
+                {"single_page": "True", "output_file": report_files[0]},
+                {"single_page": "True", "output_file": report_files[1]},
+            ]
+        )
+
+        # Difference tables are shared by all types of reports,
+        # symbol details by reports of the same type
+        self.assertGreater(num_first_diff_tables, 0)
+        self.assertEqual(num_diff_tables, num_first_diff_tables)
+        self.assertGreater(self.numDetailRenders(renders[1]), 0)
+        self.assertEqual(self.numDetailRenders(renders[2]), 0)
+        self.assertGreater(render_cache.num_hits, 0)
+        with open(report_files[0], "r") as f1, open(report_files[1], "r") as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_unshared_render_key(self):
+        (
+            render_cache,
+            num_first_diff_tables,
+            num_diff_tables,
+            renders,
+        ) = self.exportWithSharedRenderCache(
+            [
+                {"single_page": "False", "output_dir": self.output_dir},
+                {
+                    "single_page": "True",
+                    "output_file": os.path.join(self.output_dir, "report.html"),
+                },
+            ]
+        )
+
+        # Only difference tables are stored as no other report
+        # would use the symbol details of a report
+        self.assertEqual(num_diff_tables, num_first_diff_tables)
+        self.assertEqual(
+            self.numDetailRenders(renders[1]), self.numDetailRenders(renders[0])
+        )
+        self.assertEqual(render_cache.shared_render_keys, set())
+        self.assertEqual(len(render_cache._fragments), num_diff_tables)
+
+    def test_render_cache(self):
+        self.assertEqual(getSharedRenderKeys(["a", "b", "a", "c", "c"]), {"a", "c"})
+
+        render_cache = RenderCache(shared_render_keys=["a"])
+        self.assertEqual(render_cache.getOrRender("x", lambda: "1", "a"), "1")
+        self.assertEqual(render_cache.getOrRender("x", lambda: "2", "a"), "1")
+        self.assertEqual(render_cache.getOrRender("x", lambda: "3", "b"), "3")
+        self.assertEqual(render_cache.getOrRender("x", lambda: "4", "b"), "4")
+
+        # Worker processes only use fragments stored before they were forked
+        render_cache.read_only = True
+        self.assertEqual(render_cache.getOrRender("y", lambda: "5"), "5")
+        self.assertEqual(render_cache.getOrRender("y", lambda: "6"), "6")
+        self.assertEqual(render_cache.getOrRender("x", lambda: "7", "a"), "1")
+
+    @staticmethod
+    def readOverviewData(html_file):
+        """Return the data of the virtual overview tables of an HTML file by symbol class"""
+        with open(html_file, "r", encoding="utf-8") as f:
+            html = f.read()
+        return {
+            symbol_class: json.loads(data)
+            for symbol_class, data in OVERVIEW_DATA_PATTERN.findall(html)
+        }
+
+    def test_virtual_overview_tables_single_page(self):
+        output_file = os.path.join(self.output_dir, "report.html")
+        self.export(
+            {
+                "single_page": "True",
+                "output_file": output_file,
+                "virtual_overview_tables": "True",
+            }
+        )
+        overview_data = self.readOverviewData(output_file)
+        for symbol_class in ["persisting", "appeared", "disappeared", "similar"]:
+            symbols_of_class = getattr(self.document.symbols, symbol_class)
+            if len(symbols_of_class) == 0:
+                continue
+            data = overview_data[symbol_class]
+            self.assertEqual(len(data["rows"]), len(symbols_of_class))
+            for row in data["rows"]:
+                self.assertEqual(len(row), len(data["column_types"]) + 1)
+            self.assertEqual(
+                data["details_href"], f"#{symbol_class}_symbol_details_{{id}}"
+            )
+
+        persisting = overview_data["persisting"]
+        # Rows are ordered like the rows of DOM based tables
+        self.assertEqual(
+            [row[1] for row in persisting["rows"]],
+            [
+                self.document.symbols.persisting[id_].related_symbols.old.name
+                for id_ in self.document.indexes.persisting.by_size_delta
+            ],
+        )
+
+    def test_virtual_overview_tables_multi_page(self):
+        self.export(
+            {
+                "single_page": "False",
+                "output_dir": self.output_dir,
+                "virtual_overview_tables": "True",
+            }
+        )
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.output_dir, "js", "virtual_table.js"))
+        )
+        overview_file = os.path.join(
+            self.output_dir, "persisting_symbols_overview.html"
+        )
+        data = self.readOverviewData(overview_file)["persisting"]
+        self.assertEqual(data["link_target"], "details")
+        for row in data["rows"]:
+            if row[0] is None:
+                continue
+            details_file = data["details_href"].split("#")[0].format(id=row[0])
+            self.assertTrue(os.path.isfile(os.path.join(self.output_dir, details_file)))
+
+        # Symbol rows are not part of the markup
+        with open(overview_file, "r", encoding="utf-8") as f:
+            self.assertIn("<tbody></tbody>", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
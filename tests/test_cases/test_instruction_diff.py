@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2024  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#
+from elf_diff.instruction_diff import (
+    internLines,
+    getLineOpcodes,
+    renderInstructionDiffTable,
+)
+from elf_diff.instruction_collector import SOURCE_CODE_START_TAG, SOURCE_CODE_END_TAG
+
+import unittest
+
+
+class TestInstructionDiff(unittest.TestCase):
+    def test_intern_lines(self):
+        old_ids, new_ids = internLines(["a", "b", "a"], ["b", "c"])
+        self.assertEqual(old_ids, [0, 1, 0])
+        self.assertEqual(new_ids, [1, 2])
+
+    def test_line_opcodes(self):
+        old = ["mov", "add", "ret"]
+        new = ["mov", "sub", "add", "ret"]
+        old_ids, new_ids = internLines(old, new)
+        opcodes = getLineOpcodes(old_ids, new_ids)
+        output = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            output.extend(old[i1:i2] if tag == "equal" else new[j1:j2])
+        self.assertEqual(output, new)
+        self.assertIn(("insert", 1, 1, 1, 2), opcodes)
+
+    def test_line_opcodes_limit(self):
+        old_ids, new_ids = internLines(["x", "a", "b", "y"], ["x", "c", "d", "y"])
+        self.assertEqual(
+            getLineOpcodes(old_ids, new_ids, max_lines=2),
+            [("equal", 0, 1, 0, 1), ("replace", 1, 3, 1, 3), ("equal", 3, 4, 3, 4)],
+        )
+
+    def test_render_table(self):
+        table = renderInstructionDiffTable(
+            "push r1\nmov r0, #1\n<old>", "push r1\nmov r0, #2\nbx lr\n<old>"
+        )
+        self.assertTrue(table.startswith('<table class="diff">'))
+        self.assertIn('<span class="diff_add">bx lr</span>', table)
+        self.assertIn('<span class="diff_chg">1</span>', table)
+        self.assertIn("&lt;old&gt;", table)
+
+    def test_render_table_keeps_source_tags(self):
+        old = f"{SOURCE_CODE_START_TAG}int a = 1;{SOURCE_CODE_END_TAG}"
+        new = f"{SOURCE_CODE_START_TAG}int a = 2;{SOURCE_CODE_END_TAG}"
+        table = renderInstructionDiffTable(old, new)
+        self.assertEqual(table.count(SOURCE_CODE_START_TAG), 2)
+        self.assertEqual(table.count(SOURCE_CODE_END_TAG), 2)
+
+    def test_render_table_limit(self):
+        old = "\n".join(f"old {i}" for i in range(100))
+        new = "\n".join(f"new {i}" for i in range(100))
+        table = renderInstructionDiffTable(old, new, max_lines=10)
+        self.assertEqual(table.count('<tr><td class="diff_header">'), 10)
+        self.assertIn("90 more lines not displayed (limit 10 lines)", table)
+
+    def test_render_table_collapses_unchanged_lines(self):
+        lines = [f"line {i}" for i in range(50)]
+        table = renderInstructionDiffTable(
+            "\n".join(lines), "\n".join(lines + ["ret"]), context_lines=5
+        )
+        self.assertIn("45 unchanged lines", table)
+        self.assertNotIn(">line 10<", table)
+        self.assertIn(">line 49<", table)
+
+
+if __name__ == "__main__":
+    unittest.main()
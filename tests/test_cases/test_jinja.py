@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff_test.test_documents import getTestSettings
+
+from elf_diff.settings import Settings
+from elf_diff.jinja import Configurator, getEnvironment
+
+import elf_diff
+
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Optional
+
+TEMPLATE_DIR = os.path.join(
+    os.path.dirname(elf_diff.__file__), "plugins", "export", "html", "j2"
+)
+
+
+def templateSettings(template_cache_dir: Optional[str] = None) -> Settings:
+    """Return settings that use the difflib backend and the given template cache dir"""
+    settings = getTestSettings()
+    settings.string_diff_backend = "difflib"
+    if template_cache_dir is not None:
+        settings.template_cache_dir = template_cache_dir
+    return settings
+
+
+class TestJinja(unittest.TestCase):
+    def setUp(self):
+        self.template_cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.template_cache_dir)
+
+    def test_environment_is_shared(self):
+        configurator1 = Configurator(templateSettings(), TEMPLATE_DIR)
+        configurator2 = Configurator(templateSettings(), TEMPLATE_DIR)
+
+        self.assertIs(configurator1.env, configurator2.env)
+        self.assertIs(configurator1.env, getEnvironment(TEMPLATE_DIR, "difflib"))
+        self.assertIsNot(configurator1.env, getEnvironment(TEMPLATE_DIR, "myers"))
+
+    def test_templates_are_compiled_once(self):
+        configurator = Configurator(templateSettings(), TEMPLATE_DIR)
+        template = configurator.getTemplate("persisting_symbol_details.html")
+
+        self.assertIs(
+            Configurator(templateSettings(), TEMPLATE_DIR).getTemplate(
+                "persisting_symbol_details.html"
+            ),
+            template,
+        )
+
+    def test_bytecode_cache(self):
+        configurator = Configurator(
+            templateSettings(self.template_cache_dir), TEMPLATE_DIR
+        )
+        self.assertIsNot(configurator.env, getEnvironment(TEMPLATE_DIR, "difflib"))
+
+        configurator.getTemplate("persisting_symbol_details.html")
+        self.assertTrue(os.listdir(self.template_cache_dir))
+
+    def test_streaming(self):
+        configurator = Configurator(templateSettings(), TEMPLATE_DIR)
+        template_keywords = {
+            "page_title": "Title",
+            "content_html": "<p>\u00e4</p>",
+            "index_file_directory": ".",
+        }
+        output_file = os.path.join(self.template_cache_dir, "streamed.html")
+
+        configurator.configureTemplateStream(
+            "frame_content.html", output_file, template_keywords
+        )
+
+        with open(output_file, "rb") as f:
+            self.assertEqual(
+                f.read().decode("utf-8"),
+                configurator.configureTemplate("frame_content.html", template_keywords),
+            )
+
+    def test_missing_template(self):
+        configurator = Configurator(templateSettings(), TEMPLATE_DIR)
+        with self.assertRaises(Exception):
+            configurator.getTemplate("___missing___.html")
+
+
+if __name__ == "__main__":
+    unittest.main()
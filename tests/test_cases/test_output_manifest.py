@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff.output_manifest import OutputManifest
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class TestOutputManifest(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.source_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+        shutil.rmtree(self.source_dir)
+
+    def path(self, rel_path):
+        return os.path.join(self.output_dir, rel_path)
+
+    def run_(self, contents, incremental=True):
+        """Write a set of files as a report generator run would and return the manifest"""
+        manifest = OutputManifest(self.output_dir, incremental)
+        for rel_path, content in contents.items():
+            manifest.writeFile(self.path(rel_path), content)
+        manifest.finish()
+        return manifest
+
+    def test_unchanged_files_are_not_written(self):
+        self.run_({"a.html": "a", "b.html": "b"})
+        mtime_ns = os.stat(self.path("a.html")).st_mtime_ns
+        os.utime(self.path("a.html"), ns=(mtime_ns - 10**9, mtime_ns - 10**9))
+
+        manifest = self.run_({"a.html": "a", "b.html": "B"})
+
+        self.assertEqual(manifest.num_unchanged, 1)
+        self.assertEqual(manifest.num_written, 1)
+        self.assertEqual(os.stat(self.path("a.html")).st_mtime_ns, mtime_ns - 10**9)
+        with open(self.path("b.html"), "r") as f:
+            self.assertEqual(f.read(), "B")
+
+    def test_stale_files_are_removed(self):
+        self.run_({"a.html": "a", "b.html": "b"})
+        manifest = self.run_({"a.html": "a"})
+
+        self.assertEqual(manifest.num_removed, 1)
+        self.assertFalse(os.path.exists(self.path("b.html")))
+        with open(manifest.getManifestPath(), "r") as f:
+            self.assertEqual(list(json.load(f)["files"].keys()), ["a.html"])
+
+    def test_missing_files_are_written(self):
+        self.run_({"a.html": "a"})
+        os.remove(self.path("a.html"))
+
+        manifest = self.run_({"a.html": "a"})
+
+        self.assertEqual(manifest.num_written, 1)
+        self.assertTrue(os.path.isfile(self.path("a.html")))
+
+    def test_files_outside_the_output_dir_are_never_removed(self):
+        outside_file = os.path.join(self.source_dir, "keep.txt")
+        with open(outside_file, "w") as f:
+            f.write("keep")
+        self.run_({"a.html": "a"})
+        manifest_path = os.path.join(self.output_dir, "elf_diff_manifest.json")
+        with open(manifest_path, "r") as f:
+            manifest_content = json.load(f)
+        manifest_content["files"][os.path.relpath(outside_file, self.output_dir)] = ""
+        with open(manifest_path, "w") as f:
+            json.dump(manifest_content, f)
+
+        self.run_({"a.html": "a"})
+
+        self.assertTrue(os.path.isfile(outside_file))
+
+    def test_assets(self):
+        os.makedirs(os.path.join(self.source_dir, "css"))
+        with open(os.path.join(self.source_dir, "css", "style.css"), "w") as f:
+            f.write("body {}")
+
+        for expected_num_written in [1, 0]:
+            manifest = OutputManifest(self.output_dir, incremental=True)
+            manifest.copyTree(self.source_dir, self.path("assets"))
+            manifest.finish()
+            self.assertEqual(manifest.num_written, expected_num_written)
+        self.assertTrue(
+            os.path.isfile(self.path(os.path.join("assets", "css", "style.css")))
+        )
+
+    def test_spawned_manifests(self):
+        self.run_({"a.html": "a", "b.html": "b"})
+
+        manifest = OutputManifest(self.output_dir, incremental=True)
+        spawned_manifest = manifest.spawn()
+        spawned_manifest.writeFile(self.path("a.html"), "a")
+        manifest.merge(spawned_manifest)
+        manifest.finish()
+
+        self.assertEqual(manifest.num_unchanged, 1)
+        self.assertTrue(os.path.isfile(self.path("a.html")))
+        self.assertFalse(os.path.exists(self.path("b.html")))
+
+    def test_non_incremental_mode(self):
+        self.run_({"a.html": "a", "b.html": "b"})
+
+        manifest = self.run_({"a.html": "a"}, incremental=False)
+
+        self.assertEqual(manifest.num_written, 1)
+        # Stale files are not tracked and the previous manifest is dropped
+        self.assertTrue(os.path.isfile(self.path("b.html")))
+        self.assertFalse(os.path.exists(manifest.getManifestPath()))
+
+
+if __name__ == "__main__":
+    unittest.main()
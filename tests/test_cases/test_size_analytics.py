@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#
+from elf_diff.symbol import Symbol
+from elf_diff.size_analytics import SizeAnalytics
+
+import unittest
+from typing import Dict, Tuple
+
+
+def _symbols(*symbols: Tuple[str, int, str]) -> Dict[str, Symbol]:
+    """Generate a symbol dict from name, size, type tuples"""
+    symbol_dict: Dict[str, Symbol] = {}
+    for name, size, type_ in symbols:
+        symbol = Symbol(name=name, name_mangled=name, is_demangled=False)
+        symbol.size = size
+        symbol.type_ = type_
+        symbol.init()
+        symbol_dict[name] = symbol
+    return symbol_dict
+
+
+class TestSizeAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.old_symbols = _symbols(
+            ("a", 10, "T"), ("b", 20, "T"), ("c", 30, "T"), ("d", 4, "B"), ("e", 8, "D")
+        )
+        self.new_symbols = _symbols(
+            ("a", 15, "T"), ("b", 12, "T"), ("c", 31, "T"), ("d", 8, "B"), ("f", 2, "T")
+        )
+        self.analytics = SizeAnalytics(self.old_symbols, self.new_symbols)
+
+    def test_largest_changes(self):
+        old_ids = {name: symbol.id_ for name, symbol in self.old_symbols.items()}
+        self.assertEqual(
+            self.analytics.largestGrowth(),
+            [old_ids["a"], old_ids["d"], old_ids["c"]],
+        )
+        self.assertEqual(self.analytics.largestGrowth(n=1), [old_ids["a"]])
+        self.assertEqual(self.analytics.largestShrinkage(), [old_ids["b"]])
+
+    def test_percentiles_and_histogram(self):
+        self.assertEqual(self.analytics.deltaPercentiles()[50], 2.5)
+        counts, bin_edges = self.analytics.deltaHistogram(num_bins=2)
+        self.assertEqual(sum(counts), 4)
+        self.assertEqual(bin_edges[0], -8.0)
+        self.assertEqual(bin_edges[-1], 5.0)
+
+    def test_totals(self):
+        totals_by_type = self.analytics.totalsByType()
+        self.assertEqual(sorted(totals_by_type.keys()), ["B", "D", "T"])
+        self.assertEqual(totals_by_type["T"].old, 60)
+        self.assertEqual(totals_by_type["T"].new, 60)
+        self.assertEqual(totals_by_type["D"].delta, -8)
+
+        program_memory, ram = self.analytics.totalsByMemoryClass()
+        self.assertEqual((program_memory.old, program_memory.new), (68, 60))
+        self.assertEqual((ram.old, ram.new, ram.delta), (4, 8, 4))
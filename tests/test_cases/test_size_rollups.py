@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#
+from elf_diff_test.test_binaries import getTestBinary
+from elf_diff_test.test_documents import getTestSettings
+
+from elf_diff.size_rollups import (
+    splitNamespace,
+    splitSourceDirectory,
+    RollupEntry,
+    SizeRollups,
+)
+from elf_diff.binary_pair import BinaryPair
+from elf_diff.binary_pair_settings import BinaryPairSettings
+from elf_diff.pair_report_document import generateDocument
+
+import unittest
+
+
+class TestSizeRollups(unittest.TestCase):
+    def test_split_namespace(self):
+        self.assertEqual(splitNamespace(None), [])
+        self.assertEqual(splitNamespace("a::b::C"), ["a", "b", "C"])
+        self.assertEqual(
+            splitNamespace("a::B<std::size_t, c::D<int> >::E"),
+            ["a", "B<std::size_t, c::D<int> >", "E"],
+        )
+        self.assertEqual(
+            splitNamespace("f(a::B)::C"),
+            ["f(a::B)", "C"],
+        )
+
+    def test_split_source_directory(self):
+        self.assertEqual(splitSourceDirectory("src/a/b.cpp"), ["src", "a"])
+        self.assertEqual(splitSourceDirectory("/src/a/b.cpp"), ["src", "a"])
+        self.assertEqual(splitSourceDirectory("src\\a\\b.cpp"), ["src", "a"])
+        self.assertEqual(splitSourceDirectory("b.cpp"), [])
+
+    def test_rollup_entry(self):
+        root = RollupEntry("")
+        root.getChild("a").add(old=10, new=0, appeared=0, disappeared=10)
+        root.getChild("a").add(old=0, new=4, appeared=4, disappeared=0)
+        self.assertEqual(root.getChild("a").delta, -6)
+        self.assertEqual(list(root.children.keys()), ["a"])
+
+    def test_binary_pair(self):
+        binary_pair = BinaryPair(
+            getTestSettings(),
+            BinaryPairSettings(
+                "",
+                getTestBinary("x86_64", "test", "debug", "old"),
+                getTestBinary("x86_64", "test", "debug", "new"),
+            ),
+        )
+        rollups = SizeRollups(binary_pair)
+
+        old_symbols = binary_pair.old_binary.symbols
+        new_symbols = binary_pair.new_binary.symbols
+        old_size = sum(symbol.size for symbol in old_symbols.values())
+        new_size = sum(symbol.size for symbol in new_symbols.values())
+        appeared_size = sum(
+            symbol.size
+            for name, symbol in new_symbols.items()
+            if name not in old_symbols
+        )
+        disappeared_size = sum(
+            symbol.size
+            for name, symbol in old_symbols.items()
+            if name not in new_symbols
+        )
+        for root in [rollups.by_namespace, rollups.by_source_directory]:
+            self.assertEqual(root.old, old_size)
+            self.assertEqual(root.new, new_size)
+            self.assertEqual(root.appeared, appeared_size)
+            self.assertEqual(root.disappeared, disappeared_size)
+
+        self.assertGreater(len(rollups.by_class), 0)
+        for name, class_entry in rollups.by_class.items():
+            self.assertEqual(class_entry.name, name)
+            self.assertIn(splitNamespace(name)[0], rollups.by_namespace.children)
+        self.assertLessEqual(
+            sum(class_entry.old for class_entry in rollups.by_class.values()),
+            old_size,
+        )
+
+    def test_class_rollups_share_node_class(self):
+        document = generateDocument(getTestSettings())
+        node_classes = {type(node) for node in document.rollups.by_class.values()}
+        self.assertEqual(len(node_classes), 1)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#
+from elf_diff.string_diff import (
+    tagStringDiff,
+    tagStringDiffSource,
+    tagStringDiffTarget,
+    BACKENDS,
+    HIGHLIGHT_START_TAG,
+    HIGHLIGHT_END_TAG,
+    BACKEND_DIFFLIB,
+    BACKEND_MYERS,
+    MYERS_MIN_LENGTH,
+    getStringDiffOpcodes,
+)
+from elf_diff.sequence_diff import getOpcodes, EditDistanceExceeded
+
+import random
+import timeit
+import unittest
+
+_IDENTIFIERS = [
+    "std",
+    "vector",
+    "map",
+    "unique_ptr",
+    "allocator",
+    "basic_string",
+    "char",
+    "int",
+    "size_t",
+    "detail",
+    "impl",
+    "traits",
+    "unsigned",
+    "long",
+    "pair",
+    "tuple",
+    "function",
+    "Foo",
+    "Bar",
+    "Handler",
+    "Registry",
+    "Node",
+]
+
+
+def _longType(rng, depth=0):
+    """Generate a random, possibly templated C++ type name"""
+    name = "::".join(rng.choice(_IDENTIFIERS) for _ in range(rng.randint(1, 3)))
+    if depth < 4 and rng.random() < 0.6:
+        arguments = [_longType(rng, depth + 1) for _ in range(rng.randint(1, 3))]
+        name += "<" + ", ".join(arguments) + " >"
+    if rng.random() < 0.3:
+        name += " const&"
+    return name
+
+
+def _longSignature(rng, length):
+    """Generate a C++ function signature of the given length"""
+    signature = _longType(rng) + "::" + rng.choice(_IDENTIFIERS) + "("
+    while len(signature) < length:
+        signature += _longType(rng) + ", "
+    return signature[:length] + ")"
+
+
+def _applyOpcodes(a, b, opcodes):
+    """Reconstruct b from a and opcodes"""
+    output = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            output.extend(a[i1:i2])
+        else:
+            output.extend(b[j1:j2])
+    return output
+
+
+class TestStringDiff(unittest.TestCase):
+    def test_tag_string_diff(self):
+        str1 = "Test::f(int, int)"
+        str2 = "Test1::f(int, double)"
+        for backend in BACKENDS:
+            source, target = tagStringDiff(str1, str2, backend)
+            self.assertEqual(source, tagStringDiffSource(str1, str2, backend))
+            self.assertEqual(target, tagStringDiffTarget(str1, str2, backend))
+            for tagged, original in ((source, str1), (target, str2)):
+                self.assertEqual(
+                    tagged.replace(HIGHLIGHT_START_TAG, "").replace(
+                        HIGHLIGHT_END_TAG, ""
+                    ),
+                    original,
+                )
+            self.assertTrue(
+                target.startswith(
+                    "Test" + HIGHLIGHT_START_TAG + "1" + HIGHLIGHT_END_TAG
+                )
+            )
+
+    def test_myers_opcodes(self):
+        pairs = [
+            ("", ""),
+            ("abc", ""),
+            ("", "abc"),
+            ("abcabba", "cbabac"),
+            (["push", "mov", "ret"], ["push", "add", "mov", "ret"]),
+        ]
+        for a, b in pairs:
+            opcodes = getOpcodes(a, b)
+            self.assertEqual(_applyOpcodes(a, b, opcodes), list(b))
+        # The classic example from Myers' paper has an edit distance of 5
+        opcodes = getOpcodes("abcabba", "cbabac")
+        self.assertEqual(
+            sum(i2 - i1 for tag, i1, i2, j1, j2 in opcodes if tag == "equal"), 4
+        )
+
+    def test_myers_max_edit_distance(self):
+        # The classic example from Myers' paper has an edit distance of 5
+        opcodes = getOpcodes("abcabba", "cbabac")
+        self.assertEqual(getOpcodes("abcabba", "cbabac", max_edit_distance=5), opcodes)
+        with self.assertRaises(EditDistanceExceeded):
+            getOpcodes("abcabba", "cbabac", max_edit_distance=4)
+
+    def test_myers_token_diff(self):
+        str1 = _longSignature(random.Random(0), 2000)
+        pairs = [
+            (str1, str1),
+            (str1, ""),
+            (str1, "Prefix" + str1),
+            (str1, str1[:1000] + "b" + str1[1000:]),
+            (str1, str1[:1000] + str1[1100:]),
+            # Names without common tokens differ by more edits than Myers'
+            # algorithm is used for
+            (str1, "x" * MYERS_MIN_LENGTH),
+        ]
+        for a, b in pairs:
+            opcodes = getStringDiffOpcodes(a, b, BACKEND_MYERS)
+            self.assertEqual("".join(_applyOpcodes(a, b, opcodes)), b)
+            for tag, i1, i2, j1, j2 in opcodes:
+                if tag == "equal":
+                    self.assertEqual(a[i1:i2], b[j1:j2])
+
+        # Short names are compared with difflib
+        self.assertEqual(
+            getStringDiffOpcodes("Test::f(int)", "Test1::f(long)", BACKEND_MYERS),
+            getStringDiffOpcodes("Test::f(int)", "Test1::f(long)"),
+        )
+
+    def test_myers_speedup(self):
+        rng = random.Random(0)
+        str1 = _longSignature(rng, 5000)
+        similar = list(str1)
+        for _ in range(20):
+            similar.insert(rng.randrange(len(similar)), rng.choice(_IDENTIFIERS))
+        for str2 in ("".join(similar), _longSignature(rng, 5000)):
+            durations = {
+                backend: min(
+                    timeit.repeat(
+                        lambda: getStringDiffOpcodes(str1, str2, backend),
+                        number=1,
+                        repeat=5,
+                    )
+                )
+                for backend in BACKENDS
+            }
+            self.assertLess(durations[BACKEND_MYERS], durations[BACKEND_DIFFLIB])
+
+    def test_unknown_backend(self):
+        with self.assertRaises(Exception):
+            tagStringDiff("a", "b", "unknown")
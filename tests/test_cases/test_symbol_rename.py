@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2021  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from elf_diff_test.test_in_subdirs import TestCaseWithSubdirs
+from elf_diff_test.elf_diff_execution import ElfDiffExecutionMixin
+
+import json
+
+
+class TestSymbolRename(ElfDiffExecutionMixin, TestCaseWithSubdirs):
+    def test_symbol_rename(self):
+        json_file = "rename_test.json"
+        self.runSimpleTestBase(args=[("json_file", json_file)], output_file=json_file)
+
+        with open(json_file, "r") as f:
+            document = json.load(f)["document"]
+
+        renamed_symbols = [
+            (
+                entry["renamed_symbol"]["related_symbols"]["old_symbol"]["name"],
+                entry["renamed_symbol"]["related_symbols"]["new_symbol"]["name"],
+            )
+            for entry in document["symbols"]["renamed"].values()
+        ]
+
+        # Test::f and Test1::f share size and instructions
+        self.assertIn(("Test::f(int, int)", "Test1::f(int, int)"), renamed_symbols)
+        self.assertEqual(
+            document["statistics"]["symbols"]["renamed"]["count"], len(renamed_symbols)
+        )
+
+        # Renamed symbols are not subject to fuzzy similarity detection
+        similar_old_symbol_names = [
+            entry["similar_symbols"]["related_symbols"]["old_symbol"]["name"]
+            for entry in document["symbols"]["similar"].values()
+        ]
+        for old_symbol_name, _ in renamed_symbols:
+            self.assertNotIn(old_symbol_name, similar_old_symbol_names)
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# -*- mode: python -*-
+#
+# elf_diff
+#
+# Copyright (C) 2019  Noseglasses (shinynoseglasses@gmail.com)
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from elf_diff_test.test_documents import getTestSettings
+
+from elf_diff.pair_report_document import PersistingSymbol, Symbol, generateDocument
+from elf_diff.value_tree import (
+    getNodeFactory,
+    trustedAssignments,
+    validateTree,
+    LazyNodeDict,
+)
+from elf_diff.tree_exception import TreeException
+
+from collections.abc import Mapping
+import gc
+import tracemalloc
+import unittest
+
+# Upper bounds of the bytes allocated per symbol, above the actual costs of the
+# slotted representation with CPython 3.8 to 3.11 (about 160 bytes per symbol node
+# and between 350 and 490 bytes per document symbol including its child nodes)
+SYMBOL_NODE_BYTES_BUDGET = 200
+DOCUMENT_SYMBOL_BYTES_BUDGET = 600
+
+
+def tracedBytes(function):
+    """Return the result of a function and the number of bytes it allocated and retained"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        traced_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, traced_bytes
+
+
+def exploreValues(nodes):
+    """Access all values of a list of nodes without retaining the value wrappers"""
+    for node in nodes:
+        list(node.getValues().values())
+
+
+def getDocumentSymbols(document):
+    """Return all symbol nodes of a document, nodes are created on first access"""
+    symbol_dicts = [
+        getattr(document.symbols, name)
+        for name in document.symbols.getMetaTreeNode()._values
+    ]
+    return [node for dict_ in symbol_dicts for node in dict_.values()]
+
+
+class TestValueTree(unittest.TestCase):
+    def setUp(self):
+        self.meta_node = PersistingSymbol()
+        self.meta_node._name = "persisting_symbol"
+
+    def test_node_factory_is_cached(self):
+        create_node = getNodeFactory(self.meta_node)
+        self.assertIs(getNodeFactory(self.meta_node), create_node)
+        self.assertIsNot(create_node(), create_node())
+
+    def test_node_structure(self):
+        node = getNodeFactory(self.meta_node)()
+
+        self.assertIs(node.getMetaTreeNode(), self.meta_node)
+        self.assertEqual(node.getPath(), "persisting_symbol")
+        self.assertEqual(
+            set(node.getChildren().keys()), set(self.meta_node._children.keys())
+        )
+        for value in node.getValues().values():
+            self.assertIsNone(value.getValue())
+        self.assertIsNone(node.display_info.symbol_class)
+
+    def test_assignments_are_validated(self):
+        node = getNodeFactory(self.meta_node)()
+
+        node.display_info.symbol_class = "persisting"
+        self.assertEqual(node.display_info.symbol_class, "persisting")
+
+        with self.assertRaises(TreeException):
+            node.display_info.symbol_class = 42
+        with self.assertRaises(TreeException):
+            node.undefined_member = 1
+        with self.assertRaises(Exception):
+            node.display_info.undefined_member
+
+    def test_trusted_assignments(self):
+        node = getNodeFactory(self.meta_node)()
+
+        with trustedAssignments():
+            node.display_info.symbol_class = "persisting"
+        validateTree(node)
+
+        with trustedAssignments():
+            node.display_info.symbol_class = 42
+        self.assertEqual(node.display_info.symbol_class, 42)
+        with self.assertRaises(TreeException):
+            validateTree(node)
+
+    def test_undefined_members_cannot_be_stored(self):
+        node = getNodeFactory(self.meta_node)()
+
+        # Nodes have no instance dict, not even trusted code can add members
+        with trustedAssignments():
+            with self.assertRaises(AttributeError):
+                node.display_info.undefined_member = 1
+        validateTree(node)
+
+    def test_lazy_node_dict(self):
+        create_node = getNodeFactory(self.meta_node)
+        created = []
+
+        def createNode(key):
+            created.append(key)
+            node = create_node()
+            node.display_info.symbol_class = "persisting"
+            return node
+
+        nodes = LazyNodeDict([3, 1, 2], createNode)
+
+        self.assertEqual(len(nodes), 3)
+        self.assertEqual(list(nodes.keys()), [3, 1, 2])
+        self.assertIn(1, nodes)
+        self.assertNotIn(4, nodes)
+        self.assertEqual(created, [])
+
+        self.assertIs(nodes[1], nodes[1])
+        self.assertEqual(created, [1])
+        with self.assertRaises(KeyError):
+            nodes[4]
+
+        self.assertEqual(len(list(nodes.values())), 3)
+        self.assertEqual(sorted(created), [1, 2, 3])
+
+    def test_value_and_child_views(self):
+        node = getNodeFactory(self.meta_node)()
+        node.display_info.symbol_class = "persisting"
+
+        values = node.display_info.getValues()
+        self.assertIsInstance(values, Mapping)
+        self.assertEqual(
+            list(values.keys()), list(self.meta_node._children["display_info"]._values)
+        )
+        self.assertEqual(values["symbol_class"].getValue(), "persisting")
+        self.assertNotIn("undefined_member", values)
+        with self.assertRaises(KeyError):
+            values["undefined_member"]
+
+        children = node.getChildren()
+        self.assertIs(children["display_info"], node.display_info)
+        self.assertNotIn("symbol_class", children)
+
+        # Attribute maps are shared by all nodes of a meta tree node
+        self.assertIs(
+            node.getValueAndChildAttributes(),
+            getNodeFactory(self.meta_node)().getValueAndChildAttributes(),
+        )
+
+    def test_symbol_node_byte_cost(self):
+        meta_node = Symbol()
+        meta_node._name = "symbol"
+        create_node = getNodeFactory(meta_node)
+        num_nodes = 10000
+
+        nodes, traced_bytes = tracedBytes(
+            lambda: [create_node() for _ in range(num_nodes)]
+        )
+
+        self.assertEqual(len(nodes), num_nodes)
+        self.assertLess(traced_bytes / num_nodes, SYMBOL_NODE_BYTES_BUDGET)
+
+        # Value wrappers are not retained when exploring the values
+        _, traced_bytes = tracedBytes(lambda: exploreValues(nodes))
+        self.assertLess(traced_bytes / num_nodes, 8)
+
+    def test_document_symbol_byte_cost(self):
+        settings = getTestSettings()
+        warm_up_document = generateDocument(settings)
+        document = generateDocument(settings)
+
+        # One-time costs of the first nodes, e.g. compiling node classes,
+        # depend on the Python version and are not attributed to the symbols
+        getDocumentSymbols(warm_up_document)
+
+        # Symbol nodes are created when they are first accessed
+        nodes, traced_bytes = tracedBytes(lambda: getDocumentSymbols(document))
+
+        self.assertGreater(len(nodes), 0)
+        self.assertLess(traced_bytes / len(nodes), DOCUMENT_SYMBOL_BYTES_BUDGET)